@@ -33,6 +33,9 @@ Layer Organisation (example for 5-unit interval, index every 5):
 
 Requires: Rhino 7+, RhinoCommon (included), rhinoscriptsyntax (included)
 Optional: pye57 (pip install pye57) for native E57 reading
+          numpy (pip install numpy, Rhino 8 CPython) for vectorised parsing
+          scipy (pip install scipy) for nearest-neighbour grid gap filling
+          numba (pip install numba) for a compiled gap fill without scipy
 Author:   Generated for production use
 """
 
@@ -41,16 +44,23 @@ Author:   Generated for production use
 # ---------------------------------------------------------------------------
 import os
 import csv
+import json
 import math
+import itertools
+import re
 import time
 import struct
 import tempfile
+from collections import defaultdict
 
 import Rhino
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
+import System
 import System.Drawing as sd
+from System.Runtime.InteropServices import GCHandle, GCHandleType
+from System.Threading.Tasks import Parallel
 
 # ---------------------------------------------------------------------------
 # Optional E57 library detection
@@ -81,6 +91,53 @@ if not _PYE57_AVAILABLE:
     except ImportError:
         pass
 
+# ---------------------------------------------------------------------------
+# Optional NumPy detection
+# ---------------------------------------------------------------------------
+# NumPy is available under Rhino 8's CPython 3 runtime (pip install numpy)
+# but not under Rhino 7's IronPython 2.7.  When present, the point cloud is
+# parsed and processed as an (N, 3) float64 array in C; otherwise every
+# stage falls back to the pure-Python list-of-tuples implementation.
+# ---------------------------------------------------------------------------
+_NUMPY_AVAILABLE = False
+np = None
+
+try:
+    import numpy as np
+    import ctypes   # bulk copies from NumPy buffers into .NET arrays
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+# SciPy (optional, CPython only) provides an exact nearest-neighbour gap
+# fill for the height-field fallback grid and the KD-tree behind the
+# neighbour-distance outlier filter.
+_SCIPY_AVAILABLE = False
+_distance_transform_edt = None
+_cKDTree = None
+
+if _NUMPY_AVAILABLE:
+    try:
+        from scipy.ndimage import distance_transform_edt \
+            as _distance_transform_edt
+        from scipy.spatial import cKDTree as _cKDTree
+        _SCIPY_AVAILABLE = True
+    except ImportError:
+        pass
+
+# Numba (optional, CPython only) JIT-compiles the neighbour-averaging gap
+# fill used when SciPy is missing.  prange degrades to range without it.
+_NUMBA_AVAILABLE = False
+_njit  = None
+_prange = range
+
+if _NUMPY_AVAILABLE:
+    try:
+        from numba import njit as _njit, prange as _prange
+        _NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
 
 # ===========================================================================
 # CONSTANTS  –  edit these to change default behaviour
@@ -102,9 +159,50 @@ SURFACE_V_DEGREE = 3
 # Maximum points to use for surface fitting (sparse large clouds for speed)
 MAX_SURFACE_POINTS = 40000
 
+# Points shown in the Topo_PointCloud preview
+DISPLAY_POINT_COUNT = 5000
+
+# Contour all levels with one native CreateContourCurves range call rather
+# than one call per elevation.  Preferred for Brep surfaces, whose surface
+# preprocessing is then shared by every slice.  Set False to disable.
+CONTOUR_BATCH = True
+
+# Contour the levels concurrently on the .NET thread pool (one task per
+# elevation).  Preferred for meshes; set False to contour on the script
+# thread only.
+CONTOUR_PARALLEL = True
+
+# Minimum seconds between progress-bar updates printed to the console
+PROGRESS_MIN_INTERVAL = 0.25
+
 # Outlier filtering: discard points beyond N standard deviations in Z
 OUTLIER_SIGMA = 3.5
 
+# Statistical outlier removal (NumPy + SciPy only): discard points whose
+# mean distance to their K nearest neighbours is more than N standard
+# deviations above that mean over the cloud.  Runs on the thinned surface
+# sample when outlier filtering is ticked.  0 disables this stage; try 8
+# for scans with stray returns (birds, multipath).
+OUTLIER_NEIGHBOURS = 0
+OUTLIER_NEIGHBOUR_SIGMA = 3.0
+
+# Element type for site-local point arrays fed to surface fitting (NumPy
+# only), whether or not an origin shift was needed.  float32 keeps ~0.5 mm
+# resolution over a 5 km site; use "float64" for larger extents.
+LOCAL_POINT_DTYPE = "float32"
+
+# Lines read from the top of a CSV to detect its delimiter and header row
+CSV_SNIFF_LINES = 32
+
+# Read buffer for streaming CSV text (bytes); large buffers amortise the
+# per-read system call over many rows
+CSV_READ_BUFFER = 4 * 1024 * 1024
+
+# Cache parsed CSV clouds beside the source as <file>.topo.npy (NumPy only).
+# The cache is reused while the source file's size and mtime are unchanged.
+CSV_CACHE_ENABLED = True
+CSV_CACHE_SUFFIX  = ".topo"
+
 # Colour ramp for index contours (low → high elevation)
 # Each entry: (normalised_value_0_to_1, R, G, B)
 INDEX_COLOUR_RAMP = [
@@ -120,14 +218,22 @@ INDEX_COLOUR_RAMP = [
 # UTILITY HELPERS
 # ===========================================================================
 
+# Fixed layer colours, allocated once rather than per layer request
+_POINT_LAYER_COLOUR   = sd.Color.FromArgb(180, 180, 180)
+_SURFACE_LAYER_COLOUR = sd.Color.FromArgb(200, 220, 240)
+_REGULAR_LAYER_COLOUR = sd.Color.FromArgb(100, 100, 100)
+
+
 def _lerp(a, b, t):
     """Linear interpolation between a and b by factor t."""
     return a + (b - a) * t
 
 
-def _colour_from_ramp(t, ramp=INDEX_COLOUR_RAMP):
+def _colour_from_ramp_slow(t, ramp=INDEX_COLOUR_RAMP):
     """
-    Sample a colour from a multi-stop ramp.
+    Sample a colour from a multi-stop ramp by exact interpolation.
+
+    Used to build _RAMP_LUT and for ramps other than INDEX_COLOUR_RAMP.
 
     Parameters
     ----------
@@ -153,13 +259,154 @@ def _colour_from_ramp(t, ramp=INDEX_COLOUR_RAMP):
     return sd.Color.FromArgb(*ramp[-1][1:])
 
 
+# Pre-sampled INDEX_COLOUR_RAMP so per-contour colour lookups are a single
+# list index instead of a stop search, three lerps and a new Color.
+_RAMP_LUT_SIZE = 1024
+_RAMP_LUT = [_colour_from_ramp_slow(i / float(_RAMP_LUT_SIZE - 1))
+             for i in range(_RAMP_LUT_SIZE)]
+
+# Colours sampled from any other ramp, keyed on (ramp stops, LUT bucket)
+_ramp_cache = {}
+
+
+def _colour_from_ramp(t, ramp=INDEX_COLOUR_RAMP):
+    """
+    Sample a colour from a multi-stop ramp.
+
+    `t` is quantised to the nearest of 1024 samples (indistinguishable at
+    8 bits per channel).  The default ramp is served from the precomputed
+    _RAMP_LUT; samples of any other ramp are interpolated once by
+    _colour_from_ramp_slow and memoised in _ramp_cache.
+
+    Parameters
+    ----------
+    t    : float  normalised elevation value [0, 1]
+    ramp : list   of (t, R, G, B) tuples, sorted by t
+
+    Returns
+    -------
+    System.Drawing.Color
+    """
+    t = max(0.0, min(1.0, t))
+    bucket = int(t * (_RAMP_LUT_SIZE - 1) + 0.5)
+    if ramp is INDEX_COLOUR_RAMP:
+        return _RAMP_LUT[bucket]
+
+    key = (tuple(ramp), bucket)
+    colour = _ramp_cache.get(key)
+    if colour is None:
+        colour = _colour_from_ramp_slow(
+            bucket / float(_RAMP_LUT_SIZE - 1), ramp)
+        _ramp_cache[key] = colour
+    return colour
+
+
+def _as_point_array(points):
+    """
+    Return `points` in the pipeline's native point container.
+
+    With NumPy available this is a contiguous (N, 3) float64 ndarray
+    (a no-op for arrays that already qualify); without it the input is
+    returned unchanged as a list of (x, y, z) tuples.
+    """
+    if not _NUMPY_AVAILABLE:
+        return points
+    return np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+
+
+def _to_local_precision(points):
+    """
+    Store site-local points as LOCAL_POINT_DTYPE (float32 by default).
+
+    Once any large UTM offset has been subtracted, site-scale coordinates
+    need far fewer significant digits than float64 carries, so halving
+    the element size halves the memory traffic of every later pass.  The
+    origin itself is kept in float64 so denormalisation stays exact.
+    List input is returned unchanged when NumPy is unavailable.
+    """
+    if not _NUMPY_AVAILABLE:
+        return points
+    return np.ascontiguousarray(
+        points, dtype=LOCAL_POINT_DTYPE).reshape(-1, 3)
+
+
+def _is_point_array(points):
+    """True when `points` is an ndarray that the NumPy fast paths accept."""
+    return _NUMPY_AVAILABLE and isinstance(points, np.ndarray)
+
+
+def _to_point3d_array(points):
+    """
+    Convert an (N, 3) array or list of (x, y, z) into a typed .NET
+    Point3d[] built in one pass.  This is the only place point data
+    crosses into RhinoCommon types.
+
+    Passing a typed array lets RhinoCommon methods taking
+    IEnumerable<Point3d> consume it directly, instead of the interpreter
+    re-marshalling a Python list element by element on every call.
+    """
+    if _is_point_array(points):
+        copied = _point3d_array_from_buffer(points)
+        if copied is not None:
+            return copied
+        points = points.tolist()
+    return System.Array[rg.Point3d](
+        rg.Point3d(x, y, z) for (x, y, z) in points)
+
+
+def _point3d_array_from_buffer(pts):
+    """
+    Copy an (N, 3) ndarray into a new Point3d[] with a single memmove.
+
+    Point3d is a sequential struct of three doubles, so a C-contiguous
+    float64 (N, 3) array has exactly the memory layout of Point3d[N].  The
+    managed array is pinned for the duration of the copy.
+
+    Returns
+    -------
+    Point3d[] or None if the copy could not be performed (caller falls
+    back to element-wise construction)
+    """
+    pts = np.ascontiguousarray(pts, dtype=np.float64)
+    try:
+        arr = System.Array.CreateInstance(rg.Point3d, pts.shape[0])
+        if pts.shape[0] == 0:
+            return arr
+        handle = GCHandle.Alloc(arr, GCHandleType.Pinned)
+        try:
+            dest = handle.AddrOfPinnedObject().ToInt64()
+            ctypes.memmove(dest, pts.ctypes.data, pts.nbytes)
+        finally:
+            handle.Free()
+    except Exception:
+        return None
+    return arr
+
+
+# Cheap pre-checks used to reject non-numeric CSV tokens without paying
+# for a raised ValueError from float().
+_NUMERIC_LEAD_CHARS = frozenset("+-.0123456789")
+_NUMBER_PATTERN     = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
+
 def _print(msg):
     """Print with a consistent prefix so messages are easy to spot."""
     print("[TopoMap] {}".format(msg))
 
 
 def _progress(label, current, total):
-    """Print a simple progress indicator."""
+    """
+    Print a simple progress indicator.
+
+    Updates are throttled to one per PROGRESS_MIN_INTERVAL seconds (the
+    final update is always shown), since each print to Rhino's console
+    repaints the UI.
+    """
+    now = time.time()
+    if current < total and now - _progress.last_print < PROGRESS_MIN_INTERVAL:
+        return
+    _progress.last_print = now
+
     pct = int(100 * current / total) if total else 0
     bar_len = 30
     filled = int(bar_len * current / total) if total else 0
@@ -168,6 +415,9 @@ def _progress(label, current, total):
         label, bar, pct, current, total))
 
 
+_progress.last_print = 0.0
+
+
 # ===========================================================================
 # 1. POINT CLOUD LOADING
 # ===========================================================================
@@ -189,6 +439,11 @@ def detect_delimiter(filepath, sample_bytes=4096):
     """
     with open(filepath, "r") as fh:
         sample = fh.read(sample_bytes)
+    return _delimiter_from_sample(sample)
+
+
+def _delimiter_from_sample(sample):
+    """Delimiter detection for detect_delimiter() on already-read text."""
     try:
         dialect = csv.Sniffer().sniff(sample, delimiters=",\t ;")
         return dialect.delimiter
@@ -202,8 +457,8 @@ def has_header(filepath, delimiter):
     """
     Detect whether the first row of a CSV is a text header.
 
-    Returns True if the first non-empty, non-comment row cannot be parsed
-    as three floats.
+    Returns True if the first non-empty, non-comment row has at least
+    three fields but they are not all numbers.
 
     Parameters
     ----------
@@ -215,23 +470,49 @@ def has_header(filepath, delimiter):
     bool
     """
     with open(filepath, "r") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split(delimiter)
-            if len(parts) < 3:
-                return False
-            try:
-                float(parts[0])
-                float(parts[1])
-                float(parts[2])
-                return False
-            except ValueError:
-                return True
+        return _header_from_lines(fh, delimiter)
+
+
+def _header_from_lines(lines, delimiter):
+    """Header detection for has_header() over an iterable of text lines."""
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.count(delimiter) < 2:
+            return False
+        return not _xyz_row_regex(delimiter).match(line)
     return False
 
 
+def _sniff_csv(filepath, sample_lines=CSV_SNIFF_LINES):
+    """
+    Detect delimiter and header row from one bounded read of the file.
+
+    Equivalent to calling detect_delimiter() and has_header() in turn,
+    but opens the file once and reads at most `sample_lines` lines.
+
+    Returns
+    -------
+    tuple (delimiter, skip_header)
+    """
+    with open(filepath, "r") as fh:
+        lines = list(itertools.islice(fh, sample_lines))
+    delimiter = _delimiter_from_sample("".join(lines))
+    return delimiter, _header_from_lines(lines, delimiter)
+
+
+def _xyz_row_regex(delimiter):
+    """
+    Compile a regex matching a row whose first three `delimiter`-separated
+    fields are numbers, so a row can be classified in one match instead
+    of split() plus three float() calls inside try/except.
+    """
+    sep = r"\s+" if delimiter == " " else r"\s*" + re.escape(delimiter)
+    field = r"\s*" + _NUMBER_PATTERN + r"\s*"
+    return re.compile(field + sep + field + sep + field + r"(?:$|" + sep + ")")
+
+
 def _detect_file_format(filepath):
     """
     Determine whether a file is an E57 point cloud or a delimited text file
@@ -273,7 +554,7 @@ def _detect_file_format(filepath):
 
 def _load_pointcloud_csv(filepath):
     """
-    Parse a delimited text/CSV file and return a list of (x, y, z) tuples.
+    Parse a delimited text/CSV file and return its XYZ points.
 
     Handles:
     - Comma, tab, space, and semicolon delimiters (auto-detected)
@@ -282,13 +563,18 @@ def _load_pointcloud_csv(filepath):
     - Extra columns beyond the first three (silently ignored)
     - Rows with missing or non-numeric values (warned and skipped)
 
+    When NumPy is available the file is parsed in a single vectorised
+    call (see _parse_csv_numpy) and an (N, 3) float64 array is returned.
+    Files NumPy rejects (ragged or non-numeric rows) fall through to the
+    tolerant line-by-line parser below.
+
     Parameters
     ----------
     filepath : str  absolute path to the CSV/TXT file
 
     Returns
     -------
-    list of (float, float, float)  raw XYZ points
+    numpy.ndarray (N, 3)  or  list of (float, float, float)  raw XYZ points
 
     Raises
     ------
@@ -298,17 +584,31 @@ def _load_pointcloud_csv(filepath):
     if not os.path.isfile(filepath):
         raise IOError("File not found: {}".format(filepath))
 
-    delimiter = detect_delimiter(filepath)
-    skip_header = has_header(filepath, delimiter)
+    delimiter, skip_header = _sniff_csv(filepath)
 
     _print("Delimiter detected: {!r}  |  Header row: {}".format(
         delimiter, skip_header))
 
+    if _NUMPY_AVAILABLE:
+        points = _read_csv_cache(filepath, delimiter, skip_header)
+        if points is None:
+            points = _parse_csv_numpy(filepath, delimiter, skip_header)
+            if points is not None and len(points) >= 3:
+                _write_csv_cache(filepath, points, delimiter, skip_header)
+        if points is not None:
+            if len(points) < 3:
+                raise ValueError(
+                    "Too few valid points loaded ({}).  "
+                    "Check file format and delimiter.".format(len(points)))
+            _print("Loaded {:,} points from '{}'.".format(
+                len(points), os.path.basename(filepath)))
+            return points
+
     points = []
     bad_rows = 0
     row_index = 0
 
-    with open(filepath, "r") as fh:
+    with open(filepath, "r", CSV_READ_BUFFER) as fh:
         for raw_line in fh:
             line = raw_line.strip()
 
@@ -324,7 +624,7 @@ def _load_pointcloud_csv(filepath):
             row_index += 1
             parts = line.split(delimiter)
 
-            if len(parts) < 3:
+            if len(parts) < 3 or parts[0][:1] not in _NUMERIC_LEAD_CHARS:
                 bad_rows += 1
                 continue
 
@@ -346,14 +646,134 @@ def _load_pointcloud_csv(filepath):
             "Too few valid points loaded ({}).  "
             "Check file format and delimiter.".format(len(points)))
 
+    points = _as_point_array(points)
+    if _is_point_array(points):
+        _write_csv_cache(filepath, points, delimiter, skip_header)
+
     _print("Loaded {:,} points from '{}'.".format(
         len(points), os.path.basename(filepath)))
     return points
 
 
+def _csv_cache_paths(filepath):
+    """Return (array_path, meta_path) of the binary cache for `filepath`."""
+    return filepath + CSV_CACHE_SUFFIX + ".npy", \
+        filepath + CSV_CACHE_SUFFIX + ".json"
+
+
+def _read_csv_cache(filepath, delimiter, skip_header):
+    """
+    Return the cached (N, 3) array for `filepath`, or None when caching is
+    disabled, no cache exists, or the cache is stale.
+
+    A cache is valid only if the source file's size and modification time
+    match the values recorded when it was written, and the delimiter and
+    header detection still agree with the cached parse.
+    """
+    if not CSV_CACHE_ENABLED:
+        return None
+
+    array_path, meta_path = _csv_cache_paths(filepath)
+    if not (os.path.isfile(array_path) and os.path.isfile(meta_path)):
+        return None
+
+    try:
+        with open(meta_path, "r") as fh:
+            meta = json.load(fh)
+        source = os.stat(filepath)
+        if (meta.get("size") != source.st_size
+                or meta.get("mtime") != source.st_mtime
+                or meta.get("delimiter") != delimiter
+                or meta.get("skip_header") != skip_header):
+            return None
+        pts = np.load(array_path)
+    except (IOError, OSError, ValueError) as ex:
+        _print("Ignoring unreadable point cache: {}".format(ex))
+        return None
+
+    if pts.ndim != 2 or pts.shape[1] != 3:
+        return None
+
+    _print("Using cached parse '{}'.".format(os.path.basename(array_path)))
+    return pts
+
+
+def _write_csv_cache(filepath, points, delimiter, skip_header):
+    """
+    Save a parsed (N, 3) array beside `filepath` so the next run on the
+    same, unchanged file can skip text parsing.  Failures (e.g. a
+    read-only folder) are reported and otherwise ignored.
+    """
+    if not CSV_CACHE_ENABLED:
+        return
+
+    array_path, meta_path = _csv_cache_paths(filepath)
+    try:
+        source = os.stat(filepath)
+        np.save(array_path, points)
+        with open(meta_path, "w") as fh:
+            json.dump({
+                "size":        source.st_size,
+                "mtime":       source.st_mtime,
+                "delimiter":   delimiter,
+                "skip_header": skip_header,
+            }, fh)
+    except (IOError, OSError) as ex:
+        _print("Could not write point cache: {}".format(ex))
+
+
+def _parse_csv_numpy(filepath, delimiter, skip_header):
+    """
+    Parse the first three columns of a delimited text file with
+    numpy.loadtxt, which tokenises and converts in C rather than calling
+    str.split and float() once per row.
+
+    Blank and '#' comment lines are skipped by loadtxt itself.  When a
+    header is present, every raw line up to and including it is skipped.
+
+    Parameters
+    ----------
+    filepath    : str
+    delimiter   : str   as returned by detect_delimiter()
+    skip_header : bool  as returned by has_header()
+
+    Returns
+    -------
+    numpy.ndarray (N, 3) float64, or None if the file contains rows
+    loadtxt cannot parse (caller falls back to the tolerant parser)
+    """
+    skiprows = 0
+    if skip_header:
+        with open(filepath, "r") as fh:
+            for raw_line in fh:
+                skiprows += 1
+                line = raw_line.strip()
+                if line and not line.startswith("#"):
+                    break
+
+    # loadtxt treats None as "any run of whitespace", which matches
+    # space-aligned XYZ exports better than a literal single space.
+    np_delimiter = None if delimiter == " " else delimiter
+
+    try:
+        with open(filepath, "r", CSV_READ_BUFFER) as fh:
+            return np.loadtxt(
+                fh,
+                delimiter=np_delimiter,
+                skiprows=skiprows,
+                usecols=(0, 1, 2),
+                comments="#",
+                dtype=np.float64,
+                ndmin=2)
+    except (ValueError, IndexError):
+        _print("Fast parser rejected the file; "
+               "falling back to row-by-row parsing.")
+        return None
+
+
 def _load_pointcloud_e57(filepath):
     """
-    Read an E57 file (ISO 14694) and return a list of (x, y, z) tuples.
+    Read an E57 file (ISO 14694) and return its XYZ points.
 
     Loading strategy (in priority order):
         1. pye57 / pyE57 native Python binding  -- full feature support,
@@ -375,7 +795,8 @@ def _load_pointcloud_e57(filepath):
 
     Returns
     -------
-    list of (float, float, float)  XYZ points in file coordinate system
+    numpy.ndarray (N, 3)  or  list of (float, float, float)
+        XYZ points in file coordinate system
 
     Raises
     ------
@@ -427,7 +848,7 @@ def _load_e57_via_pye57(filepath):
     Load an E57 file using the pye57 / pyE57 Python binding.
 
     Iterates over all scan positions in the file and accumulates XYZ
-    coordinates into a single flat list.  Logs per-scan statistics.
+    coordinates into a single point set.  Logs per-scan statistics.
 
     Parameters
     ----------
@@ -435,7 +856,7 @@ def _load_e57_via_pye57(filepath):
 
     Returns
     -------
-    list of (float, float, float)
+    numpy.ndarray (N, 3)  or  list of (float, float, float)
 
     Raises
     ------
@@ -461,7 +882,12 @@ def _load_e57_via_pye57(filepath):
             "E57 file '{}' contains no scan positions."
             .format(os.path.basename(filepath)))
 
-    all_points = []
+    # With NumPy and per-scan point counts from the headers, valid points
+    # are written straight into one preallocated (N, 3) buffer so peak
+    # memory is the output plus a single scan, not every scan twice.
+    out = _allocate_e57_buffer(e57_file, scan_count)
+    offset = 0
+    scan_chunks = []
 
     for scan_idx in range(scan_count):
         _print("  Reading scan {} / {}...".format(scan_idx + 1, scan_count))
@@ -509,36 +935,43 @@ def _load_e57_via_pye57(filepath):
             "yes" if has_colour    else "no"))
 
         # Collect valid (non-NaN, non-Inf) points
-        scan_pts = []
-        bad = 0
-        for i in range(n):
-            try:
-                x = float(xs[i])
-                y = float(ys[i])
-                z = float(zs[i])
-                # Guard against NaN / Inf from invalid scan returns
-                if (x != x or y != y or z != z or          # NaN check
-                        x > 1e15 or y > 1e15 or z > 1e15 or  # Inf-like
-                        x < -1e15 or y < -1e15 or z < -1e15):
-                    bad += 1
-                    continue
-                scan_pts.append((x, y, z))
-            except (ValueError, TypeError):
-                bad += 1
+        if out is not None and offset + n <= len(out):
+            valid_count, bad = _store_e57_scan(out, offset, xs, ys, zs)
+            offset += valid_count
+        else:
+            scan_pts, bad = _valid_e57_points(xs, ys, zs)
+            valid_count = len(scan_pts)
+            if valid_count:
+                scan_chunks.append(scan_pts)
+
+        # Release this scan's arrays before the next one is read
+        raw_data = xs = ys = zs = None
 
         if bad:
             _print("  Scan {}: {:,} invalid returns discarded.".format(
                 scan_idx, bad))
 
-        all_points.extend(scan_pts)
         _print("  Scan {} loaded: {:,} valid points.".format(
-            scan_idx, len(scan_pts)))
+            scan_idx, valid_count))
+
+    if _NUMPY_AVAILABLE:
+        if out is not None:
+            scan_chunks.insert(0, out[:offset])
+        if len(scan_chunks) == 1:
+            all_points = scan_chunks[0]
+        elif scan_chunks:
+            all_points = np.concatenate(scan_chunks, axis=0)
+        else:
+            all_points = []
+    else:
+        all_points = [p for chunk in scan_chunks for p in chunk]
 
-    if not all_points:
+    if not len(all_points):
         raise ValueError(
             "E57 file '{}' yielded no valid XYZ points across {} scan(s)."
             .format(os.path.basename(filepath), scan_count))
 
+    all_points = _as_point_array(all_points)
     _print("E57 total: {:,} points loaded from {} scan(s).".format(
         len(all_points), scan_count))
 
@@ -571,6 +1004,91 @@ def _resolve_e57_array(data_dict, candidate_keys):
     return None
 
 
+def _allocate_e57_buffer(e57_file, scan_count):
+    """
+    Preallocate an (N, 3) float64 array large enough for every scan in
+    `e57_file`, using the point counts in the scan headers.
+
+    Returns None when NumPy is unavailable or a header cannot be read;
+    the caller then collects scans separately and concatenates at the end.
+    """
+    if not _NUMPY_AVAILABLE:
+        return None
+    try:
+        total = sum(int(e57_file.get_header(i).point_count)
+                    for i in range(scan_count))
+    except Exception:
+        return None
+    return np.empty((total, 3), dtype=np.float64)
+
+
+def _store_e57_scan(out, offset, xs, ys, zs):
+    """
+    Write one scan's coordinate arrays into `out` starting at row `offset`,
+    then compact the block in place so only valid returns remain
+    (see _valid_e57_points for the validity rule).
+
+    Returns
+    -------
+    tuple (valid_count, bad_count)
+    """
+    n = len(xs)
+    block = out[offset:offset + n]
+    block[:, 0] = xs
+    block[:, 1] = ys
+    block[:, 2] = zs
+
+    valid = np.isfinite(block).all(axis=1)
+    valid &= (np.abs(block) <= 1e15).all(axis=1)
+    valid_count = int(np.count_nonzero(valid))
+    if valid_count < n:
+        block[:valid_count] = block[valid]
+    return valid_count, n - valid_count
+
+
+def _valid_e57_points(xs, ys, zs):
+    """
+    Combine per-axis E57 coordinate arrays into points, discarding invalid
+    scanner returns (NaN, Inf, or magnitudes beyond 1e15).
+
+    With NumPy the arrays are stacked column-wise and filtered with a
+    single boolean mask; otherwise each index is checked in Python.
+
+    Parameters
+    ----------
+    xs, ys, zs : array-like  equal-length coordinate arrays from pye57
+
+    Returns
+    -------
+    tuple (points, bad_count)
+        points    : (M, 3) array or list of (x, y, z)
+        bad_count : int  number of discarded returns
+    """
+    if _NUMPY_AVAILABLE:
+        pts = np.column_stack((xs, ys, zs)).astype(np.float64, copy=False)
+        valid = np.isfinite(pts).all(axis=1)
+        valid &= (np.abs(pts) <= 1e15).all(axis=1)
+        return pts[valid], int(pts.shape[0] - np.count_nonzero(valid))
+
+    scan_pts = []
+    bad = 0
+    for i in range(len(xs)):
+        try:
+            x = float(xs[i])
+            y = float(ys[i])
+            z = float(zs[i])
+            # Guard against NaN / Inf from invalid scan returns
+            if (x != x or y != y or z != z or          # NaN check
+                    x > 1e15 or y > 1e15 or z > 1e15 or  # Inf-like
+                    x < -1e15 or y < -1e15 or z < -1e15):
+                bad += 1
+                continue
+            scan_pts.append((x, y, z))
+        except (ValueError, TypeError):
+            bad += 1
+    return scan_pts, bad
+
+
 def _validate_e57_coordinate_ranges(points, filepath):
     """
     Validate that E57 XYZ coordinates are within a physically plausible range
@@ -583,28 +1101,35 @@ def _validate_e57_coordinate_ranges(points, filepath):
 
     Parameters
     ----------
-    points   : list of (x, y, z)
+    points   : (N, 3) array or list of (x, y, z)
     filepath : str  used for diagnostic messages only
     """
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    zs = [p[2] for p in points]
+    if _is_point_array(points):
+        (x_lo, y_lo, z_lo) = points.min(axis=0).tolist()
+        (x_hi, y_hi, z_hi) = points.max(axis=0).tolist()
+    else:
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        zs = [p[2] for p in points]
+        x_lo, x_hi = min(xs), max(xs)
+        y_lo, y_hi = min(ys), max(ys)
+        z_lo, z_hi = min(zs), max(zs)
 
-    x_range = max(xs) - min(xs)
-    y_range = max(ys) - min(ys)
-    z_range = max(zs) - min(zs)
+    x_range = x_hi - x_lo
+    y_range = y_hi - y_lo
+    z_range = z_hi - z_lo
 
     _print("E57 coordinate extents:")
     _print("  X: {:.3f}  to  {:.3f}  (span {:.3f})".format(
-        min(xs), max(xs), x_range))
+        x_lo, x_hi, x_range))
     _print("  Y: {:.3f}  to  {:.3f}  (span {:.3f})".format(
-        min(ys), max(ys), y_range))
+        y_lo, y_hi, y_range))
     _print("  Z: {:.3f}  to  {:.3f}  (span {:.3f})".format(
-        min(zs), max(zs), z_range))
+        z_lo, z_hi, z_range))
 
     # Warn about very large absolute coordinates (UTM / geocentric)
-    max_abs = max(abs(min(xs)), abs(max(xs)),
-                  abs(min(ys)), abs(max(ys)))
+    max_abs = max(abs(x_lo), abs(x_hi),
+                  abs(y_lo), abs(y_hi))
     if max_abs > 500000.0:
         _print(
             "Warning: large absolute coordinates detected ({:.0f} units max).\n"
@@ -623,16 +1148,17 @@ def _validate_e57_coordinate_ranges(points, filepath):
 
 def _load_e57_via_rhino_import(filepath):
     """
-    Fallback E57 loader: use Rhino's built-in _Import command to bring the
-    E57 file into the document, harvest the resulting point cloud objects,
-    then delete them from the document.
+    Fallback E57 loader: use Rhino's built-in E57 importer (RhinoDoc.Import,
+    or the _Import command on older builds) to bring the E57 file into the
+    document, harvest the resulting point cloud objects, then delete them
+    from the document.
 
     This approach works on Rhino 7+ which ships with built-in E57 import
     support.  It does not require any extra Python libraries.
 
     Limitations:
     - Rhino must support the specific E57 variant in the file.
-    - The undo stack is modified (one undo block wraps the import/delete).
+    - The undo stack is modified (one undo record wraps the import/delete).
     - For very large files this can be slow due to Rhino's import pipeline.
     - Only cartesian XYZ is extracted; intensity/colour are discarded.
 
@@ -642,56 +1168,83 @@ def _load_e57_via_rhino_import(filepath):
 
     Returns
     -------
-    list of (float, float, float)  or None if import fails
+    numpy.ndarray (N, 3)  or  list of (float, float, float),
+    or None if import fails
     """
     doc = sc.doc
 
-    # Snapshot of existing object GUIDs before import
-    existing_guids = set(
-        obj.Id for obj in doc.Objects
-        if obj.IsValid and not obj.IsDeleted
-    )
+    # Every object created from here on gets a runtime serial number at
+    # least this large, so new objects can be found without snapshotting
+    # the GUIDs of everything already in the document.
+    first_new_serial = Rhino.DocObjects.RhinoObject.NextRuntimeSerialNumber
 
-    # Run Rhino import via command string
-    safe_path = filepath.replace("\\", "/")
-    cmd = '_-Import "{}" _Enter'.format(safe_path)
+    # Import, harvest and delete as a single undo step with redraw off;
+    # the view is refreshed once at the end.
+    undo_sn = doc.BeginUndoRecord("Topo Map E57 import")
+    doc.Views.RedrawEnabled = False
+    try:
+        points = _harvest_imported_points(doc, filepath, first_new_serial)
+    finally:
+        doc.Views.RedrawEnabled = True
+        if undo_sn:
+            doc.EndUndoRecord(undo_sn)
+        doc.Views.Redraw()
 
-    _print("Running Rhino E57 import command...")
-    result = rs.Command(cmd, False)
+    if points is None:
+        return None
+
+    if not points:
+        _print("No point data could be extracted from Rhino's E57 import.")
+        return None
+
+    points = _as_point_array(points)
+    _print("Rhino E57 bridge: extracted {:,} points.".format(len(points)))
+    _validate_e57_coordinate_ranges(points, filepath)
+    return points
+
+
+def _harvest_imported_points(doc, filepath, first_new_serial):
+    """
+    Import `filepath`, collect XYZ from every object it added, then delete
+    those objects with one bulk ObjectTable.Delete call.
+
+    Objects added by the import are those whose RuntimeSerialNumber is
+    >= `first_new_serial` (RhinoObject.NextRuntimeSerialNumber sampled
+    before the import).
+
+    Returns
+    -------
+    list of (x, y, z), or None if the import failed or added nothing
+    """
+    result = _import_file_into_doc(doc, filepath)
 
     if not result:
-        _print("Rhino _Import command returned failure.")
+        _print("Rhino E57 import returned failure.")
         return None
 
     # Identify newly added objects
-    all_guids_after = set(
-        obj.Id for obj in doc.Objects
+    new_objects = [
+        obj for obj in doc.Objects.AllObjectsSince(first_new_serial)
         if obj.IsValid and not obj.IsDeleted
-    )
-    new_guids = all_guids_after - existing_guids
+    ]
 
-    if not new_guids:
+    if not new_objects:
         _print("Rhino _Import succeeded but added no new objects.")
         return None
 
-    _print("Rhino import created {} new object(s).".format(len(new_guids)))
+    _print("Rhino import created {} new object(s).".format(len(new_objects)))
 
     points = []
-    guids_to_delete = list(new_guids)
-
-    for guid in new_guids:
-        obj = doc.Objects.FindId(guid)
-        if obj is None:
-            continue
+    guids_to_delete = [obj.Id for obj in new_objects]
 
+    for obj in new_objects:
         geom = obj.Geometry
 
         # Handle PointCloud geometry type (Rhino 7 E57 import result)
         if isinstance(geom, rg.PointCloud):
             cloud_pts = geom.GetPoints()
             if cloud_pts:
-                for pt in cloud_pts:
-                    points.append((pt.X, pt.Y, pt.Z))
+                points.extend([(pt.X, pt.Y, pt.Z) for pt in cloud_pts])
             _print("  Extracted {:,} points from PointCloud object.".format(
                 len(cloud_pts) if cloud_pts else 0))
 
@@ -700,19 +1253,38 @@ def _load_e57_via_rhino_import(filepath):
             pt = geom.Location
             points.append((pt.X, pt.Y, pt.Z))
 
-    # Remove imported objects from the document
-    for guid in guids_to_delete:
-        doc.Objects.Delete(guid, True)
+    # Remove imported objects from the document in one call
+    doc.Objects.Delete(guids_to_delete, True)
 
-    doc.Views.Redraw()
+    return points
 
-    if not points:
-        _print("No point data could be extracted from Rhino's E57 import.")
-        return None
 
-    _print("Rhino E57 bridge: extracted {:,} points.".format(len(points)))
-    _validate_e57_coordinate_ranges(points, filepath)
-    return points
+def _import_file_into_doc(doc, filepath):
+    """
+    Import `filepath` into `doc` through RhinoDoc.Import, which goes
+    straight to the file-import plug-in without the command-line parser.
+
+    Falls back to scripting the '_-Import' command on Rhino builds whose
+    RhinoCommon does not expose RhinoDoc.Import.
+
+    Returns
+    -------
+    bool  True if Rhino reports the import succeeded
+    """
+    import_fn = getattr(doc, "Import", None)
+    if import_fn is not None:
+        _print("Importing E57 via RhinoDoc.Import...")
+        try:
+            return bool(import_fn(filepath))
+        except Exception as ex:
+            _print("RhinoDoc.Import failed: {}.  "
+                   "Retrying with _-Import command.".format(ex))
+
+    safe_path = filepath.replace("\\", "/")
+    cmd = '_-Import "{}" _Enter'.format(safe_path)
+
+    _print("Running Rhino E57 import command...")
+    return bool(rs.Command(cmd, False))
 
 
 def load_point_cloud(filepath):
@@ -723,7 +1295,10 @@ def load_point_cloud(filepath):
     file (CSV/TXT/XYZ) and calls the appropriate loader.
 
     Both loaders return the same data structure so all downstream processing
-    (statistics, filtering, surface generation, contouring) is unchanged.
+    (statistics, filtering, surface generation, contouring) is unchanged:
+    an (N, 3) float64 ndarray when NumPy is available, otherwise a list of
+    (x, y, z) tuples.  Conversion to RhinoCommon Point3d happens only at
+    the document / geometry boundary (see _to_point3d_array).
 
     Parameters
     ----------
@@ -731,7 +1306,7 @@ def load_point_cloud(filepath):
 
     Returns
     -------
-    list of (float, float, float)  XYZ points
+    numpy.ndarray (N, 3)  or  list of (float, float, float)  XYZ points
 
     Raises
     ------
@@ -743,10 +1318,14 @@ def load_point_cloud(filepath):
 
     if fmt == "e57":
         _print("Format detected: E57 (ISO 14694 3D imaging)")
-        return _load_pointcloud_e57(filepath)
+        points = _load_pointcloud_e57(filepath)
     else:
         _print("Format detected: delimited text (CSV/TXT/XYZ)")
-        return _load_pointcloud_csv(filepath)
+        points = _load_pointcloud_csv(filepath)
+
+    # Single point where the pipeline's container is guaranteed; a no-op
+    # for loaders that already produced a contiguous array.
+    return _as_point_array(points)
 
 
 # ===========================================================================
@@ -757,60 +1336,144 @@ def compute_statistics(points):
     """
     Compute bounding box, mean, and standard deviation for a point list.
 
+    With an ndarray input every figure comes from a column reduction in
+    NumPy; the pure-Python list path makes two passes over the points
+    (bounds, then Z mean / std) without building per-axis lists.
+
     Parameters
     ----------
-    points : list of (x, y, z)
+    points : (N, 3) array or list of (x, y, z)
 
     Returns
     -------
     dict with keys:
         x_min, x_max, y_min, y_max, z_min, z_max,
-        z_mean, z_std, count, x_range, y_range, z_range
+        z_mean, z_std, count, x_range, y_range, z_range,
+        max_abs_xy (largest |x| or |y|, for the origin-shift check)
     """
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    zs = [p[2] for p in points]
+    if _is_point_array(points):
+        return _compute_statistics_numpy(points)
 
-    n = len(points)
-    z_mean = sum(zs) / n
-    z_var  = sum((z - z_mean) ** 2 for z in zs) / n
-    z_std  = math.sqrt(z_var)
+    # One traversal for all bounds; mean and std come from _z_mean_std's
+    # single Welford pass instead of separate per-axis lists.
+    x_min, y_min, z_min = points[0]
+    x_max, y_max, z_max = points[0]
+    for (x, y, z) in points:
+        if x < x_min:
+            x_min = x
+        elif x > x_max:
+            x_max = x
+        if y < y_min:
+            y_min = y
+        elif y > y_max:
+            y_max = y
+        if z < z_min:
+            z_min = z
+        elif z > z_max:
+            z_max = z
+
+    z_mean, z_std = _z_mean_std(points)
 
     return {
-        "count":   n,
-        "x_min":   min(xs),  "x_max": max(xs),
-        "y_min":   min(ys),  "y_max": max(ys),
-        "z_min":   min(zs),  "z_max": max(zs),
+        "count":   len(points),
+        "x_min":   x_min,  "x_max": x_max,
+        "y_min":   y_min,  "y_max": y_max,
+        "z_min":   z_min,  "z_max": z_max,
         "z_mean":  z_mean,
         "z_std":   z_std,
-        "x_range": max(xs) - min(xs),
-        "y_range": max(ys) - min(ys),
-        "z_range": max(zs) - min(zs),
+        "x_range": x_max - x_min,
+        "y_range": y_max - y_min,
+        "z_range": z_max - z_min,
+        "max_abs_xy": max(-x_min, x_max, -y_min, y_max),
+    }
+
+
+def _compute_statistics_numpy(pts):
+    """
+    NumPy implementation of compute_statistics for an (N, 3) array.
+
+    Values are converted back to Python floats so the returned dict is
+    interchangeable with the list-based path.
+    """
+    lo = pts.min(axis=0)
+    hi = pts.max(axis=0)
+    zs = pts[:, 2]
+
+    (x_min, y_min, z_min) = lo.tolist()
+    (x_max, y_max, z_max) = hi.tolist()
+
+    return {
+        "count":   int(pts.shape[0]),
+        "x_min":   x_min,  "x_max": x_max,
+        "y_min":   y_min,  "y_max": y_max,
+        "z_min":   z_min,  "z_max": z_max,
+        "z_mean":  float(zs.mean()),
+        "z_std":   float(zs.std()),
+        "x_range": x_max - x_min,
+        "y_range": y_max - y_min,
+        "z_range": z_max - z_min,
+        "max_abs_xy": float(np.abs(np.concatenate((lo[:2], hi[:2]))).max()),
     }
 
 
+def detect_grid_shape(points):
+    """
+    Detect whether the points lie on a complete regular XY grid.
+
+    The cloud is a grid when its distinct X and Y values multiply out to
+    exactly the point count, i.e. every (x, y) combination occurs once.
+    Gridded DEM exports (one row per cell) satisfy this; scans and thinned
+    clouds do not.
+
+    Parameters
+    ----------
+    points : (N, 3) array or list of (x, y, z)
+
+    Returns
+    -------
+    tuple (u_count, v_count)  distinct X and Y counts, or None if the
+    points are not a complete grid
+    """
+    if _is_point_array(points):
+        u_count = len(np.unique(points[:, 0]))
+        v_count = len(np.unique(points[:, 1]))
+    else:
+        u_count = len(set(p[0] for p in points))
+        v_count = len(set(p[1] for p in points))
+
+    if u_count < 2 or v_count < 2 or u_count * v_count != len(points):
+        return None
+    return (u_count, v_count)
+
+
 def normalize_coordinates(points, stats):
     """
     Translate point coordinates to a local origin for better numerical precision
     during surface fitting. Large absolute coordinates (e.g. UTM > 300,000)
     cause floating-point precision loss in RhinoCommon algorithms.
 
+    With NumPy the shift is a single broadcast subtraction over the array.
+
     Parameters
     ----------
-    points : list of (x, y, z)
+    points : (N, 3) array or list of (x, y, z)
     stats  : dict  from compute_statistics()
 
     Returns
     -------
     tuple (normalized_points, origin)
-        normalized_points : list of (x, y, z) with origin at (0, 0, z_min)
+        normalized_points : (N, 3) array or list of (x, y, z)
+                            with origin at (0, 0, z_min)
         origin : tuple (orig_x_min, orig_y_min, orig_z_min) for denormalization
     """
     origin = (stats["x_min"], stats["y_min"], stats["z_min"])
-    normalized = [
-        (p[0] - origin[0], p[1] - origin[1], p[2] - origin[2])
-        for p in points
-    ]
+    if _NUMPY_AVAILABLE:
+        normalized = _as_point_array(points) - np.array(origin)
+    else:
+        normalized = [
+            (p[0] - origin[0], p[1] - origin[1], p[2] - origin[2])
+            for p in points
+        ]
     _print("Coordinate normalization: shifting origin by ({:.1f}, {:.1f}, {:.1f})".format(
         origin[0], origin[1], origin[2]))
     return normalized, origin
@@ -822,37 +1485,71 @@ def denormalize_coordinates(points, origin):
 
     Parameters
     ----------
-    points : list of (x, y, z)  in normalized space
+    points : (N, 3) array or list of (x, y, z)  in normalized space
     origin : tuple (orig_x, orig_y, orig_z)
 
     Returns
     -------
-    list of (x, y, z)  back in original coordinate system
+    (N, 3) float64 array or list of (x, y, z)
+        back in original coordinate system
     """
+    if _NUMPY_AVAILABLE:
+        # Add in float64 even if the local points were stored as float32
+        return _as_point_array(points) + np.array(origin, dtype=np.float64)
     return [
         (p[0] + origin[0], p[1] + origin[1], p[2] + origin[2])
         for p in points
     ]
 
 
+def _z_mean_std(points):
+    """
+    Return (mean, population std) of the Z column in a single pass.
+
+    Arrays use NumPy reductions on the Z column only; lists use Welford's
+    online update so the data is traversed once without building a
+    separate Z list.
+    """
+    if _is_point_array(points):
+        zs = points[:, 2]
+        return float(zs.mean()), float(zs.std())
+
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for p in points:
+        n += 1
+        delta = p[2] - mean
+        mean += delta / n
+        m2 += delta * (p[2] - mean)
+    return mean, math.sqrt(m2 / n) if n else 0.0
+
+
 def filter_outliers(points, sigma=OUTLIER_SIGMA):
     """
     Remove elevation outliers beyond `sigma` standard deviations from the mean.
 
+    Isolated returns whose Z lies inside the global band are left to
+    filter_isolated_points, which runs on the thinned surface sample.
+
     Parameters
     ----------
-    points : list of (x, y, z)
+    points : (N, 3) array or list of (x, y, z)
     sigma  : float  standard deviation multiplier
 
     Returns
     -------
-    list of (x, y, z)  cleaned point list
+    (M, 3) array or list of (x, y, z)  cleaned point set
     """
-    stats = compute_statistics(points)
-    z_lo = stats["z_mean"] - sigma * stats["z_std"]
-    z_hi = stats["z_mean"] + sigma * stats["z_std"]
+    z_mean, z_std = _z_mean_std(points)
+    z_lo = z_mean - sigma * z_std
+    z_hi = z_mean + sigma * z_std
 
-    filtered = [p for p in points if z_lo <= p[2] <= z_hi]
+    if _is_point_array(points):
+        zs = points[:, 2]
+        filtered = points[(zs >= z_lo) & (zs <= z_hi)]
+    else:
+        filtered = [p for p in points if z_lo <= p[2] <= z_hi]
     removed = len(points) - len(filtered)
 
     if removed:
@@ -862,31 +1559,156 @@ def filter_outliers(points, sigma=OUTLIER_SIGMA):
     return filtered
 
 
+def filter_isolated_points(points, k=OUTLIER_NEIGHBOURS,
+                           sigma=OUTLIER_NEIGHBOUR_SIGMA):
+    """
+    Remove isolated returns (birds, multipath) via _neighbour_outlier_mask.
+
+    Meant for the thinned surface sample, so the KD-tree is built over at
+    most MAX_SURFACE_POINTS points rather than the full cloud.  A no-op
+    for list input, when SciPy is unavailable or when `k` is 0.
+
+    Parameters
+    ----------
+    points : (N, 3) array or list of (x, y, z)
+    k      : int    neighbours per point
+    sigma  : float  standard deviation multiplier
+
+    Returns
+    -------
+    (M, 3) array or list of (x, y, z)  cleaned point set
+    """
+    if not (_SCIPY_AVAILABLE and k > 0 and _is_point_array(points)):
+        return points
+    keep = _neighbour_outlier_mask(points, k, sigma)
+    if keep is None:
+        return points
+    removed = len(points) - int(keep.sum())
+    if removed:
+        points = points[keep]
+        _print("Outlier filter ({} neighbours, {}σ): removed {:,} "
+               "isolated points.".format(k, sigma, removed))
+    return points
+
+
+def _neighbour_outlier_mask(pts, k, sigma):
+    """
+    Statistical outlier removal: flag points whose mean distance to their
+    `k` nearest neighbours lies more than `sigma` standard deviations above
+    the cloud-wide mean of that quantity.  The test is one-sided: points in
+    dense patches sit below the mean and are legitimate.
+
+    Parameters
+    ----------
+    pts   : (N, 3) float ndarray
+    k     : int    neighbours per point, excluding the point itself
+    sigma : float  standard deviation multiplier
+
+    Returns
+    -------
+    (N,) bool ndarray  True for points to keep, or None if there are too
+    few points for the statistic to mean anything
+    """
+    if len(pts) <= k:
+        return None
+
+    tree = _cKDTree(pts)
+    try:
+        dists, _ = tree.query(pts, k=k + 1, workers=-1)
+    except TypeError:
+        # SciPy < 1.6 has no `workers` argument
+        dists, _ = tree.query(pts, k=k + 1)
+
+    # Column 0 is each point's zero distance to itself
+    mean_dist = dists[:, 1:].mean(axis=1)
+    mu = mean_dist.mean()
+    sd = mean_dist.std()
+    if sd == 0.0:
+        return None
+    return mean_dist <= mu + sigma * sd
+
+
 def thin_points(points, target_count=MAX_SURFACE_POINTS):
     """
     Uniformly subsample a point list to at most `target_count` points.
 
-    Uses a deterministic stride so the spatial distribution is even.
+    Array input is reduced to per-cell centroids on an XY grid (see
+    _grid_thin) so that scans stored in scanline / azimuth order still
+    give even spatial coverage.
+    List input, or clouds with a degenerate XY extent, use a deterministic
+    index stride instead.
 
     Parameters
     ----------
-    points       : list of (x, y, z)
+    points       : (N, 3) array or list of (x, y, z)
     target_count : int
 
     Returns
     -------
-    list of (x, y, z)
+    (M, 3) array or list of (x, y, z)  same container type as the input
     """
     n = len(points)
     if n <= target_count:
         return points
 
-    stride = n // target_count
-    thinned = points[::stride][:target_count]
+    thinned = None
+    if _is_point_array(points):
+        thinned = _grid_thin(points, target_count)
+
+    if thinned is None:
+        stride = n // target_count
+        thinned = points[::stride][:target_count]
     _print("Thinned {:,} → {:,} points for surface fitting.".format(n, len(thinned)))
     return thinned
 
 
+def _grid_thin(pts, target_count):
+    """
+    Replace the points falling in each cell of an XY grid with their
+    centroid, the grid's cell count over the cloud's bounding box being
+    roughly `target_count`.
+
+    Averaging rather than keeping one representative gives uniform density
+    and damps per-point sensor noise in Z.  A 2-D grid is used rather than
+    a 3-D voxel grid because the cloud is a terrain height field: one
+    sample per XY column is what the surface fit needs, and Z cells would
+    only retain extra points on steep faces.
+
+    Parameters
+    ----------
+    pts          : (N, 3) float ndarray
+    target_count : int
+
+    Returns
+    -------
+    (M, 3) ndarray with M <= target_count and the dtype of `pts`, in cell
+    order, or None if the XY extent is degenerate
+    """
+    xy_lo = pts[:, :2].min(axis=0)
+    x_span, y_span = (pts[:, :2].max(axis=0) - xy_lo).tolist()
+    if x_span <= 0.0 or y_span <= 0.0:
+        return None
+
+    cell = math.sqrt(x_span * y_span / float(target_count))
+    keys = np.floor((pts[:, :2] - xy_lo) / cell).astype(np.int64)
+    packed = keys[:, 0] * (int(keys[:, 1].max()) + 1) + keys[:, 1]
+
+    _, inverse = np.unique(packed, return_inverse=True)
+    inverse = inverse.ravel()
+    counts = np.bincount(inverse).astype(np.float64)
+    centroids = np.column_stack([
+        np.bincount(inverse, weights=pts[:, axis]) / counts
+        for axis in range(3)
+    ]).astype(pts.dtype, copy=False)
+
+    # Boundary rows can push the occupied-cell count slightly over target
+    if len(centroids) > target_count:
+        stride = int(math.ceil(len(centroids) / float(target_count)))
+        centroids = centroids[::stride]
+
+    return centroids
+
+
 # ===========================================================================
 # 3. LAYER MANAGEMENT
 # ===========================================================================
@@ -917,6 +1739,8 @@ class LayerManager:
         self.z_max    = z_max
         self.band_size = band_size
         self._cache   = {}  # name → layer index
+        self._layer_by_bucket = {}  # (band number, is_index) → layer index
+        self._band_parents    = {}  # band number → parent layer name
 
     # ------------------------------------------------------------------
     def _get_or_create(self, name, parent_name=None, colour=None,
@@ -970,17 +1794,25 @@ class LayerManager:
 
     # ------------------------------------------------------------------
     def create_base_layers(self):
-        """Create the top-level organisational layers."""
-        self._get_or_create(
+        """
+        Create the top-level organisational layers.
+
+        Returns
+        -------
+        tuple (point_layer, surface_layer) of Rhino layer table indices
+        """
+        pt_layer = self._get_or_create(
             "Topo_PointCloud",
-            colour=sd.Color.FromArgb(180, 180, 180),
+            colour=_POINT_LAYER_COLOUR,
             plot_weight=0.09)
 
-        self._get_or_create(
+        surf_layer = self._get_or_create(
             "Topo_Surface",
-            colour=sd.Color.FromArgb(200, 220, 240),
+            colour=_SURFACE_LAYER_COLOUR,
             plot_weight=LW_SURFACE)
 
+        return pt_layer, surf_layer
+
     # ------------------------------------------------------------------
     def _band_label(self, band_lo, band_hi):
         """Return a short string like 'Contours_0-50m'."""
@@ -994,6 +1826,25 @@ class LayerManager:
             if (self.z_max - self.z_min) > 0 else 0.5
         return _colour_from_ramp(t)
 
+    # ------------------------------------------------------------------
+    def _band_parent(self, bucket):
+        """
+        Return the parent layer name for integer band number `bucket`
+        (band_lo = bucket * band_size), creating the layer on first use.
+        Shared by the Regular and Index getters so each band's label and
+        colour are computed once.
+        """
+        parent = self._band_parents.get(bucket)
+        if parent is None:
+            band_lo = bucket * self.band_size
+            band_hi = band_lo + self.band_size
+            parent  = self._band_label(band_lo, band_hi)
+            if parent not in self._cache:
+                band_col = self._band_colour(band_lo, band_hi)
+                self._get_or_create(parent, colour=band_col)
+            self._band_parents[bucket] = parent
+        return parent
+
     # ------------------------------------------------------------------
     def get_regular_layer(self, elevation):
         """
@@ -1009,23 +1860,25 @@ class LayerManager:
         -------
         int  Rhino layer table index
         """
-        band_lo = math.floor(elevation / self.band_size) * self.band_size
-        band_hi = band_lo + self.band_size
-        parent  = self._band_label(band_lo, band_hi)
-        child   = "{}::Regular".format(parent)
+        bucket = int(elevation // self.band_size)
+        try:
+            return self._layer_by_bucket[(bucket, False)]
+        except KeyError:
+            pass
 
-        if parent not in self._cache:
-            band_col = self._band_colour(band_lo, band_hi)
-            self._get_or_create(parent, colour=band_col)
+        parent = self._band_parent(bucket)
+        child  = "{}::Regular".format(parent)
 
         if child not in self._cache:
             self._get_or_create(
                 child,
                 parent_name=parent,
-                colour=sd.Color.FromArgb(100, 100, 100),
+                colour=_REGULAR_LAYER_COLOUR,
                 plot_weight=LW_REGULAR)
 
-        return self._cache[child]
+        idx = self._cache[child]
+        self._layer_by_bucket[(bucket, False)] = idx
+        return idx
 
     # ------------------------------------------------------------------
     def get_index_layer(self, elevation):
@@ -1040,14 +1893,14 @@ class LayerManager:
         -------
         int  Rhino layer table index
         """
-        band_lo = math.floor(elevation / self.band_size) * self.band_size
-        band_hi = band_lo + self.band_size
-        parent  = self._band_label(band_lo, band_hi)
-        child   = "{}::Index".format(parent)
+        bucket = int(elevation // self.band_size)
+        try:
+            return self._layer_by_bucket[(bucket, True)]
+        except KeyError:
+            pass
 
-        if parent not in self._cache:
-            band_col = self._band_colour(band_lo, band_hi)
-            self._get_or_create(parent, colour=band_col)
+        parent = self._band_parent(bucket)
+        child  = "{}::Index".format(parent)
 
         if child not in self._cache:
             # Index layer colour comes from the elevation ramp
@@ -1060,7 +1913,35 @@ class LayerManager:
                 colour=idx_col,
                 plot_weight=LW_INDEX)
 
-        return self._cache[child]
+        idx = self._cache[child]
+        self._layer_by_bucket[(bucket, True)] = idx
+        return idx
+
+    # ------------------------------------------------------------------
+    def contour_layers(self, contour_results):
+        """
+        Resolve the target layer of every contour level up front, creating
+        layers as needed, so the document-population loop only reads
+        plain ints.
+
+        Parameters
+        ----------
+        contour_results : list of dict  from extract_contours()
+
+        Returns
+        -------
+        list of int  Rhino layer table index per entry of contour_results
+                     (None for levels without curves)
+        """
+        layers = []
+        for entry in contour_results:
+            if not entry["curves"]:
+                layers.append(None)
+            elif entry["is_index"]:
+                layers.append(self.get_index_layer(entry["elevation"]))
+            else:
+                layers.append(self.get_regular_layer(entry["elevation"]))
+        return layers
 
 
 # ===========================================================================
@@ -1074,16 +1955,17 @@ def build_surface_from_points(points, stats):
     Brep.CreateFromMesh for unstructured clouds (via Delaunay mesh).
 
     Strategy:
-        - If the point cloud is on a regular grid (detected by aspect ratio
-          and count matching a reasonable U x V grid), use
-          NurbsSurface.CreateThroughPoints.
+        - If stats carries a "grid_shape" hint (see detect_grid_shape),
+          the points form a complete U x V grid: sort them into grid
+          order and use NurbsSurface.CreateThroughPoints.
         - Otherwise, triangulate via Rhino's Mesh.CreateFromPointCloud and
           fit a surface patch (or keep the mesh for contouring).
 
     Parameters
     ----------
-    points : list of (x, y, z)  thinned point cloud
-    stats  : dict               from compute_statistics()
+    points : (N, 3) array or list of (x, y, z)  thinned point cloud
+    stats  : dict               from compute_statistics(), optionally
+                                with "grid_shape" set by the caller
 
     Returns
     -------
@@ -1093,32 +1975,21 @@ def build_surface_from_points(points, stats):
     """
     _print("Building terrain surface from {:,} points...".format(len(points)))
 
-    # Convert to Point3d list (RhinoCommon accepts Python lists directly)
-    rhino_pts = [rg.Point3d(p[0], p[1], p[2]) for p in points]
-
-    # ---- Attempt structured NURBS fit --------------------------------
-    # Estimate grid dimensions from point count and XY aspect ratio
-    count = len(points)
-    aspect = (stats["x_range"] / stats["y_range"]
-              if stats["y_range"] > 0 else 1.0)
-
-    # candidate U count such that V = count/U and aspect ≈ U/V
-    u_candidate = int(math.sqrt(count * aspect))
-    v_candidate = count // max(u_candidate, 1)
-
-    use_nurbs = (
-        u_candidate >= 2
-        and v_candidate >= 2
-        and abs(u_candidate * v_candidate - count) < count * 0.05
-    )
-
-    if use_nurbs:
-        _print("Detected structured grid  (~{}×{}).  "
+    # ---- Structured NURBS fit, when the caller found a full grid -----
+    grid_shape = stats.get("grid_shape")
+    if grid_shape is not None:
+        u_candidate, v_candidate = grid_shape
+        _print("Detected structured grid  ({}×{}).  "
                "Using NurbsSurface.CreateThroughPoints.".format(
                    u_candidate, v_candidate))
+        # CreateThroughPoints expects V to vary fastest: sort by X, then Y
+        if _is_point_array(points):
+            grid_pts = points[np.lexsort((points[:, 1], points[:, 0]))]
+        else:
+            grid_pts = sorted(points, key=lambda p: (p[0], p[1]))
         try:
             surf = rg.NurbsSurface.CreateThroughPoints(
-                rhino_pts,
+                _to_point3d_array(grid_pts),
                 u_candidate,
                 v_candidate,
                 SURFACE_U_DEGREE,
@@ -1158,7 +2029,7 @@ def build_surface_from_points(points, stats):
     return mesh, True
 
 
-def _build_delaunay_mesh(points, stats):
+def _build_delaunay_mesh(points, stats, rhino_pts=None):
     """
     Create a Rhino Mesh from an unstructured XYZ point cloud using
     RhinoCommon's Mesh.CreateFromTessellation (Rhino 7+) if available,
@@ -1166,14 +2037,17 @@ def _build_delaunay_mesh(points, stats):
 
     Parameters
     ----------
-    points : list of (x, y, z)
-    stats  : dict  from compute_statistics()
+    points    : (N, 3) array or list of (x, y, z)
+    stats     : dict  from compute_statistics()
+    rhino_pts : Point3d[] or None  `points` already converted by the
+                caller; converted here when omitted
 
     Returns
     -------
     Rhino.Geometry.Mesh or None
     """
-    rhino_pts = [rg.Point3d(p[0], p[1], p[2]) for p in points]
+    if rhino_pts is None:
+        rhino_pts = _to_point3d_array(points)
 
     # --- Attempt RhinoCommon tessellation (Rhino 7+ only) -------------
     try:
@@ -1198,45 +2072,39 @@ def _build_delaunay_mesh(points, stats):
         _print("Error: degenerate point cloud extent.")
         return None
 
-    # Accumulate z values per grid cell
-    grid_z   = {}
-    grid_cnt = {}
-
-    for (x, y, z) in points:
-        xi = int((x - stats["x_min"]) / x_step)
-        yi = int((y - stats["y_min"]) / y_step)
-        xi = max(0, min(xi, grid_res - 1))
-        yi = max(0, min(yi, grid_res - 1))
-        key = (xi, yi)
-        grid_z[key]   = grid_z.get(key, 0.0)   + z
-        grid_cnt[key] = grid_cnt.get(key, 0)   + 1
-
-    # Average z per cell; interpolate missing cells from neighbours
-    z_grid = [[None] * grid_res for _ in range(grid_res)]
-    for (xi, yi), total_z in grid_z.items():
-        z_grid[yi][xi] = total_z / grid_cnt[(xi, yi)]
-
-    _fill_grid_gaps(z_grid, grid_res, stats["z_mean"])
-
-    # Build Rhino mesh from height field
+    if _is_point_array(points):
+        # Average z per cell (NaN where empty), then fill gaps
+        z_grid = _bin_height_field_numpy(
+            points, stats["x_min"], stats["y_min"], x_step, y_step, grid_res)
+        _fill_grid_gaps_numpy(z_grid, stats["z_mean"])
+    else:
+        # Accumulate z values per grid cell
+        grid_z   = defaultdict(float)
+        grid_cnt = defaultdict(int)
+
+        for (x, y, z) in points:
+            xi = int((x - stats["x_min"]) / x_step)
+            yi = int((y - stats["y_min"]) / y_step)
+            xi = max(0, min(xi, grid_res - 1))
+            yi = max(0, min(yi, grid_res - 1))
+            key = (xi, yi)
+            grid_z[key]   += z
+            grid_cnt[key] += 1
+
+        # Average z per cell; interpolate missing cells from neighbours
+        z_grid = [[None] * grid_res for _ in range(grid_res)]
+        for (xi, yi), total_z in grid_z.items():
+            z_grid[yi][xi] = total_z / grid_cnt[(xi, yi)]
+
+        _fill_grid_gaps(z_grid, grid_res, stats["z_mean"])
+
+    # Build Rhino mesh from height field; vertices and faces are each
+    # handed to RhinoCommon as one typed array instead of one call apiece.
     mesh = rg.Mesh()
-
-    for yi in range(grid_res):
-        for xi in range(grid_res):
-            world_x = stats["x_min"] + xi * x_step
-            world_y = stats["y_min"] + yi * y_step
-            world_z = z_grid[yi][xi] if z_grid[yi][xi] is not None \
-                      else stats["z_mean"]
-            mesh.Vertices.Add(world_x, world_y, world_z)
-
-    # Faces: two triangles per quad
-    for yi in range(grid_res - 1):
-        for xi in range(grid_res - 1):
-            v00 = yi * grid_res + xi
-            v10 = yi * grid_res + xi + 1
-            v01 = (yi + 1) * grid_res + xi
-            v11 = (yi + 1) * grid_res + xi + 1
-            mesh.Faces.AddFace(v00, v10, v11, v01)
+    mesh.Vertices.AddVertices(_height_field_vertices(
+        z_grid, grid_res, stats["x_min"], stats["y_min"],
+        x_step, y_step, stats["z_mean"]))
+    mesh.Faces.AddFaces(_height_field_faces(grid_res))
 
     mesh.Normals.ComputeNormals()
     mesh.Compact()
@@ -1244,6 +2112,46 @@ def _build_delaunay_mesh(points, stats):
     return mesh if mesh.IsValid else None
 
 
+def _height_field_vertices(z_grid, grid_res, x_min, y_min, x_step, y_step,
+                           default_z):
+    """
+    Return the height-field vertices as a Point3d[] in row-major order
+    (vertex index = yi * grid_res + xi).
+
+    Parameters
+    ----------
+    z_grid    : ndarray (grid_res, grid_res) or list of lists, [yi][xi]
+    default_z : float  used for any cell still None in a list grid
+    """
+    if _is_point_array(z_grid):
+        xs = x_min + np.arange(grid_res) * x_step
+        ys = y_min + np.arange(grid_res) * y_step
+        gx, gy = np.meshgrid(xs, ys)
+        return _to_point3d_array(
+            np.column_stack((gx.ravel(), gy.ravel(), z_grid.ravel())))
+
+    return _to_point3d_array(
+        (x_min + xi * x_step,
+         y_min + yi * y_step,
+         z_grid[yi][xi] if z_grid[yi][xi] is not None else default_z)
+        for yi in range(grid_res)
+        for xi in range(grid_res))
+
+
+def _height_field_faces(grid_res):
+    """
+    Return the quad faces of a grid_res x grid_res height field as a
+    MeshFace[] (one quad per cell, vertices ordered counter-clockwise).
+    """
+    return System.Array[rg.MeshFace](
+        rg.MeshFace(yi * grid_res + xi,
+                    yi * grid_res + xi + 1,
+                    (yi + 1) * grid_res + xi + 1,
+                    (yi + 1) * grid_res + xi)
+        for yi in range(grid_res - 1)
+        for xi in range(grid_res - 1))
+
+
 def _fill_grid_gaps(z_grid, grid_res, default_z):
     """
     Fill None cells in a 2D grid using a simple nearest-assigned-neighbour
@@ -1277,6 +2185,123 @@ def _fill_grid_gaps(z_grid, grid_res, default_z):
                 z_grid[yi][xi] = default_z
 
 
+def _bin_height_field_numpy(pts, x_min, y_min, x_step, y_step, grid_res):
+    """
+    Average point Z per cell of a grid_res x grid_res height field.
+
+    Cell indices are computed for all points at once and both the Z sums
+    and the counts are accumulated with np.bincount over the flattened
+    cell index, replacing the per-point dict updates.
+
+    Returns
+    -------
+    numpy.ndarray (grid_res, grid_res) float64 indexed [yi, xi], with NaN
+    in cells that received no points
+    """
+    xi = ((pts[:, 0] - x_min) / x_step).astype(np.int64)
+    yi = ((pts[:, 1] - y_min) / y_step).astype(np.int64)
+    np.clip(xi, 0, grid_res - 1, out=xi)
+    np.clip(yi, 0, grid_res - 1, out=yi)
+
+    cell = yi * grid_res + xi
+    size = grid_res * grid_res
+    sums = np.bincount(cell, weights=pts[:, 2], minlength=size)
+    counts = np.bincount(cell, minlength=size)
+
+    z_grid = np.full(size, np.nan)
+    occupied = counts > 0
+    z_grid[occupied] = sums[occupied] / counts[occupied]
+    return z_grid.reshape(grid_res, grid_res)
+
+
+def _fill_grid_gaps_numpy(z_grid, default_z, max_passes=4):
+    """
+    NumPy counterpart of _fill_grid_gaps for a NaN-marked ndarray grid.
+
+    Each pass sets every empty cell with at least one filled 4-neighbour
+    to the mean of those neighbours, computed for the whole grid with
+    shifted slices.  Remaining NaN cells get `default_z`.
+
+    With SciPy available every empty cell instead takes the value of its
+    nearest filled cell, found in one Euclidean distance transform.  With
+    Numba (and no SciPy) the passes run in the compiled _fill_gaps_jit.
+
+    Modifies z_grid in place.
+    """
+    missing = np.isnan(z_grid)
+    if _SCIPY_AVAILABLE and missing.any() and not missing.all():
+        nearest = _distance_transform_edt(
+            missing, return_distances=False, return_indices=True)
+        z_grid[missing] = z_grid[tuple(nearest)][missing]
+        return
+
+    if _fill_gaps_jit is not None:
+        _fill_gaps_jit(z_grid, max_passes)
+        z_grid[np.isnan(z_grid)] = default_z
+        return
+
+    for _ in range(max_passes):
+        missing = np.isnan(z_grid)
+        if not missing.any():
+            break
+
+        z_pad = np.pad(np.where(missing, 0.0, z_grid), 1)
+        n_pad = np.pad((~missing).astype(np.float64), 1)
+        total = (z_pad[:-2, 1:-1] + z_pad[2:, 1:-1] +
+                 z_pad[1:-1, :-2] + z_pad[1:-1, 2:])
+        count = (n_pad[:-2, 1:-1] + n_pad[2:, 1:-1] +
+                 n_pad[1:-1, :-2] + n_pad[1:-1, 2:])
+
+        fill = missing & (count > 0)
+        if not fill.any():
+            break
+        z_grid[fill] = total[fill] / count[fill]
+
+    z_grid[np.isnan(z_grid)] = default_z
+
+
+def _fill_gaps_passes(z_grid, max_passes):
+    """
+    Loop form of the neighbour-averaging passes in _fill_grid_gaps_numpy,
+    written for Numba: each pass reads a snapshot of the grid, so rows can
+    be processed in parallel with identical results.  Cells still NaN
+    after `max_passes` are left for the caller.
+
+    Modifies z_grid (float64 ndarray) in place.
+    """
+    rows, cols = z_grid.shape
+    for _ in range(max_passes):
+        src = z_grid.copy()
+        filled = 0
+        for yi in _prange(rows):
+            for xi in range(cols):
+                if not np.isnan(src[yi, xi]):
+                    continue
+                total = 0.0
+                count = 0
+                if yi > 0 and not np.isnan(src[yi - 1, xi]):
+                    total += src[yi - 1, xi]
+                    count += 1
+                if yi < rows - 1 and not np.isnan(src[yi + 1, xi]):
+                    total += src[yi + 1, xi]
+                    count += 1
+                if xi > 0 and not np.isnan(src[yi, xi - 1]):
+                    total += src[yi, xi - 1]
+                    count += 1
+                if xi < cols - 1 and not np.isnan(src[yi, xi + 1]):
+                    total += src[yi, xi + 1]
+                    count += 1
+                if count > 0:
+                    z_grid[yi, xi] = total / count
+                    filled += 1
+        if filled == 0:
+            break
+
+
+_fill_gaps_jit = (_njit(cache=True, parallel=True)(_fill_gaps_passes)
+                  if _NUMBA_AVAILABLE else None)
+
+
 # ===========================================================================
 # 5. CONTOUR EXTRACTION
 # ===========================================================================
@@ -1322,10 +2347,6 @@ def extract_contours(geometry, is_mesh, stats,
                elevations[-1] if elevations else z_min,
                interval))
 
-    # Determine which elevation indices are index contours
-    # Index contours occur every `index_every` steps counted from the
-    # lowest contour.  The first contour is #1 (not index), so index
-    # contours are at positions index_every, 2*index_every, etc.
     contour_results = []
 
     if is_mesh:
@@ -1343,41 +2364,64 @@ def extract_contours(geometry, is_mesh, stats,
         (stats["y_min"] + stats["y_max"]) / 2.0,
         0.0
     )
-    normal = rg.Vector3d.ZAxis
-
     total = len(elevations)
     curves_generated = 0
     curves_filtered = 0
 
+    # Contour every level up front, either in one native range call or
+    # across the thread pool; the per-level loop below then only filters
+    # results.  Breps try the range call first (it sets up the surface
+    # once for all slices), meshes the thread pool; each falls back to
+    # the other, then to serial per-level contouring.
+    if is_mesh:
+        strategies = ("parallel", "batch")
+    else:
+        strategies = ("batch", "parallel")
+
+    batched = None
+    for strategy in strategies:
+        if batched is not None or not elevations:
+            break
+        if strategy == "batch" and CONTOUR_BATCH:
+            batched = _contour_all_levels(
+                brep_or_mesh, is_mesh, base_pt, start_z, elevations[-1],
+                interval, total)
+        elif strategy == "parallel" and CONTOUR_PARALLEL:
+            batched = _contour_levels_parallel(
+                brep_or_mesh, is_mesh, base_pt, elevations)
+
+    # Index contours fall on multiples of interval * index_every, i.e. on
+    # every `index_every`-th step counted from zero elevation.  start_z is
+    # already snapped to a multiple of `interval`, so the step number of
+    # level i is simply start_step + i.
+    start_step = int(round(start_z / interval))
+    progress_every = max(1, total // 10)
+    min_size_sq = (sc.doc.ModelAbsoluteTolerance * 10) ** 2
+
     for i, elev in enumerate(elevations):
-        if (i + 1) % max(1, total // 10) == 0 or i == total - 1:
+        if (i + 1) % progress_every == 0 or i == total - 1:
             _progress("Contouring", i + 1, total)
 
-        plane_pt = rg.Point3d(base_pt.X, base_pt.Y, elev)
-
         try:
-            if is_mesh:
-                curves = rg.Mesh.CreateContourCurves(
-                    brep_or_mesh,
-                    plane_pt,
-                    normal)
+            if batched is not None:
+                curves = batched[i]
+                if isinstance(curves, Exception):
+                    raise curves
             else:
-                curves = rg.Brep.CreateContourCurves(
-                    brep_or_mesh,
-                    plane_pt,
-                    normal,
-                    sc.doc.ModelAbsoluteTolerance)
+                curves = _contour_level(brep_or_mesh, is_mesh, base_pt, elev)
 
             if curves is None:
                 curves = []
 
             curves_generated += len(curves)
 
-            # Filter out degenerate or duplicate tiny curves
+            # Filter out degenerate or duplicate tiny curves.  A curve is
+            # never shorter than its bounding-box diagonal, so comparing
+            # the squared diagonal avoids integrating every arc length.
             valid_curves = [
                 c for c in curves
                 if c is not None and c.IsValid
-                and c.GetLength() > sc.doc.ModelAbsoluteTolerance * 10
+                and c.GetBoundingBox(True).Diagonal.SquareLength > min_size_sq
             ]
 
             curves_filtered += len(curves) - len(valid_curves)
@@ -1386,15 +2430,7 @@ def extract_contours(geometry, is_mesh, stats,
             _print("Warning: contour at z={:.2f} failed: {}".format(elev, ex))
             valid_curves = []
 
-        # Determine index status
-        # Count from start_z up; every `index_every`-th level is index
-        step_number = int(round((elev - start_z) / interval))
-        is_index = (step_number % index_every == 0) and (step_number != 0 or
-                   abs(elev / interval - round(elev / interval)) < 1e-6)
-
-        # Simpler: every `index_every` multiples of interval
-        is_index = (abs(elev % (interval * index_every)) <
-                    interval * 0.01)
+        is_index = (start_step + i) % index_every == 0
 
         contour_results.append({
             "elevation": elev,
@@ -1425,38 +2461,176 @@ def extract_contours(geometry, is_mesh, stats,
     return contour_results
 
 
+def _contour_level(brep_or_mesh, is_mesh, base_pt, elev):
+    """
+    Contour a single level with a horizontal section plane.
+
+    Parameters
+    ----------
+    brep_or_mesh : Brep or Mesh
+    is_mesh      : bool
+    base_pt      : Point3d  XY centroid of the terrain
+    elev         : float    section elevation
+
+    Returns
+    -------
+    Curve[] or None
+    """
+    plane_pt = rg.Point3d(base_pt.X, base_pt.Y, elev)
+    if is_mesh:
+        return rg.Mesh.CreateContourCurves(
+            brep_or_mesh, plane_pt, rg.Vector3d.ZAxis)
+    return rg.Brep.CreateContourCurves(
+        brep_or_mesh, plane_pt, rg.Vector3d.ZAxis,
+        sc.doc.ModelAbsoluteTolerance)
+
+
+def _contour_levels_parallel(brep_or_mesh, is_mesh, base_pt, elevations):
+    """
+    Contour every level concurrently with Parallel.For.
+
+    Each level is an independent, read-only query against the same
+    geometry, so the section planes are spread over all cores.  Results
+    are written into a preallocated slot per level, keeping them in
+    elevation order.  Nothing touches the document here; adding curves
+    stays on the script thread.
+
+    Parameters
+    ----------
+    brep_or_mesh : Brep or Mesh
+    is_mesh      : bool
+    base_pt      : Point3d  XY centroid of the terrain
+    elevations   : list of float
+
+    Returns
+    -------
+    list with one entry per level: the Curve[] (or None) for that level,
+    or the Exception raised while contouring it.  None if the thread pool
+    could not be used (caller falls back to serial contouring).
+    """
+    # The document tolerance is read once here rather than from every worker
+    tolerance = sc.doc.ModelAbsoluteTolerance
+    normal    = rg.Vector3d.ZAxis
+    results   = [None] * len(elevations)
+
+    def work(i):
+        plane_pt = rg.Point3d(base_pt.X, base_pt.Y, elevations[i])
+        try:
+            if is_mesh:
+                results[i] = rg.Mesh.CreateContourCurves(
+                    brep_or_mesh, plane_pt, normal)
+            else:
+                results[i] = rg.Brep.CreateContourCurves(
+                    brep_or_mesh, plane_pt, normal, tolerance)
+        except Exception as ex:
+            results[i] = ex
+
+    try:
+        Parallel.For(0, len(elevations), System.Action[int](work))
+    except Exception as ex:
+        _print("Parallel contouring unavailable ({}); "
+               "contouring on one thread.".format(ex))
+        return None
+    return results
+
+
+def _contour_all_levels(brep_or_mesh, is_mesh, base_pt, start_z, end_z,
+                        interval, level_count):
+    """
+    Contour every level in one call to the range overload of
+    CreateContourCurves (contourStart, contourEnd, interval), letting
+    RhinoCommon sweep all section planes natively instead of being
+    invoked once per elevation from Python.
+
+    Curves are assigned back to their level from the Z of their start
+    point.
+
+    Parameters
+    ----------
+    brep_or_mesh : Brep or Mesh
+    is_mesh      : bool
+    base_pt      : Point3d  XY centroid of the terrain
+    start_z      : float    first contour elevation
+    end_z        : float    last contour elevation
+    interval     : float
+    level_count  : int      number of levels between start_z and end_z
+
+    Returns
+    -------
+    list of lists of Curve, one list per level, or None if the batch call
+    fails (caller falls back to per-level contouring)
+    """
+    start = rg.Point3d(base_pt.X, base_pt.Y, start_z)
+    # Nudge the end past the last level so it is not lost to round-off
+    end   = rg.Point3d(base_pt.X, base_pt.Y, end_z + interval * 0.5)
+
+    try:
+        if is_mesh:
+            curves = rg.Mesh.CreateContourCurves(
+                brep_or_mesh, start, end, interval)
+        else:
+            curves = rg.Brep.CreateContourCurves(
+                brep_or_mesh, start, end, interval)
+    except Exception as ex:
+        _print("Batch contouring unavailable ({}); "
+               "contouring level by level.".format(ex))
+        return None
+
+    if curves is None:
+        return None
+
+    buckets = [[] for _ in range(level_count)]
+    for curve in curves:
+        if curve is None:
+            continue
+        level = int(round((curve.PointAtStart.Z - start_z) / interval))
+        if 0 <= level < level_count:
+            buckets[level].append(curve)
+    return buckets
+
+
 # ===========================================================================
 # 6. RHINO DOCUMENT POPULATION
 # ===========================================================================
 
 def add_points_to_document(points, layer_idx):
     """
-    Add raw XYZ points as Rhino point objects on the specified layer.
+    Add raw XYZ points to the specified layer as a single PointCloud
+    object, which Rhino draws from one vertex buffer instead of one
+    object per point.
 
     Parameters
     ----------
-    points    : list of (x, y, z)
+    points    : (N, 3) array or list of (x, y, z)
     layer_idx : int  Rhino layer table index
 
     Returns
     -------
-    list of Guid  added object GUIDs
+    list of Guid  added object GUIDs (the one point cloud, if added)
     """
     guids = []
     doc = sc.doc
     attrs = Rhino.DocObjects.ObjectAttributes()
     attrs.LayerIndex = layer_idx
 
-    # Only add a thinned representative cloud to avoid document bloat
-    display_pts = thin_points(points, target_count=5000)
+    # Only add a thinned representative cloud to avoid document bloat.  A
+    # preview needs no spatial balancing, so evenly spaced indices are
+    # picked directly: O(DISPLAY_POINT_COUNT) rather than a full-cloud pass.
+    n = len(points)
+    count = min(n, DISPLAY_POINT_COUNT)
+    if _is_point_array(points):
+        display_pts = points[np.linspace(0, n - 1, count).astype(np.int64)]
+    else:
+        display_pts = points[::max(1, n // DISPLAY_POINT_COUNT)][:count]
 
-    for (x, y, z) in display_pts:
-        pt   = rg.Point3d(x, y, z)
-        guid = doc.Objects.AddPoint(pt, attrs)
-        if guid != System.Guid.Empty:
-            guids.append(guid)
+    cloud = rg.PointCloud()
+    cloud.AddRange(_to_point3d_array(display_pts))
+    guid = doc.Objects.AddPointCloud(cloud, attrs)
+    if guid != System.Guid.Empty:
+        guids.append(guid)
 
-    _print("Added {:,} display points to document.".format(len(guids)))
+    _print("Added a point cloud of {:,} display points to document.".format(
+        cloud.Count if guids else 0))
     return guids
 
 
@@ -1489,7 +2663,7 @@ def add_surface_to_document(geometry, is_mesh, layer_idx):
     return guid
 
 
-def add_contours_to_document(contour_results, layer_manager, stats,
+def add_contours_to_document(contour_results, contour_layers, stats,
                               colour_by_elevation=True):
     """
     Add all contour curves to the Rhino document with correct layer
@@ -1498,7 +2672,7 @@ def add_contours_to_document(contour_results, layer_manager, stats,
     Parameters
     ----------
     contour_results     : list of dict  from extract_contours()
-    layer_manager       : LayerManager
+    contour_layers      : list of int   from LayerManager.contour_layers()
     stats               : dict
     colour_by_elevation : bool  apply per-object colour ramp to index contours
 
@@ -1515,7 +2689,14 @@ def add_contours_to_document(contour_results, layer_manager, stats,
     total  = sum(len(r["curves"]) for r in contour_results)
     done   = 0
 
-    for entry in contour_results:
+    add_curve   = doc.Objects.AddCurve
+    empty_guid  = System.Guid.Empty
+    groups      = {}  # (layer, plot weight, ARGB or None) → [attrs, is_index, curves]
+    group_order = []  # first-seen order, so objects are added deterministically
+
+    # Pass 1: bucket every level's curves under one shared attributes
+    # object per layer/weight/colour combination
+    for entry, layer_idx in zip(contour_results, contour_layers):
         elev     = entry["elevation"]
         is_index = entry["is_index"]
         curves   = entry["curves"]
@@ -1523,37 +2704,42 @@ def add_contours_to_document(contour_results, layer_manager, stats,
         if not curves:
             continue
 
-        if is_index:
-            layer_idx  = layer_manager.get_index_layer(elev)
-            plot_wt    = LW_INDEX
-        else:
-            layer_idx  = layer_manager.get_regular_layer(elev)
-            plot_wt    = LW_REGULAR
-
-        # Build object attributes
-        attrs              = Rhino.DocObjects.ObjectAttributes()
-        attrs.LayerIndex   = layer_idx
-        attrs.PlotWeight   = plot_wt
+        plot_wt = LW_INDEX if is_index else LW_REGULAR
 
+        obj_colour = None
         if colour_by_elevation and is_index:
-            t          = (elev - z_min) / z_span
-            obj_colour = _colour_from_ramp(t)
-            attrs.ObjectColor      = obj_colour
-            attrs.ColorSource      = \
-                Rhino.DocObjects.ObjectColorSource.ColorFromObject
-            attrs.PlotColorSource  = \
-                Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject
-
-        for curve in curves:
-            guid = doc.Objects.AddCurve(curve, attrs)
-            if guid != System.Guid.Empty:
-                if is_index:
-                    added["index"].append(guid)
-                else:
-                    added["regular"].append(guid)
-            done += 1
-
-        if done % max(1, total // 20) == 0:
+            obj_colour = _colour_from_ramp((elev - z_min) / z_span)
+
+        key = (layer_idx, plot_wt,
+               obj_colour.ToArgb() if obj_colour is not None else None)
+        group = groups.get(key)
+        if group is None:
+            attrs              = Rhino.DocObjects.ObjectAttributes()
+            attrs.LayerIndex   = layer_idx
+            attrs.PlotWeight   = plot_wt
+
+            if obj_colour is not None:
+                attrs.ObjectColor      = obj_colour
+                attrs.ColorSource      = \
+                    Rhino.DocObjects.ObjectColorSource.ColorFromObject
+                attrs.PlotColorSource  = \
+                    Rhino.DocObjects.ObjectPlotColorSource.PlotColorFromObject
+            group = groups[key] = [attrs, is_index, []]
+            group_order.append(key)
+        group[2].extend(curves)
+
+    # Pass 2: add each group in one tight loop (RhinoCommon has no plural
+    # AddCurves; Rhino copies the attributes on every add)
+    progress_every = max(1, total // 20)
+    for key in group_order:
+        attrs, is_index, curves = groups[key]
+        guids  = [add_curve(curve, attrs) for curve in curves]
+        target = added["index"] if is_index else added["regular"]
+        target.extend(g for g in guids if g != empty_guid)
+
+        prev  = done
+        done += len(curves)
+        if done // progress_every != prev // progress_every:
             _progress("Adding to document", done, total)
 
     _print("Added {:,} regular + {:,} index contour curves.".format(
@@ -1568,8 +2754,10 @@ def add_contours_to_document(contour_results, layer_manager, stats,
 
 def export_dxf(output_path):
     """
-    Export the entire Rhino model to a DXF file using Rhino's built-in
-    export command.
+    Export the entire Rhino model to a DXF file.
+
+    Writes through RhinoCommon's FileDxf writer directly; the scripted
+    _-Export command is only used where that API is unavailable.
 
     Parameters
     ----------
@@ -1579,10 +2767,15 @@ def export_dxf(output_path):
     -------
     bool  True on apparent success
     """
-    # Rhino's _-Export command preserves layers and plot weights
-    safe_path = output_path.replace("\\", "/")
-    cmd = '_-Export "{}" _Enter'.format(safe_path)
-    result = rs.Command(cmd, False)
+    # Both routes preserve layers and plot weights
+    try:
+        options = Rhino.FileIO.FileDxfWriteOptions()
+        result  = Rhino.FileIO.FileDxf.Write(output_path, sc.doc, options)
+    except AttributeError:
+        safe_path = output_path.replace("\\", "/")
+        cmd = '_-Export "{}" _Enter'.format(safe_path)
+        result = rs.Command(cmd, False)
+
     if result and os.path.isfile(output_path):
         _print("DXF exported to: {}".format(output_path))
         return True
@@ -1653,7 +2846,7 @@ def get_user_parameters():
         "Add raw point cloud to document",
         "Add terrain surface to document",
         "Colour index contours by elevation",
-        "Filter elevation outliers ({}σ)".format(OUTLIER_SIGMA),
+        _outlier_option_label(),
         "Export DXF after generation",
     ]
     defaults = [False, True, True, True, False]
@@ -1686,6 +2879,15 @@ def get_user_parameters():
     }
 
 
+def _outlier_option_label():
+    """Checkbox label describing the filters the outlier option runs."""
+    label = "Filter elevation outliers ({}σ)".format(OUTLIER_SIGMA)
+    if _SCIPY_AVAILABLE and OUTLIER_NEIGHBOURS > 0:
+        label += " and isolated points ({} neighbours, {}σ)".format(
+            OUTLIER_NEIGHBOURS, OUTLIER_NEIGHBOUR_SIGMA)
+    return label
+
+
 def print_statistics(stats):
     """Print a formatted statistics block to the Rhino command line."""
     _print("=" * 60)
@@ -1777,13 +2979,12 @@ def main():
 
     # -- 3. Surface generation -----------------------------------------
     surface_pts = thin_points(points, MAX_SURFACE_POINTS)
+    if params["filter_outliers"]:
+        surface_pts = filter_isolated_points(surface_pts)
     surface_stats = compute_statistics(surface_pts)
 
     # Check if coordinates are very large (e.g., UTM) and normalize for precision
-    max_abs_coord = max(
-        abs(surface_stats["x_min"]), abs(surface_stats["x_max"]),
-        abs(surface_stats["y_min"]), abs(surface_stats["y_max"])
-    )
+    max_abs_coord = surface_stats["max_abs_xy"]
 
     normalized_pts = surface_pts
     origin_shift = None
@@ -1792,8 +2993,17 @@ def main():
         _print("Large absolute coordinates detected ({:.0f}).".format(max_abs_coord))
         _print("Normalizing for numerical precision during surface fitting...")
         normalized_pts, origin_shift = normalize_coordinates(surface_pts, surface_stats)
+
+    # Coordinates are now site-local either way: fit from float32 copies
+    # and return to float64 only through the denormalising transform
+    normalized_pts = _to_local_precision(normalized_pts)
+    if origin_shift is not None:
         surface_stats = compute_statistics(normalized_pts)
 
+    # Only the thinned surface sample is inspected; thinning a gridded
+    # cloud usually breaks the grid, which then correctly reads as None.
+    surface_stats["grid_shape"] = detect_grid_shape(normalized_pts)
+
     try:
         geometry, is_mesh = build_surface_from_points(normalized_pts, surface_stats)
     except Exception as ex:
@@ -1839,28 +3049,33 @@ def main():
         return
 
     # -- 5. Layer structure & document population ----------------------
-    sc.doc.Views.RedrawEnabled = False   # suppress redraws during bulk add
+    # Suppress redraws and per-object undo records during the bulk add;
+    # the previous states are restored afterwards.
+    prev_redraw = sc.doc.Views.RedrawEnabled
+    prev_undo   = sc.doc.UndoRecordingEnabled
+    sc.doc.Views.RedrawEnabled  = False
+    sc.doc.UndoRecordingEnabled = False
     try:
         layer_mgr = LayerManager(
             stats["z_min"], stats["z_max"], params["band_size"])
-        layer_mgr.create_base_layers()
+        pt_layer, surf_layer = layer_mgr.create_base_layers()
+        contour_layers = layer_mgr.contour_layers(contour_results)
 
         if params["add_points"]:
-            pt_layer = layer_mgr._cache.get("Topo_PointCloud", 0)
             add_points_to_document(points, pt_layer)
 
         if params["add_surface"]:
-            surf_layer = layer_mgr._cache.get("Topo_Surface", 0)
             add_surface_to_document(geometry, is_mesh, surf_layer)
 
         added_guids = add_contours_to_document(
             contour_results,
-            layer_mgr,
+            contour_layers,
             stats,
             colour_by_elevation=params["colour_by_elev"]
         )
     finally:
-        sc.doc.Views.RedrawEnabled = True
+        sc.doc.UndoRecordingEnabled = prev_undo
+        sc.doc.Views.RedrawEnabled  = prev_redraw
 
     # -- 6. Optional DXF export ----------------------------------------
     if params["export_dxf"]:
@@ -1871,8 +3086,12 @@ def main():
         export_dxf(dxf_path)
 
     # -- 7. Refresh & summary ------------------------------------------
+    # Zoom to the cloud's known extents; everything added lies inside them,
+    # and ZoomExtents would rescan every object in the document
     sc.doc.Views.Redraw()
-    rs.ZoomExtents()
+    rs.ZoomBoundingBox(rg.BoundingBox(
+        stats["x_min"], stats["y_min"], stats["z_min"],
+        stats["x_max"], stats["y_max"], stats["z_max"]))
 
     elapsed = time.time() - t_start
     summary = (
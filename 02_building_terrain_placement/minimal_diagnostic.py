@@ -5,6 +5,8 @@ minimal_diagnostic.py - ULTRA MINIMAL (fastest)
 Just counts and lists objects by name. No geometry analysis.
 """
 
+from itertools import islice
+
 import scriptcontext as sc
 
 print("\n" + "=" * 70)
@@ -13,7 +15,7 @@ print("=" * 70)
 
 try:
     doc = sc.doc
-    obj_count = len(doc.Objects)
+    obj_count = doc.Objects.Count  # stored count; no enumeration
     print("\nTotal objects in document: {}".format(obj_count))
 
     if obj_count == 0:
@@ -22,10 +24,8 @@ try:
         print("\n⚠ WARNING: {} objects is very high!".format(obj_count))
         print("This may be causing the freeze.")
         print("\nFirst 20 objects:")
-        for i, obj in enumerate(doc.Objects):
-            if i >= 20:
-                break
-            print("  {}. {}".format(i+1, obj.Name if obj.Name else "<unnamed>"))
+        for i, obj in enumerate(islice(doc.Objects, 20), 1):
+            print("  {}. {}".format(i, obj.Name if obj.Name else "<unnamed>"))
     else:
         print("\nObjects:")
         for i, obj in enumerate(doc.Objects):
@@ -13,7 +13,6 @@ This will check:
 
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
-import Rhino.Geometry as rg
 
 print("\n" + "=" * 70)
 print("SCENE DIAGNOSTIC - BUILDING PLACEMENT SETUP CHECKER")
@@ -49,7 +48,7 @@ else:
         try:
             name = obj.Name if obj.Name else "<unnamed>"
             geom_type = obj.Geometry.GetType().Name
-            bbox = obj.Geometry.GetBoundingBox(rg.Transform.Identity)
+            bbox = obj.Geometry.GetBoundingBox(True)
 
             z_min = bbox.Min.Z
             z_max = bbox.Max.Z
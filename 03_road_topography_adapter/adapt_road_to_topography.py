@@ -13,8 +13,8 @@
 #   1. Extract road centerline from input geometry
 #   2. Project the 2D centerline onto the 3D terrain
 #   3. Sample the projected 3D centerline at regular intervals
-#   4. At each sample point, compute the terrain normal and build a
-#      perpendicular cross-section plane
+#   4. At each sample point, take the horizontal perpendicular to the
+#      centerline as the cross-section direction
 #   5. Generate a road-width cross-section profile at each station
 #   6. Loft all cross-section profiles into a continuous NURBS surface
 #   7. Organize results into named layers with statistics report
@@ -59,9 +59,21 @@ import rhinoscriptsyntax as rs
 import Rhino
 import Rhino.Geometry as rg
 import Rhino.Geometry.Intersect as ri
+import Rhino.UI
 import scriptcontext as sc
 import System
 import math
+from System.Threading.Tasks import Parallel
+
+# NumPy (optional, Rhino 8 CPython only) lays out the cross-section profile
+# points of all stations at once; see layout_all_cross_sections.
+_NUMPY_AVAILABLE = False
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    pass
 
 
 # =============================================================================
@@ -99,10 +111,42 @@ DEFAULT_TOLERANCE = 0.001
 # Lofting fewer than 2 sections is undefined.
 MIN_SECTIONS_FOR_LOFT = 2
 
-# Maximum perpendicular angle (degrees) allowed for cross-section tilt.
-# If terrain slope exceeds this, the cross-section falls back to a
-# world-Z perpendicular plane to prevent extreme geometry distortion.
-MAX_TERRAIN_SLOPE_DEG = 80.0
+# Number of road Brep faces, ranked by plan bounding-box area, whose exact
+# area is computed when picking the face to take the centerline from.
+# AreaMassProperties integrates over the trimmed surface and is expensive.
+CENTERLINE_FACE_CANDIDATES = 3
+
+# Project a Brep terrain's centerline in one chunk per processor core
+# (Parallel.For) and join the pieces, instead of one ProjectToBrep call over
+# the whole curve. The terrain is only read. Set False to project serially.
+PROJECTION_PARALLEL = True
+
+# Build the cross-section curves of all stations concurrently (Parallel.For)
+# once their terrain heights are known. Set False to build them serially.
+CROSS_SECTION_PARALLEL = True
+
+# Brep centerlines (or chunks of them) are first projected at this multiple
+# of the document tolerance. A piece is projected again at the document
+# tolerance only if the coarse result has a kink the flat piece did not
+# (e.g. at a terrain crease), or bends tighter than a radius of
+# PROJECTION_REFINE_RADIUS road widths at any of
+# PROJECTION_CURVATURE_SAMPLES points. Set the factor to 1.0 for
+# tight-precision mode (every piece at the document tolerance).
+PROJECTION_COARSE_FACTOR     = 10.0
+PROJECTION_REFINE_RADIUS     = 2.0
+PROJECTION_CURVATURE_SAMPLES = 16
+
+# Mesh terrains whose vertices form a regular XY lattice (DEM grids) are
+# sampled by lookup in a height grid instead of by ray-casting. Each cell is
+# interpolated on its two mesh triangles, so the lookup matches the mesh.
+# Set False to always ray-cast.
+HEIGHT_GRID_LOOKUP = True
+
+# Loft the road surface with LoftType.Straight (ruled between neighbouring
+# sections) instead of LoftType.Normal, which fits a smooth surface through
+# all sections at once. Much faster on long roads, but the surface creases
+# at every section. Set True for quick previews.
+FAST_LOFT = False
 
 # Layer names for output geometry
 LAYER_ROAD_SURFACE      = "Roads_Projected"
@@ -118,11 +162,85 @@ COLOR_ROAD_SECTIONS   = (0, 180, 255)   # cyan       - cross-sections
 DEFAULT_TERRAIN_LAYER = "terrain"
 DEFAULT_ROAD_LAYER    = "roads"
 
+# Shared RhinoCommon values, built once instead of on every call. Vector3d
+# and Plane are structs: these are only ever read or copied, never mutated.
+WORLD_DOWN     = rg.Vector3d(0.0, 0.0, -1.0)
+WORLD_UP       = rg.Vector3d(0.0, 0.0, 1.0)
+WORLD_XY_PLANE = rg.Plane.WorldXY
+
 
 # =============================================================================
 # LAYER MANAGEMENT
 # =============================================================================
 
+# Layer table index per layer name, filled on first lookup. Cleared at the
+# start of every run, since layers may have changed since the last one.
+_layer_index_cache = {}
+
+
+def reset_layer_index_cache():
+    """Clears the layer index cache. Called at the start of every run."""
+    _layer_index_cache.clear()
+
+
+def find_layer_index(layer_name):
+    """
+    Returns the layer table index of the named layer, looking it up in the
+    document only the first time each name is asked for.
+
+    Accepts a full path ("Parent::Child") or, like rs.IsLayer, the bare
+    name of a layer. Misses are not cached, so a layer created later in
+    the run is still found.
+
+    Parameters
+    ----------
+    layer_name : str
+
+    Returns
+    -------
+    int
+        Layer table index, or -1 if no such layer exists.
+    """
+    idx = _layer_index_cache.get(layer_name)
+    if idx is not None:
+        return idx
+
+    layers = sc.doc.Layers
+    idx = layers.FindByFullPath(layer_name, Rhino.RhinoMath.UnsetIntIndex)
+    if idx < 0:
+        layer = layers.FindName(layer_name)
+        idx = layer.Index if layer is not None else -1
+
+    if idx >= 0:
+        _layer_index_cache[layer_name] = idx
+    return idx
+
+
+def layer_attributes(layer_name, name=None):
+    """
+    Returns new object attributes placing an object on the named layer,
+    so geometry can be added straight onto it instead of being moved there
+    (and named) by rhinoscriptsyntax after it is added.
+
+    Parameters
+    ----------
+    layer_name : str
+    name : str or None
+        Optional object name.
+
+    Returns
+    -------
+    Rhino.DocObjects.ObjectAttributes
+        On the current layer if `layer_name` does not exist.
+    """
+    attrs = Rhino.DocObjects.ObjectAttributes()
+    idx = find_layer_index(layer_name)
+    attrs.LayerIndex = idx if idx >= 0 else sc.doc.Layers.CurrentLayerIndex
+    if name:
+        attrs.Name = name
+    return attrs
+
+
 def ensure_layer(layer_name, color_rgb=None, parent_layer=None):
     """
     Creates a Rhino layer if it does not already exist.
@@ -146,7 +264,7 @@ def ensure_layer(layer_name, color_rgb=None, parent_layer=None):
     str
         The layer name (unchanged from input).
     """
-    if rs.IsLayer(layer_name):
+    if find_layer_index(layer_name) >= 0:
         return layer_name
 
     if color_rgb is not None:
@@ -160,44 +278,41 @@ def ensure_layer(layer_name, color_rgb=None, parent_layer=None):
     return layer_name
 
 
-def add_object_to_layer(obj_id, layer_name):
-    """
-    Moves a Rhino object to the specified layer.
-
-    Parameters
-    ----------
-    obj_id : System.Guid
-    layer_name : str
-
-    Returns
-    -------
-    bool : True if successful.
-    """
-    if obj_id is None:
-        return False
-    try:
-        rs.ObjectLayer(obj_id, layer_name)
-        return True
-    except Exception:
-        return False
-
-
 def setup_output_layers():
     """
     Creates all required output layers for the road adaptation result.
 
     Layers are only created if they do not already exist in the document.
     This preserves any user-defined layer properties on repeat runs.
+
+    Returns
+    -------
+    dict
+        Object attributes per output layer name, with the layer index
+        resolved once here. publish_results() reuses them for every object
+        it adds (AddCurve / AddBrep copy the attributes they are given).
     """
     ensure_layer(LAYER_ROAD_SURFACE,    COLOR_ROAD_SURFACE)
     ensure_layer(LAYER_ROAD_CENTERLINE, COLOR_ROAD_CENTERLINE)
     ensure_layer(LAYER_ROAD_SECTIONS,   COLOR_ROAD_SECTIONS)
 
+    return dict(
+        (layer_name, layer_attributes(layer_name))
+        for layer_name in (LAYER_ROAD_SURFACE, LAYER_ROAD_CENTERLINE,
+                           LAYER_ROAD_SECTIONS)
+    )
+
 
 def get_objects_from_layer(layer_name):
     """
     Returns all Rhino object GUIDs on the named layer.
 
+    Queries the object table directly with the layer index already
+    resolved by find_layer_index(), rather than through rs.ObjectsByLayer,
+    which would look the layer up by name again. FindByLayer filters the
+    table natively, which is cheaper than walking every document object
+    from Python.
+
     Parameters
     ----------
     layer_name : str
@@ -207,12 +322,13 @@ def get_objects_from_layer(layer_name):
     list of System.Guid
         Empty list if the layer does not exist or has no objects.
     """
-    if not rs.IsLayer(layer_name):
+    idx = find_layer_index(layer_name)
+    if idx < 0:
         print("  Warning: Layer '{}' does not exist.".format(layer_name))
         return []
 
-    objects = rs.ObjectsByLayer(layer_name)
-    return list(objects) if objects else []
+    objects = sc.doc.Objects.FindByLayer(sc.doc.Layers[idx])
+    return [obj.Id for obj in objects] if objects else []
 
 
 # =============================================================================
@@ -262,11 +378,87 @@ def get_terrain_geometry(terrain_id):
     return None, None
 
 
+def prepare_terrain(terrain_geom, terrain_type, tolerance=DEFAULT_TOLERANCE):
+    """
+    Bundles the terrain geometry with the lookup structures that every
+    station query needs, so they are built once per run instead of once
+    per station.
+
+    - Mesh: RhinoCommon's ray-cast acceleration tree, which a first
+      MeshRay builds (and caches on the mesh), so that cost is paid here
+      rather than inside the first station's query.
+    - Both: a typed one-element .NET list holding the terrain, passed to
+      every RayShoot / ProjectPointsTo*Ex call instead of a fresh Python
+      list that IronPython has to convert on each call.
+    - Mesh on a regular XY lattice: a height grid (build_height_grid),
+      which replaces ray-casting when HEIGHT_GRID_LOOKUP is on.
+    - Both: the terrain bounding box, so batched ray-casts can drop points
+      outside its plan extent before projecting.
+
+    Parameters
+    ----------
+    terrain_geom : Rhino.Geometry.Brep or Rhino.Geometry.Mesh
+    terrain_type : str ('brep' or 'mesh')
+    tolerance : float
+        Used to recognise lattice coordinates in mesh terrain.
+
+    Returns
+    -------
+    dict with keys:
+        'geom'        : Brep or Mesh
+        'type'        : str ('brep' or 'mesh')
+        'geom_list'   : System.Collections.Generic.List holding 'geom'
+        'height_grid' : dict or None (lattice Mesh terrain only)
+        'bbox'        : Rhino.Geometry.BoundingBox of 'geom'
+    """
+    height_grid = None
+    bbox        = terrain_geom.GetBoundingBox(False)
+
+    if terrain_type == 'brep':
+        geom_list = System.Collections.Generic.List[rg.Brep]()
+    elif terrain_type == 'mesh':
+        geom_list = System.Collections.Generic.List[rg.Mesh]()
+        if HEIGHT_GRID_LOOKUP:
+            height_grid = build_height_grid(terrain_geom, tolerance)
+        # Warm-up ray down through the middle of the terrain; whether it
+        # hits does not matter
+        centre = bbox.Center
+        ri.Intersection.MeshRay(
+            terrain_geom,
+            rg.Ray3d(rg.Point3d(centre.X, centre.Y, RAY_CAST_DISTANCE),
+                     WORLD_DOWN)
+        )
+    else:
+        geom_list = System.Collections.Generic.List[rg.GeometryBase]()
+    geom_list.Add(terrain_geom)
+
+    return {
+        'geom':        terrain_geom,
+        'type':        terrain_type,
+        'geom_list':   geom_list,
+        'height_grid': height_grid,
+        'bbox':        bbox
+    }
+
+
+# Terrain labels per object GUID, filled on first lookup. Cleared at the
+# start of every run, since objects may have been renamed since the last one.
+_terrain_name_cache = {}
+
+
+def reset_terrain_name_cache():
+    """Clears the terrain label cache. Called at the start of every run."""
+    _terrain_name_cache.clear()
+
+
 def get_terrain_name(terrain_id):
     """
     Returns a human-readable label for the terrain object combining its
     Rhino object name (if set) and geometry type class name.
 
+    Memoised per GUID in _terrain_name_cache, so repeated calls within a
+    run do not search the object table again.
+
     Parameters
     ----------
     terrain_id : System.Guid
@@ -275,28 +467,36 @@ def get_terrain_name(terrain_id):
     -------
     str
     """
+    label = _terrain_name_cache.get(terrain_id)
+    if label is not None:
+        return label
+
     obj = sc.doc.Objects.Find(terrain_id)
     if obj is None:
         return "<unknown>"
 
-    obj_name  = rs.ObjectName(terrain_id) or "<unnamed>"
+    # The name is read from the object already found, rather than through
+    # rs.ObjectName (which would look the object up again)
+    obj_name  = obj.Attributes.Name or "<unnamed>"
     geom_type = type(obj.Geometry).__name__
 
-    return "{} ({})".format(obj_name, geom_type)
+    label = "{} ({})".format(obj_name, geom_type)
+    _terrain_name_cache[terrain_id] = label
+    return label
 
 
-def cast_ray_to_terrain(terrain_geom, terrain_type, x, y, tolerance):
+def cast_ray_to_terrain(terrain, x, y, tolerance):
     """
     Casts a vertical downward ray at (x, y) and returns the highest Z
     intersection with the terrain.
 
-    This is used both for normal estimation and for applying height offsets
-    when projecting individual cross-section edge points back to terrain.
+    This is used for applying height offsets when projecting individual
+    cross-section edge points back to terrain.
 
     Parameters
     ----------
-    terrain_geom : Rhino.Geometry.Brep or Rhino.Geometry.Mesh
-    terrain_type : str ('brep' or 'mesh')
+    terrain : dict
+        From prepare_terrain().
     x : float
     y : float
     tolerance : float
@@ -306,147 +506,484 @@ def cast_ray_to_terrain(terrain_geom, terrain_type, x, y, tolerance):
     float or None
         Z value of highest terrain hit, or None if no intersection.
     """
+    if terrain['height_grid'] is not None:
+        return sample_height_grid(terrain['height_grid'], x, y)
+
+    terrain_geom = terrain['geom']
+    terrain_type = terrain['type']
+
     ray_origin    = rg.Point3d(x, y, RAY_CAST_DISTANCE)
-    ray_direction = rg.Vector3d(0.0, 0.0, -1.0)
+    ray_direction = WORLD_DOWN
     ray           = rg.Ray3d(ray_origin, ray_direction)
 
     if terrain_type == 'brep':
-        hit_events = ri.Intersection.RayShoot([terrain_geom], ray, 1)
+        hit_events = ri.Intersection.RayShoot(terrain['geom_list'], ray, 1)
         if hit_events is None or len(hit_events) == 0:
             return None
-        z_values = [ev.Point.Z for ev in hit_events]
-        return max(z_values)
+        # Highest hit in one pass, without building a list of Z values
+        best_z = hit_events[0].Point.Z
+        for i in range(1, len(hit_events)):
+            z = hit_events[i].Point.Z
+            if z > best_z:
+                best_z = z
+        return best_z
 
     elif terrain_type == 'mesh':
         t = ri.Intersection.MeshRay(terrain_geom, ray)
         if t < 0.0:
             return None
-        hit_pt = ray_origin + ray_direction * t
-        return hit_pt.Z
+        # The ray points straight down from RAY_CAST_DISTANCE
+        return RAY_CAST_DISTANCE - t
 
     return None
 
 
-def estimate_terrain_normal_at_xy(terrain_geom, terrain_type, x, y, tolerance,
-                                   sample_radius=0.5):
+def cast_rays_to_terrain(terrain, xs, ys, tolerance):
     """
-    Estimates the terrain surface normal at the XY location by sampling
-    three nearby points and computing the cross-product normal.
+    Batched cast_ray_to_terrain: finds the highest terrain Z under each of
+    many (x, y) locations with one ProjectPointsToBrepsEx /
+    ProjectPointsToMeshesEx call instead of one ray-cast per point (or by
+    height-grid lookup for lattice mesh terrain).
 
-    For Brep terrain, uses Brep.ClosestPoint() for accurate normal.
-    For Mesh terrain, uses mesh face normal at the hit face.
+    The Ex variants report which input point every hit belongs to, so hits
+    are mapped back to their points; where a point hits the terrain more
+    than once, the highest hit is kept, as with a downward ray. Falls back
+    to one cast_ray_to_terrain call per point if the batched call fails.
 
-    Falls back to world Z-up if the estimation fails (e.g., point is
-    outside the terrain boundary).
+    The coordinates come as two parallel sequences (lists or NumPy arrays)
+    so callers can pass flattened coordinate columns without pairing them
+    into tuples first.
 
     Parameters
     ----------
-    terrain_geom : Brep or Mesh
-    terrain_type : str
-    x : float
-    y : float
+    terrain : dict
+        From prepare_terrain().
+    xs : sequence of float
+    ys : sequence of float
+        Same length as xs.
     tolerance : float
-    sample_radius : float
-        XY offset used when sampling neighbouring points for normal
-        estimation via cross-product (used for mesh terrain only when the
-        direct face normal is unavailable).
 
     Returns
     -------
-    Rhino.Geometry.Vector3d
-        Normalized terrain normal. Defaults to (0, 0, 1) on failure.
+    list of (float or None)
+        Terrain Z per input point, None where the point misses.
     """
-    world_up = rg.Vector3d(0.0, 0.0, 1.0)
+    n_pts    = len(xs)
+    z_values = [None] * n_pts
+    if n_pts == 0:
+        return z_values
+
+    height_grid = terrain['height_grid']
+    if height_grid is not None:
+        return sample_height_grid_batch(height_grid, xs, ys)
+
+    # Points outside the terrain's plan extent cannot hit it: they are
+    # marked as misses here, once, and only the rest are projected.
+    # inside[k] is the input index of the k-th projected point.
+    bbox  = terrain['bbox']
+    x_min = bbox.Min.X - tolerance
+    y_min = bbox.Min.Y - tolerance
+    x_max = bbox.Max.X + tolerance
+    y_max = bbox.Max.Y + tolerance
+
+    inside  = []
+    origins = System.Collections.Generic.List[rg.Point3d](n_pts)
+    for k in range(n_pts):
+        x = xs[k]
+        y = ys[k]
+        if x_min <= x <= x_max and y_min <= y <= y_max:
+            inside.append(k)
+            origins.Add(rg.Point3d(x, y, RAY_CAST_DISTANCE))
+
+    if not inside:
+        return z_values
 
-    if terrain_type == 'brep':
-        # Sample at the query point to find Z, then do a ClosestPoint query
-        z = cast_ray_to_terrain(terrain_geom, 'brep', x, y, tolerance)
-        if z is None:
-            return world_up
-
-        query_pt = rg.Point3d(x, y, z)
-        success, u, v = terrain_geom.Faces[0].ClosestPoint(query_pt)
-
-        # Try all faces to find the one closest to the query point
-        best_dist  = float('inf')
-        best_normal = world_up
-
-        for face in terrain_geom.Faces:
-            ok, fu, fv = face.ClosestPoint(query_pt)
-            if ok:
-                pt_on_face = face.PointAt(fu, fv)
-                dist       = query_pt.DistanceTo(pt_on_face)
-                if dist < best_dist:
-                    best_dist   = dist
-                    normal_raw  = face.NormalAt(fu, fv)
-                    if normal_raw.IsValid and normal_raw.Length > 1e-10:
-                        normal_raw.Unitize()
-                        # Ensure normal points upward (positive Z component)
-                        if normal_raw.Z < 0:
-                            normal_raw = -normal_raw
-                        best_normal = normal_raw
-
-        return best_normal
+    try:
+        if terrain['type'] == 'brep':
+            hits, indices = ri.Intersection.ProjectPointsToBrepsEx(
+                terrain['geom_list'], origins, WORLD_DOWN, tolerance
+            )
+        elif terrain['type'] == 'mesh':
+            hits, indices = ri.Intersection.ProjectPointsToMeshesEx(
+                terrain['geom_list'], origins, WORLD_DOWN, tolerance
+            )
+        else:
+            return z_values
+    except Exception:
+        for k in inside:
+            z_values[k] = cast_ray_to_terrain(terrain, xs[k], ys[k], tolerance)
+        return z_values
 
-    elif terrain_type == 'mesh':
-        ray_origin    = rg.Point3d(x, y, RAY_CAST_DISTANCE)
-        ray_direction = rg.Vector3d(0.0, 0.0, -1.0)
-        ray           = rg.Ray3d(ray_origin, ray_direction)
+    if hits is None or indices is None:
+        return z_values
 
-        # MeshRay returns t parameter; we need the face index for the normal
-        hit_mesh  = rg.Mesh()
-        face_idx  = -1
+    for hit, i in zip(hits, indices):
+        k = inside[i]
+        z = hit.Z
+        # Hits above the ray origins would not be found by a downward ray
+        if z <= RAY_CAST_DISTANCE and (z_values[k] is None or z > z_values[k]):
+            z_values[k] = z
 
-        # Use MeshRay with face index output when available
-        t = ri.Intersection.MeshRay(terrain_geom, ray)
-        if t < 0.0:
-            return world_up
-
-        # Recover face normal by finding closest face at hit point
-        hit_pt = ray_origin + ray_direction * t
-        mesh_pt = terrain_geom.ClosestPoint(hit_pt)
-        if not mesh_pt.IsValid:
-            return world_up
-
-        # Normals at mesh vertex (interpolated)
-        pt_idx = terrain_geom.ClosestPoint(
-            hit_pt,
-            rg.Vector3d.Zero,
-            0.0
-        )
+    return z_values
 
-        # Cross-product fallback using three sampled Z values
-        z0 = cast_ray_to_terrain(terrain_geom, 'mesh', x,                y,               tolerance)
-        z1 = cast_ray_to_terrain(terrain_geom, 'mesh', x + sample_radius, y,               tolerance)
-        z2 = cast_ray_to_terrain(terrain_geom, 'mesh', x,                y + sample_radius, tolerance)
 
-        if z0 is None or z1 is None or z2 is None:
-            return world_up
+def build_height_grid(mesh, tolerance):
+    """
+    Recognises a mesh terrain laid out on a regular, axis-aligned XY
+    lattice (a DEM grid) and copies its vertex heights into a row-major
+    grid, so heights can be read by index instead of by ray-cast.
+
+    The mesh qualifies only if every vertex sits, within tolerance, on a
+    distinct node of an nx x ny lattice with no node left empty, and its
+    faces tile every lattice cell (one quad or two triangles per cell).
+    Unwelded meshes, which repeat a node's vertex for every face around it,
+    are matched on their welded topology vertices instead.
 
-        p0 = rg.Point3d(x,                y,                z0)
-        p1 = rg.Point3d(x + sample_radius, y,                z1)
-        p2 = rg.Point3d(x,                y + sample_radius, z2)
+    The diagonal each cell is split along is recorded too, so lookups
+    interpolate on the same triangles a ray would hit: a triangle pair's
+    shared edge, or for a quad the edge from its first to its third vertex,
+    along which ray intersection splits it.
 
-        v1 = p1 - p0
-        v2 = p2 - p0
-        n  = rg.Vector3d.CrossProduct(v1, v2)
+    Parameters
+    ----------
+    mesh : Rhino.Geometry.Mesh
+    tolerance : float
 
-        if n.IsZero or n.Length < 1e-10:
-            return world_up
+    Returns
+    -------
+    dict or None
+        'x0', 'y0' : lattice origin
+        'dx', 'dy' : cell size
+        'nx', 'ny' : node counts along X and Y
+        'heights'  : list of float, Z of node (i, j) at j * nx + i
+        'height_array' : the same heights as a (ny, nx) NumPy array, or
+                         None without NumPy
+        'anti_diagonal' : list of bool, per cell (i, j) at j * (nx - 1) + i:
+                          True if the cell is split from node (i + 1, j) to
+                          (i, j + 1), False if from (i, j) to (i + 1, j + 1)
+        'anti_diagonal_array' : the same flags as a (ny - 1, nx - 1) NumPy
+                                array, or None without NumPy
+        None if the mesh is not a regular lattice.
+    """
+    vertices = mesh.Vertices.ToPoint3dArray()
+    points   = vertices
+    n_vert   = len(points)
+    if n_vert < 4 or tolerance <= 0.0:
+        return None
 
-        n.Unitize()
-        if n.Z < 0:
-            n = -n
+    # Distinct X and Y values (to tolerance) give the lattice dimensions
+    inv_tol = 1.0 / tolerance
+    nx = len(set(int(round(p.X * inv_tol)) for p in points))
+    ny = len(set(int(round(p.Y * inv_tol)) for p in points))
 
-        return n
+    # More vertices than lattice nodes: an unwelded grid (DEM exports often
+    # split every face off) still qualifies if its welded vertices fill it
+    if nx * ny < n_vert and mesh.TopologyVertices.Count == nx * ny:
+        points = list(mesh.TopologyVertices)
+        n_vert = len(points)
 
-    return world_up
+    if nx < 2 or ny < 2 or nx * ny != n_vert:
+        return None
+
+    faces = mesh.Faces
+    if faces.QuadCount * 2 + faces.TriangleCount != 2 * (nx - 1) * (ny - 1):
+        return None
+
+    bbox = mesh.GetBoundingBox(False)
+    x0, y0 = bbox.Min.X, bbox.Min.Y
+    dx = (bbox.Max.X - x0) / (nx - 1)
+    dy = (bbox.Max.Y - y0) / (ny - 1)
+    if dx <= tolerance or dy <= tolerance:
+        return None
+
+    heights = [None] * n_vert
+    for p in points:
+        i = int(round((p.X - x0) / dx))
+        j = int(round((p.Y - y0) / dy))
+        if (abs(p.X - (x0 + i * dx)) > tolerance or
+                abs(p.Y - (y0 + j * dy)) > tolerance):
+            return None
+        k = j * nx + i
+        if heights[k] is not None:
+            return None
+        heights[k] = p.Z
+
+    # Lattice node of every mesh vertex, which is what the faces index
+    nodes = [int(round((p.X - x0) / dx)) + nx * int(round((p.Y - y0) / dy))
+             for p in vertices]
+    anti_diagonal = _height_grid_cell_diagonals(faces, nodes, nx, ny)
+    if anti_diagonal is None:
+        return None
+
+    height_array        = None
+    anti_diagonal_array = None
+    if _NUMPY_AVAILABLE:
+        height_array        = np.array(heights).reshape(ny, nx)
+        anti_diagonal_array = np.array(anti_diagonal,
+                                       dtype=bool).reshape(ny - 1, nx - 1)
+
+    return {
+        'x0': x0, 'y0': y0,
+        'dx': dx, 'dy': dy,
+        'nx': nx, 'ny': ny,
+        'heights':             heights,
+        'height_array':        height_array,
+        'anti_diagonal':       anti_diagonal,
+        'anti_diagonal_array': anti_diagonal_array
+    }
+
+
+def _height_grid_cell_diagonals(faces, nodes, nx, ny):
+    """
+    Reads which diagonal each lattice cell is split along from the faces
+    covering it. A quad is split from its first to its third vertex; a
+    triangle's diagonal is its one edge spanning the cell in both X and Y.
+
+    Parameters
+    ----------
+    faces : Rhino.Geometry.Collections.MeshFaceList
+    nodes : list of int
+        Lattice node (j * nx + i) of every mesh vertex.
+    nx, ny : int
+
+    Returns
+    -------
+    list of bool or None
+        Per cell, True for the (i + 1, j)-(i, j + 1) diagonal (see
+        build_height_grid). None if a face is not a lattice cell or half
+        of one, two triangles split a cell along different diagonals, or
+        a cell is left uncovered.
+    """
+    cells = [None] * ((nx - 1) * (ny - 1))
+
+    for face in faces:
+        if face.IsQuad:
+            corners = (face.A, face.B, face.C, face.D)
+            pairs   = ((face.A, face.C),)
+        else:
+            corners = (face.A, face.B, face.C)
+            pairs   = ((face.A, face.B), (face.B, face.C), (face.C, face.A))
+
+        diagonal = None
+        for a, b in pairs:
+            ia, ja = nodes[a] % nx, nodes[a] // nx
+            ib, jb = nodes[b] % nx, nodes[b] // nx
+            if abs(ia - ib) == 1 and abs(ja - jb) == 1:
+                diagonal = (min(ia, ib), min(ja, jb), (ia - ib) != (ja - jb))
+                break
+        if diagonal is None:
+            return None
+
+        i, j, anti = diagonal
+        for c in corners:
+            if (nodes[c] % nx - i not in (0, 1) or
+                    nodes[c] // nx - j not in (0, 1)):
+                return None
+        k = j * (nx - 1) + i
+        if cells[k] is not None and cells[k] != anti:
+            return None
+        cells[k] = anti
+
+    if any(anti is None for anti in cells):
+        return None
+    return cells
+
+
+def sample_height_grid(grid, x, y):
+    """
+    Returns the terrain height at (x, y) from a height grid, interpolated
+    linearly on the triangle of the enclosing cell that contains it (the
+    cell's actual diagonal; see build_height_grid), so the result is the
+    height a ray-cast at (x, y) would return.
+
+    Parameters
+    ----------
+    grid : dict
+        From build_height_grid().
+    x : float
+    y : float
+
+    Returns
+    -------
+    float or None
+        None if (x, y) lies outside the grid (a miss, as for a ray).
+    """
+    nx = grid['nx']
+    u  = (x - grid['x0']) / grid['dx']
+    v  = (y - grid['y0']) / grid['dy']
+    if u < 0.0 or v < 0.0 or u > nx - 1 or v > grid['ny'] - 1:
+        return None
+
+    # Points on the far edges fall into the last cell
+    i  = min(int(u), nx - 2)
+    j  = min(int(v), grid['ny'] - 2)
+    fu = u - i
+    fv = v - j
+
+    h   = grid['heights']
+    k   = j * nx + i
+    z00 = h[k]
+    z10 = h[k + 1]
+    z01 = h[k + nx]
+    z11 = h[k + nx + 1]
+
+    if grid['anti_diagonal'][j * (nx - 1) + i]:
+        # Split from (1, 0) to (0, 1)
+        if fu + fv <= 1.0:
+            return z00 + (z10 - z00) * fu + (z01 - z00) * fv
+        return z11 + (z01 - z11) * (1.0 - fu) + (z10 - z11) * (1.0 - fv)
+    # Split from (0, 0) to (1, 1)
+    if fu >= fv:
+        return z00 + (z10 - z00) * fu + (z11 - z10) * fv
+    return z00 + (z11 - z01) * fu + (z01 - z00) * fv
+
+
+def sample_height_grid_batch(grid, xs, ys):
+    """
+    sample_height_grid() for many points at once.
+
+    With NumPy every point is interpolated in one vectorised pass over the
+    grid's height array; otherwise the points are sampled one by one.
+
+    Parameters
+    ----------
+    grid : dict
+        From build_height_grid().
+    xs : sequence of float
+    ys : sequence of float
+
+    Returns
+    -------
+    list of (float or None)
+        Height per point, None where the point lies outside the grid.
+    """
+    h = grid['height_array']
+    if h is None:
+        return [sample_height_grid(grid, x, y) for x, y in zip(xs, ys)]
+
+    nx = grid['nx']
+    ny = grid['ny']
+    u  = (np.asarray(xs, dtype=float) - grid['x0']) / grid['dx']
+    v  = (np.asarray(ys, dtype=float) - grid['y0']) / grid['dy']
+    inside = (u >= 0.0) & (v >= 0.0) & (u <= nx - 1) & (v <= ny - 1)
+
+    # Cell of every point; points on the far edges fall into the last cell
+    # and points outside are clamped (their result is discarded)
+    i  = np.clip(np.floor(u), 0, nx - 2).astype(np.intp)
+    j  = np.clip(np.floor(v), 0, ny - 2).astype(np.intp)
+    fu = u - i
+    fv = v - j
+
+    z00 = h[j, i]
+    z10 = h[j, i + 1]
+    z01 = h[j + 1, i]
+    z11 = h[j + 1, i + 1]
+
+    # Same per-triangle interpolation as sample_height_grid, for both
+    # diagonals at once; each point keeps the one its cell is split along
+    z_anti = np.where(
+        fu + fv <= 1.0,
+        z00 + (z10 - z00) * fu + (z01 - z00) * fv,
+        z11 + (z01 - z11) * (1.0 - fu) + (z10 - z11) * (1.0 - fv))
+    z_main = np.where(
+        fu >= fv,
+        z00 + (z10 - z00) * fu + (z11 - z10) * fv,
+        z00 + (z11 - z01) * fu + (z01 - z00) * fv)
+    z = np.where(grid['anti_diagonal_array'][j, i], z_anti, z_main)
+
+    return [zi if ok else None for zi, ok in zip(z.tolist(), inside.tolist())]
 
 
 # =============================================================================
 # ROAD CENTERLINE EXTRACTION
 # =============================================================================
 
+def face_plan_area(face):
+    """
+    Returns the XY area of a Brep face's bounding box: a cheap proxy used to
+    rank faces by size before computing exact areas. 0.0 if the bounding
+    box is invalid.
+    """
+    bbox = face.GetBoundingBox(True)
+    if not bbox.IsValid:
+        return 0.0
+    return (bbox.Max.X - bbox.Min.X) * (bbox.Max.Y - bbox.Min.Y)
+
+
+def _centerline_from_curve(geom):
+    """Road drawn as a curve: used directly as the centerline."""
+    print("  Input type: Curve -> using as centerline directly.")
+    # Returned without a copy: the document's curve is only read
+    # downstream, and flatten_curve_to_plane always builds a new curve.
+    # Callers must not modify it.
+    return geom
+
+
+def _centerline_from_brep(geom):
+    """Road drawn as a surface: mid-isocurve of its largest face."""
+    brep = geom if isinstance(geom, rg.Brep) else geom.ToBrep()
+    if brep is None or not brep.IsValid:
+        print("  Error: Could not convert road geometry to Brep.")
+        return None
+
+    print("  Input type: Brep surface -> extracting mid-isocurve centerline.")
+
+    # Find the face with the largest area (most likely the road surface).
+    # Rank faces by their cheap plan bounding-box area and only compute
+    # the exact area of the top few.
+    largest_face   = None
+    largest_area   = -1.0
+
+    ranked = sorted(brep.Faces, key=face_plan_area, reverse=True)
+
+    for rank, face in enumerate(ranked):
+        if rank >= CENTERLINE_FACE_CANDIDATES and largest_face is not None:
+            break
+        amp = rg.AreaMassProperties.Compute(face)
+        if amp is not None and amp.Area > largest_area:
+            largest_area = amp.Area
+            largest_face = face
+
+    if largest_face is None:
+        print("  Error: Could not determine largest Brep face.")
+        return None
+
+    # Extract the V-midpoint isocurve (along the road length direction)
+    domain_u = largest_face.Domain(0)
+    domain_v = largest_face.Domain(1)
+    mid_v    = domain_v.Mid
+
+    centerline = largest_face.IsoCurve(1, mid_v)  # direction=1 → V isocurve
+    if centerline is None or not centerline.IsValid:
+        # Fallback: try U mid-isocurve
+        mid_u      = domain_u.Mid
+        centerline = largest_face.IsoCurve(0, mid_u)
+
+    if centerline is None or not centerline.IsValid:
+        print("  Error: Isocurve extraction failed.")
+        return None
+
+    return centerline
+
+
+# Centerline extractor per concrete road geometry class, so the common
+# classes resolve with one dictionary lookup. Classes not listed (e.g. other
+# Curve subclasses) fall back to an isinstance test against the base classes.
+_CENTERLINE_EXTRACTORS = {
+    rg.PolylineCurve: _centerline_from_curve,
+    rg.NurbsCurve:    _centerline_from_curve,
+    rg.PolyCurve:     _centerline_from_curve,
+    rg.LineCurve:     _centerline_from_curve,
+    rg.ArcCurve:      _centerline_from_curve,
+    rg.Brep:          _centerline_from_brep,
+    rg.Extrusion:     _centerline_from_brep,
+}
+_CENTERLINE_BASE_EXTRACTORS = (
+    (rg.Curve,                _centerline_from_curve),
+    ((rg.Brep, rg.Extrusion), _centerline_from_brep),
+)
+
+
 def extract_centerline(road_id, tolerance):
     """
     Extracts or constructs a centerline curve from the input road geometry.
@@ -477,95 +1014,274 @@ def extract_centerline(road_id, tolerance):
 
     geom = obj.Geometry
 
-    # --- Curve types: use directly ---
-    if isinstance(geom, rg.Curve):
-        print("  Input type: Curve -> using as centerline directly.")
-        return geom.DuplicateCurve()
-
-    # --- Brep / Surface: extract centerline via mid-isocurve ---
-    if isinstance(geom, (rg.Brep, rg.Extrusion)):
-        brep = geom if isinstance(geom, rg.Brep) else geom.ToBrep()
-        if brep is None or not brep.IsValid:
-            print("  Error: Could not convert road geometry to Brep.")
-            return None
+    extractor = _CENTERLINE_EXTRACTORS.get(type(geom))
+    if extractor is None:
+        for base, base_extractor in _CENTERLINE_BASE_EXTRACTORS:
+            if isinstance(geom, base):
+                extractor = base_extractor
+                break
 
-        print("  Input type: Brep surface -> extracting mid-isocurve centerline.")
+    if extractor is not None:
+        return extractor(geom)
 
-        # Find the face with the largest area (most likely the road surface)
-        largest_face   = None
-        largest_area   = -1.0
+    print("  Error: Unsupported road geometry type: {}".format(
+        type(geom).__name__
+    ))
+    return None
 
-        for face in brep.Faces:
-            amp = rg.AreaMassProperties.Compute(face)
-            if amp is not None and amp.Area > largest_area:
-                largest_area = amp.Area
-                largest_face = face
 
-        if largest_face is None:
-            print("  Error: Could not determine largest Brep face.")
-            return None
+def flatten_curve_to_plane(curve, tolerance):
+    """
+    Projects a curve to the XY plane (Z = 0) to normalize the centerline
+    to a flat, consistent starting geometry before terrain projection.
 
-        # Extract the V-midpoint isocurve (along the road length direction)
-        domain_u = largest_face.Domain(0)
-        domain_v = largest_face.Domain(1)
-        mid_v    = domain_v.Mid
+    This removes any incidental Z values the artist may have left on the
+    road curve when drawing in plan view.
 
-        centerline = largest_face.IsoCurve(1, mid_v)  # direction=1 → V isocurve
-        if centerline is None or not centerline.IsValid:
-            # Fallback: try U mid-isocurve
-            mid_u      = domain_u.Mid
-            centerline = largest_face.IsoCurve(0, mid_u)
+    Parameters
+    ----------
+    curve : Rhino.Geometry.Curve
+    tolerance : float
 
-        if centerline is None or not centerline.IsValid:
-            print("  Error: Isocurve extraction failed.")
-            return None
+    Returns
+    -------
+    Rhino.Geometry.Curve
+        A new curve with all Z values set to 0.
+    """
+    # Polylines (roads drawn with snaps) only need their vertices dropped
+    # to Z = 0, which is much cheaper than ProjectToPlane's general path
+    if isinstance(curve, rg.PolylineCurve):
+        poly = curve.ToPolyline()
+        flat = rg.Polyline(poly.Count)
+        for p in poly:
+            flat.Add(p.X, p.Y, 0.0)
+        flat_curve = rg.PolylineCurve(flat)
+        if flat_curve.IsValid:
+            return flat_curve
+
+    xy_plane  = WORLD_XY_PLANE
+    # Project the curve onto Z=0 plane using Curve.ProjectToPlane
+    flat_curve = rg.Curve.ProjectToPlane(curve, xy_plane)
+    if flat_curve is None or not flat_curve.IsValid:
+        # Fallback: return original curve unchanged
+        return curve.DuplicateCurve()
+    return flat_curve
 
-        return centerline
 
-    print("  Error: Unsupported road geometry type: {}".format(
-        type(geom).__name__
-    ))
-    return None
+# =============================================================================
+# CENTERLINE PROJECTION TO TERRAIN
+# =============================================================================
+
+def project_curve_to_brep(curve, brep_terrain, tolerance):
+    """
+    Projects a curve onto a Brep terrain along world -Z, or along +Z if
+    nothing is hit below.
+
+    Parameters
+    ----------
+    curve : Rhino.Geometry.Curve
+    brep_terrain : Rhino.Geometry.Brep
+    tolerance : float
+
+    Returns
+    -------
+    list of Rhino.Geometry.Curve
+        Empty if the projection misses in both directions.
+    """
+    for direction in (WORLD_DOWN, WORLD_UP):
+        projected = rg.Curve.ProjectToBrep(
+            curve, brep_terrain, direction, tolerance
+        )
+        if projected is not None and len(projected) > 0:
+            return list(projected)
+    return []
+
+
+def count_kinks(curve):
+    """
+    Returns the number of kinks (interior G1 discontinuities) in a curve,
+    e.g. the inner vertices of a polyline.
+
+    Parameters
+    ----------
+    curve : Rhino.Geometry.Curve
+
+    Returns
+    -------
+    int
+    """
+    domain = curve.Domain
+    t0     = domain.T0
+    kinks  = 0
+    while True:
+        found, t = curve.GetNextDiscontinuity(
+            rg.Continuity.G1_continuous, t0, domain.T1
+        )
+        if not found or t <= t0:
+            return kinks
+        kinks += 1
+        t0 = t
+
+
+def needs_tight_projection(projected, source_kinks, max_curvature):
+    """
+    Returns True if the coarse projection of a curve has more kinks than
+    the flat curve had (`source_kinks`), or any piece bends tighter than
+    `max_curvature` at any of PROJECTION_CURVATURE_SAMPLES points along
+    it, i.e. if the curve should be projected again at the document
+    tolerance.
+
+    Kinks the flat curve already has, such as the vertices of a polyline
+    road, carry over into any projection and are not counted against it.
+
+    Parameters
+    ----------
+    projected : list of Rhino.Geometry.Curve
+        Pieces of the coarse projection.
+    source_kinks : int
+        From count_kinks() on the flat curve.
+    max_curvature : float
+        1 / smallest radius accepted from the coarse projection.
+
+    Returns
+    -------
+    bool
+    """
+    if sum(count_kinks(crv) for crv in projected) > source_kinks:
+        return True
+
+    for crv in projected:
+        params = crv.DivideByCount(PROJECTION_CURVATURE_SAMPLES, True)
+        if params is None:
+            return True  # Cannot tell: project it tightly
+
+        for t in params:
+            k = crv.CurvatureAt(t)
+            if k.IsValid and k.Length > max_curvature:
+                return True
+    return False
+
+
+def project_curve_to_brep_refined(curve, brep_terrain, tolerance,
+                                  refine_radius):
+    """
+    Projects a curve onto a Brep terrain at PROJECTION_COARSE_FACTOR times
+    `tolerance`, and again at `tolerance` only if the coarse projection
+    missed or needs it (needs_tight_projection).
+
+    Roads are smooth except at a few transitions, so most of the curve
+    is fitted once, loosely, instead of to the document tolerance
+    everywhere.
+
+    Parameters
+    ----------
+    curve : Rhino.Geometry.Curve
+    brep_terrain : Rhino.Geometry.Brep
+    tolerance : float
+        Document tolerance.
+    refine_radius : float
+        Bends tighter than this radius (document units) in the coarse
+        projection trigger the tight one.
+
+    Returns
+    -------
+    list of Rhino.Geometry.Curve
+        As project_curve_to_brep().
+    """
+    coarse_tol = tolerance * PROJECTION_COARSE_FACTOR
+    if coarse_tol <= tolerance or refine_radius <= 0.0:
+        return project_curve_to_brep(curve, brep_terrain, tolerance)
+
+    projected = project_curve_to_brep(curve, brep_terrain, coarse_tol)
+    if not projected or needs_tight_projection(
+            projected, count_kinks(curve), 1.0 / refine_radius):
+        projected = project_curve_to_brep(curve, brep_terrain, tolerance)
+    return projected
+
+
+def split_curve_for_projection(curve, chunk_count):
+    """
+    Splits a curve into `chunk_count` pieces of equal arc length so they can
+    be projected independently.
+
+    Parameters
+    ----------
+    curve : Rhino.Geometry.Curve
+    chunk_count : int
+
+    Returns
+    -------
+    list of Rhino.Geometry.Curve
+        [curve] itself if it should not or could not be split.
+    """
+    if chunk_count < 2:
+        return [curve]
+
+    split_params = curve.DivideByCount(chunk_count, False)
+    if split_params is None or len(split_params) == 0:
+        return [curve]
+
+    pieces = curve.Split(split_params)
+    if pieces is None or len(pieces) < 2:
+        return [curve]
+    return list(pieces)
 
 
-def flatten_curve_to_plane(curve, tolerance):
+def _project_chunks_parallel(chunks, brep_terrain, tolerance, refine_radius):
     """
-    Projects a curve to the XY plane (Z = 0) to normalize the centerline
-    to a flat, consistent starting geometry before terrain projection.
+    Projects every centerline chunk onto the Brep terrain concurrently with
+    Parallel.For.
 
-    This removes any incidental Z values the artist may have left on the
-    road curve when drawing in plan view.
+    Each chunk is an independent, read-only query against the same terrain,
+    so the chunks are spread over all cores. Results are written into a
+    preallocated slot per chunk, keeping them in curve order.
 
     Parameters
     ----------
-    curve : Rhino.Geometry.Curve
+    chunks : list of Rhino.Geometry.Curve
+    brep_terrain : Rhino.Geometry.Brep
     tolerance : float
+    refine_radius : float
+        As for project_curve_to_brep_refined().
 
     Returns
     -------
-    Rhino.Geometry.Curve
-        A new curve with all Z values set to 0.
+    list or None
+        One entry per chunk: the list from project_curve_to_brep_refined,
+        or the Exception raised while projecting it. None if the thread
+        pool could not be used (caller projects the whole curve serially).
     """
-    xy_plane  = rg.Plane.WorldXY
-    # Project the curve onto Z=0 plane using Curve.ProjectToPlane
-    flat_curve = rg.Curve.ProjectToPlane(curve, xy_plane)
-    if flat_curve is None or not flat_curve.IsValid:
-        # Fallback: return original curve unchanged
-        return curve.DuplicateCurve()
-    return flat_curve
+    results = [None] * len(chunks)
+
+    def work(i):
+        try:
+            results[i] = project_curve_to_brep_refined(
+                chunks[i], brep_terrain, tolerance, refine_radius)
+        except Exception as ex:
+            results[i] = ex
 
+    try:
+        Parallel.For(0, len(chunks), System.Action[int](work))
+    except Exception as ex:
+        print("  Parallel projection unavailable ({}); "
+              "projecting on one thread.".format(ex))
+        return None
+    return results
 
-# =============================================================================
-# CENTERLINE PROJECTION TO TERRAIN
-# =============================================================================
 
-def project_centerline_brep(centerline_flat, brep_terrain, tolerance):
+def project_centerline_brep(centerline_flat, brep_terrain, tolerance,
+                            refine_radius):
     """
     Projects a flat centerline curve onto a Brep terrain surface using
     Rhino's built-in curve-to-surface projection.
 
     Uses Curve.ProjectToBrep() which fires rays along the world Z axis
-    from each point on the curve to find terrain intersections.
+    from each point on the curve to find terrain intersections. With
+    PROJECTION_PARALLEL the curve is split into one chunk per core, the
+    chunks are projected concurrently and the results joined; the whole
+    curve is projected in one call if that fails. Each piece is projected
+    coarsely first and refined only where it bends sharply
+    (project_curve_to_brep_refined).
 
     Parameters
     ----------
@@ -573,29 +1289,39 @@ def project_centerline_brep(centerline_flat, brep_terrain, tolerance):
         The flat (Z=0) centerline curve.
     brep_terrain : Rhino.Geometry.Brep
     tolerance : float
+    refine_radius : float
+        As for project_curve_to_brep_refined().
 
     Returns
     -------
     Rhino.Geometry.Curve or None
         The longest projected curve segment, or None if projection fails.
     """
-    projection_direction = rg.Vector3d(0.0, 0.0, -1.0)
-
-    projected_curves = rg.Curve.ProjectToBrep(
-        centerline_flat,
-        brep_terrain,
-        projection_direction,
-        tolerance
-    )
+    projected_curves = None
 
-    if projected_curves is None or len(projected_curves) == 0:
-        # Try projecting in the upward direction as fallback
-        projection_direction = rg.Vector3d(0.0, 0.0, 1.0)
-        projected_curves = rg.Curve.ProjectToBrep(
-            centerline_flat,
-            brep_terrain,
-            projection_direction,
-            tolerance
+    if PROJECTION_PARALLEL:
+        chunks = split_curve_for_projection(
+            centerline_flat, System.Environment.ProcessorCount
+        )
+        if len(chunks) > 1:
+            chunk_results = _project_chunks_parallel(
+                chunks, brep_terrain, tolerance, refine_radius
+            )
+            if chunk_results is not None and not any(
+                    isinstance(r, Exception) for r in chunk_results):
+                pieces = [crv for r in chunk_results for crv in r]
+                projected_curves = []
+                # Neighbouring chunks end on the same projected point, each
+                # to within the (possibly coarse) projection tolerance
+                if pieces:
+                    projected_curves = rg.Curve.JoinCurves(
+                        pieces,
+                        2.0 * tolerance * max(1.0, PROJECTION_COARSE_FACTOR)
+                    )
+
+    if projected_curves is None:
+        projected_curves = project_curve_to_brep_refined(
+            centerline_flat, brep_terrain, tolerance, refine_radius
         )
 
     if projected_curves is None or len(projected_curves) == 0:
@@ -616,20 +1342,22 @@ def project_centerline_brep(centerline_flat, brep_terrain, tolerance):
     return best_curve
 
 
-def project_centerline_mesh(centerline_flat, mesh_terrain, tolerance,
+def project_centerline_mesh(centerline_flat, terrain, tolerance,
                              sample_count=500):
     """
     Projects a flat centerline curve onto a Mesh terrain by sampling
-    the curve at regular parameter intervals, ray-casting each sample
+    the curve at regular parameter intervals, ray-casting the samples
     to the mesh, and rebuilding the projected curve as a polyline.
 
     This method is used when the terrain is a Mesh rather than a Brep,
-    since Curve.ProjectToBrep does not operate on meshes.
+    since Curve.ProjectToBrep does not operate on meshes. All samples are
+    cast in one cast_rays_to_terrain() call rather than one MeshRay each.
 
     Parameters
     ----------
     centerline_flat : Rhino.Geometry.Curve
-    mesh_terrain : Rhino.Geometry.Mesh
+    terrain : dict
+        From prepare_terrain(), with Mesh geometry.
     tolerance : float
     sample_count : int
         Number of parameter samples along the curve. Higher = smoother
@@ -638,51 +1366,48 @@ def project_centerline_mesh(centerline_flat, mesh_terrain, tolerance,
     Returns
     -------
     Rhino.Geometry.Curve or None
-        A PolylineCurve following the mesh terrain, or None on failure.
+        A cubic curve through the terrain hits (a PolylineCurve if the
+        interpolation fails), or None on failure.
     """
+    # Uniform parameter steps, generated here rather than asking the curve
+    # for each one with Domain.ParameterAt
     domain = centerline_flat.Domain
-    t_vals = [
-        domain.ParameterAt(float(i) / (sample_count - 1))
-        for i in range(sample_count)
-    ]
-
-    ray_dir = rg.Vector3d(0.0, 0.0, -1.0)
-    points_3d = []
-
-    for t in t_vals:
-        pt_flat = centerline_flat.PointAt(t)
-
-        ray_origin = rg.Point3d(pt_flat.X, pt_flat.Y, RAY_CAST_DISTANCE)
-        ray        = rg.Ray3d(ray_origin, ray_dir)
+    t0     = domain.T0
+    t_step = (domain.T1 - t0) / (sample_count - 1)
 
-        hit_t = ri.Intersection.MeshRay(mesh_terrain, ray)
-        if hit_t >= 0.0:
-            hit_pt = ray_origin + ray_dir * hit_t
-            points_3d.append(hit_pt)
+    xs = [0.0] * sample_count
+    ys = [0.0] * sample_count
+    for i in range(sample_count):
+        pt_flat = centerline_flat.PointAt(t0 + i * t_step)
+        xs[i] = pt_flat.X
+        ys[i] = pt_flat.Y
 
-    if len(points_3d) < 2:
-        return None
+    z_values  = cast_rays_to_terrain(terrain, xs, ys, tolerance)
+    points_3d = System.Collections.Generic.List[rg.Point3d](sample_count)
 
-    # Build a polyline from hit points and convert to a smooth NurbsCurve
-    polyline = rg.Polyline(points_3d)
-    poly_crv  = polyline.ToNurbsCurve()
+    for x, y, z in zip(xs, ys, z_values):
+        if z is not None:
+            points_3d.Add(rg.Point3d(x, y, z))
 
-    if poly_crv is None or not poly_crv.IsValid:
+    if points_3d.Count < 2:
         return None
 
-    # Fit a smooth curve through the polyline points to avoid sharp kinks
+    # Fit a smooth curve through the hit points to avoid sharp kinks
     smooth = rg.Curve.CreateInterpolatedCurve(
-        [polyline[i] for i in range(polyline.Count)],
+        points_3d,
         3,          # degree 3 (cubic)
         rg.CurveKnotStyle.ChordPeriodic if centerline_flat.IsClosed
         else rg.CurveKnotStyle.Chord
     )
+    if smooth and smooth.IsValid:
+        return smooth
 
-    return smooth if (smooth and smooth.IsValid) else poly_crv
+    # Fall back to the polyline through the hit points
+    poly_crv = rg.PolylineCurve(points_3d)
+    return poly_crv if poly_crv.IsValid else None
 
 
-def project_centerline_to_terrain(centerline, terrain_geom, terrain_type,
-                                   tolerance):
+def project_centerline_to_terrain(centerline, terrain, tolerance, road_width):
     """
     Dispatches centerline projection to the appropriate method based on
     terrain type (Brep or Mesh).
@@ -696,21 +1421,30 @@ def project_centerline_to_terrain(centerline, terrain_geom, terrain_type,
     ----------
     centerline : Rhino.Geometry.Curve
         The raw centerline (may have Z values from user input).
-    terrain_geom : Brep or Mesh
-    terrain_type : str ('brep' or 'mesh')
+    terrain : dict
+        From prepare_terrain().
     tolerance : float
+    road_width : float
+        Scales the bend radius below which a Brep projection is refined
+        (PROJECTION_REFINE_RADIUS).
 
     Returns
     -------
     Rhino.Geometry.Curve or None
         The 3D projected centerline. None if projection fails.
     """
+    terrain_geom = terrain['geom']
+    terrain_type = terrain['type']
+
     print("  Flattening centerline to XY plane before projection...")
     flat_cl = flatten_curve_to_plane(centerline, tolerance)
 
     if terrain_type == 'brep':
         print("  Projecting onto Brep terrain (Curve.ProjectToBrep)...")
-        return project_centerline_brep(flat_cl, terrain_geom, tolerance)
+        return project_centerline_brep(
+            flat_cl, terrain_geom, tolerance,
+            PROJECTION_REFINE_RADIUS * road_width
+        )
 
     elif terrain_type == 'mesh':
         print("  Projecting onto Mesh terrain (ray-sampling method)...")
@@ -718,7 +1452,7 @@ def project_centerline_to_terrain(centerline, terrain_geom, terrain_type,
         flat_len  = flat_cl.GetLength()
         n_samples = max(50, int(flat_len / 0.5))
         return project_centerline_mesh(
-            flat_cl, terrain_geom, tolerance, n_samples
+            flat_cl, terrain, tolerance, n_samples
         )
 
     print("  Error: Unknown terrain type '{}'.".format(terrain_type))
@@ -729,50 +1463,85 @@ def project_centerline_to_terrain(centerline, terrain_geom, terrain_type,
 # CENTERLINE SAMPLING WITH TERRAIN DATA
 # =============================================================================
 
-def sample_curve_with_terrain_data(projected_curve, terrain_geom, terrain_type,
-                                    spacing, tolerance):
+def arc_length_parameters(curve, curve_length, spacing, tolerance):
     """
-    Divides the projected 3D centerline into stations at the specified
-    spacing, and collects terrain data at each station.
+    Returns the curve parameters at arc lengths 0, spacing, 2 * spacing, ...
+    along `curve`, followed by the parameter of the curve end.
+
+    Parameters
+    ----------
+    curve : Rhino.Geometry.Curve
+    curve_length : float
+        curve.GetLength(), already known to the caller.
+    spacing : float
+    tolerance : float
+
+    Returns
+    -------
+    list of float or None
+        None if the parameters could not be computed.
+    """
+    if spacing <= 0.0 or curve_length <= 0.0:
+        return None
+
+    count = int(curve_length / spacing) + 1
+    fractions = [i * spacing / curve_length for i in range(count)]
+    # Finish on the curve end, unless the last station already sits on it
+    if curve_length - (count - 1) * spacing > tolerance:
+        fractions.append(1.0)
+
+    try:
+        params = curve.NormalizedLengthParameters(
+            System.Array[float](fractions), tolerance
+        )
+    except Exception:
+        return None
+    return list(params) if params is not None else None
+
 
-    At each sample point the function records:
-    - Point3d   : the 3D location on the projected centerline
-    - Tangent   : unit tangent vector of the centerline at that parameter
-    - Normal    : terrain surface normal at that XY location
-    - Parameter : curve parameter t (for reference)
+def sample_centerline_stations(projected_curve, spacing, tolerance):
+    """
+    Divides the projected 3D centerline into stations at the specified
+    spacing, recording only what the curve itself gives: the parameter,
+    point and unit tangent of each station.
 
-    Design note on normal estimation:
-        The terrain normal is estimated from the projected centerline point's
-        XY coordinates, NOT from the Brep parameter space, because the road
-        may be passing over multiple Brep faces and we want a consistent
-        cross-section orientation strategy.
+    The stations are returned as a structure of arrays: one flat list per
+    field, station i at index i of every list. Each coordinate is read
+    from RhinoCommon once, here, and bulk consumers (see
+    layout_all_cross_sections) take whole columns instead of walking one
+    record per station.
 
     Parameters
     ----------
     projected_curve : Rhino.Geometry.Curve
         The 3D centerline following the terrain surface.
-    terrain_geom : Brep or Mesh
-    terrain_type : str
     spacing : float
         Distance between sample stations (document units).
     tolerance : float
 
     Returns
     -------
-    list of dict, each with keys:
-        't'       : float  - curve parameter
-        'point'   : Point3d
-        'tangent' : Vector3d (unit)
-        'normal'  : Vector3d (unit, terrain surface normal)
+    dict of lists of float, keys:
+        't'              : curve parameter
+        'x', 'y', 'z'    : station point
+        'tx', 'ty', 'tz' : unit tangent
+        All lists are empty if the curve could not be sampled.
     """
+    columns = dict((key, []) for key in ('t', 'x', 'y', 'z', 'tx', 'ty', 'tz'))
+
     crv_length = projected_curve.GetLength()
     if crv_length < tolerance:
         print("  Error: Projected centerline is degenerate (length ~0).")
-        return []
+        return columns
 
-    # Generate parameter array at equal chord-length intervals
-    # We use DivideByLength which gives arc-length parameterisation
-    params = projected_curve.DivideByLength(spacing, includeEnds=True)
+    # Stations at equal arc-length intervals, plus the curve end. All the
+    # arc lengths are turned into curve parameters in one
+    # NormalizedLengthParameters call instead of a DivideByLength pass.
+    params = arc_length_parameters(projected_curve, crv_length, spacing,
+                                   tolerance)
+
+    if params is None or len(params) == 0:
+        params = projected_curve.DivideByLength(spacing, includeEnds=True)
 
     if params is None or len(params) == 0:
         # Fallback: divide into at least 2 segments
@@ -782,130 +1551,234 @@ def sample_curve_with_terrain_data(projected_curve, terrain_geom, terrain_type,
             domain = projected_curve.Domain
             params = [domain.Min, domain.Max]
 
-    stations = []
+    col_t,  col_x,  col_y,  col_z  = (columns['t'], columns['x'],
+                                      columns['y'], columns['z'])
+    col_tx, col_ty, col_tz = columns['tx'], columns['ty'], columns['tz']
 
     for t in params:
-        pt = projected_curve.PointAt(t)
+        # One FrameAt call gives both the point (origin) and the unit
+        # tangent (X axis) instead of separate PointAt / TangentAt calls;
+        # it fails where the tangent is undefined
+        ok, frame = projected_curve.FrameAt(t)
+        if not ok:
+            continue
+
+        pt = frame.Origin
         if not pt.IsValid:
             continue
 
-        # Curve tangent at this parameter (unit vector)
-        tangent_raw = projected_curve.TangentAt(t)
+        tangent_raw = frame.XAxis
         if tangent_raw.IsZero:
             continue
-        tangent_raw.Unitize()
 
-        # Terrain normal at the XY location of this station
-        normal = estimate_terrain_normal_at_xy(
-            terrain_geom, terrain_type,
-            pt.X, pt.Y,
-            tolerance
-        )
+        col_t.append(t)
+        col_x.append(pt.X)
+        col_y.append(pt.Y)
+        col_z.append(pt.Z)
+        col_tx.append(tangent_raw.X)
+        col_ty.append(tangent_raw.Y)
+        col_tz.append(tangent_raw.Z)
 
-        stations.append({
-            't':       t,
-            'point':   pt,
-            'tangent': tangent_raw,
-            'normal':  normal
-        })
-
-    return stations
+    return columns
 
 
 # =============================================================================
 # CROSS-SECTION GENERATION
 # =============================================================================
 
-def build_cross_section_plane(point, tangent, normal, tolerance):
+def cross_section_axis(tx, ty, tolerance):
+    """
+    Returns the horizontal unit X axis of a station's cross-section from
+    the tangent's X and Y alone: world Z crossed with the unit horizontal
+    tangent is (-ty, tx). Where the tangent is near vertical, world X
+    stands in for it.
+
+    Only this axis is needed to lay out a section, so no Plane is built
+    per station.
+
+    Parameters
+    ----------
+    tx, ty : float
+        X and Y of the station tangent.
+    tolerance : float
+
+    Returns
+    -------
+    tuple of (float, float)
+    """
+    length = math.hypot(tx, ty)
+    if length < tolerance:
+        return 0.0, 1.0
+    return -ty / length, tx / length
+
+
+def cross_section_offsets(road_width, num_points):
+    """
+    Returns the offsets of the cross-section profile points along the
+    section, from the left edge (-width/2) to the right edge (+width/2),
+    distributed symmetrically about the centre.
+
+    They are the same for every station, so callers compute them once per
+    road.
+
+    Parameters
+    ----------
+    road_width : float
+    num_points : int
+        Number of profile points (raised to 3 if smaller).
+
+    Returns
+    -------
+    list of float
     """
-    Constructs a Rhino.Geometry.Plane for a cross-section at the given
-    station on the projected centerline.
+    half_w = road_width * 0.5
+    if num_points < 3:
+        num_points = 3
+
+    offsets = []
+    for i in range(num_points):
+        # Symmetric distribution centred at 0.0
+        t_norm = float(i) / (num_points - 1)        # 0.0 to 1.0
+        offsets.append(-half_w + t_norm * road_width)  # -w/2 to +w/2
 
-    The plane is defined so that:
-    - Origin = station point on the projected centerline
-    - X axis = cross-section direction (perpendicular to road in horizontal plane)
-    - Y axis = road slope direction (banking angle from terrain)
-    - Z axis = tangent direction (road travel direction)
+    return offsets
 
-    Strategy for cross-section direction (FIXED):
-        The cross-section X axis MUST be perpendicular to the road tangent
-        in the HORIZONTAL plane (XY plane). This ensures all cross-sections
-        are parallel and don't twist.
 
-        Then we apply banking based on terrain slope, but the perpendicular
-        direction stays constant.
+def layout_cross_section(station, road_width, num_points, tolerance,
+                         offsets=None):
+    """
+    Lays out the profile points of a station's cross-section, before they
+    are dropped onto the terrain.
 
-    This creates a "ribbon" that follows the road centerline, with consistent
-    width offset on both sides, that banks with the terrain slope.
+    The points run from the left edge (-width/2) to the right edge
+    (+width/2) along the station's cross-section axis, distributed
+    symmetrically about the station point.
 
     Parameters
     ----------
-    point   : Rhino.Geometry.Point3d
-    tangent : Rhino.Geometry.Vector3d (unit)
-    normal  : Rhino.Geometry.Vector3d (unit)
+    station : dict
+        Station with 'point' and 'tangent' (see
+        sample_centerline_stations()).
+    road_width : float
+    num_points : int
+        Number of profile points (raised to 3 if smaller).
     tolerance : float
+    offsets : list of float or None
+        From cross_section_offsets(), if the caller already has them.
 
     Returns
     -------
-    Rhino.Geometry.Plane or None
+    list of (float, float, float)
+        (offset along the section, x, y) per profile point.
     """
-    # Project tangent to horizontal plane (remove Z component)
-    tangent_horizontal = rg.Vector3d(tangent.X, tangent.Y, 0.0)
+    pt      = station['point']
+    tangent = station['tangent']
 
-    # If tangent is nearly vertical (straight up/down), use world X as reference
-    if tangent_horizontal.Length < tolerance:
-        tangent_horizontal = rg.Vector3d(1.0, 0.0, 0.0)
-    else:
-        tangent_horizontal.Unitize()
-
-    # Cross-section X axis: perpendicular in horizontal plane (Z cross tangent_h)
-    world_z = rg.Vector3d(0.0, 0.0, 1.0)
-    cross_dir = rg.Vector3d.CrossProduct(world_z, tangent_horizontal)
-    cross_dir.Unitize()
-
-    # Now we have a consistent perpendicular direction that doesn't twist
-    # Apply banking: rotate up_axis toward terrain normal by terrain slope angle
-    world_up = rg.Vector3d(0.0, 0.0, 1.0)
-
-    # Banking angle: how much to tilt from vertical based on terrain slope
-    # Get angle between vertical (world Z) and terrain normal
-    dot_product = rg.Vector3d.DotProduct(world_up, normal)
-    # Clamp to avoid numerical issues
-    dot_product = max(-1.0, min(1.0, dot_product))
-    banking_angle_rad = math.acos(dot_product)
-
-    # Banking direction is perpendicular to both cross_dir and tangent
-    banking_dir = rg.Vector3d.CrossProduct(cross_dir, tangent)
-    banking_dir.Unitize()
-
-    # Rotate world_up by banking angle around cross_dir
-    # Use Rodrigues rotation formula or just lerp for simplicity
-    # Actually, for a plane, we just need the Y axis to point upslope
-    up_axis = world_up
-    # Blend toward terrain normal based on slope
-    slope_factor = 1.0 - dot_product  # 0 = flat, 1 = vertical
-    if slope_factor > tolerance:
-        up_axis = world_up * (1.0 - slope_factor * 0.5) + normal * (slope_factor * 0.5)
-        up_axis.Unitize()
-
-    # Create plane with consistent cross direction
-    try:
-        plane = rg.Plane(point, cross_dir, up_axis)
-        if not plane.IsValid:
-            return None
-        return plane
-    except:
-        return None
+    # Distribute profile points from -half_width to +half_width
+    if offsets is None:
+        offsets = cross_section_offsets(road_width, num_points)
+
+    # Station point and section axis as plain floats, so each profile point
+    # is two multiply-adds instead of a temporary Vector3d and Point3d
+    ox, oy = pt.X, pt.Y
+    ax, ay = cross_section_axis(tangent.X, tangent.Y, tolerance)
+
+    layout = []
+    for offset in offsets:
+        # Translate station point along the cross-section X axis
+        layout.append((offset, ox + ax * offset, oy + ay * offset))
+
+    return layout
+
+
+def layout_all_cross_sections(stations, road_width, num_points, tolerance):
+    """
+    Lays out the cross-section profile points of every station.
+
+    Works on the station columns from sample_centerline_stations(). With
+    NumPy the point and tangent columns become arrays directly and every
+    profile point is placed in a single broadcast; otherwise each station
+    is laid out with plain float arithmetic.
+
+    The cross-section X axis is world Z crossed with the horizontal
+    tangent (see cross_section_axis), so the layout depends only
+    on each station's point and tangent.
+
+    Parameters
+    ----------
+    stations : dict of lists
+        Station columns from sample_centerline_stations().
+    road_width : float
+    num_points : int
+    tolerance : float
+
+    Returns
+    -------
+    tuple (layouts, all_x, all_y)
+        layouts : list of list
+            One layout per station, as returned by layout_cross_section().
+        all_x, all_y : list of float
+            X and Y of every laid-out profile point, station by station,
+            ready for one batched cast_rays_to_terrain() call.
+    """
+    # The profile offsets are the same at every station
+    offset_list = cross_section_offsets(road_width, num_points)
+
+    col_x,  col_y  = stations['x'],  stations['y']
+    col_tx, col_ty = stations['tx'], stations['ty']
+
+    if not _NUMPY_AVAILABLE or not col_x:
+        layouts = []
+        all_x   = []
+        all_y   = []
+        for i in range(len(col_x)):
+            ox, oy = col_x[i], col_y[i]
+            ax, ay = cross_section_axis(col_tx[i], col_ty[i], tolerance)
+
+            layout = []
+            for offset in offset_list:
+                x = ox + ax * offset
+                y = oy + ay * offset
+                layout.append((offset, x, y))
+                all_x.append(x)
+                all_y.append(y)
+            layouts.append(layout)
+        return layouts, all_x, all_y
+
+    # The station columns are already a structure of arrays
+    points   = np.column_stack((col_x, col_y))
+    tangents = np.column_stack((col_tx, col_ty))
+
+    # Horizontal unit tangent; world X where the tangent is near vertical
+    lengths = np.hypot(tangents[:, 0], tangents[:, 1])
+    steep   = lengths < tolerance
+    tangents[steep] = (1.0, 0.0)
+    lengths[steep]  = 1.0
+    tangents /= lengths[:, None]
+
+    # World Z x (tx, ty, 0) = (-ty, tx, 0)
+    cross_dirs = np.column_stack((-tangents[:, 1], tangents[:, 0]))
+
+    offsets = np.array(offset_list)
+    xy = points[:, None, :] + cross_dirs[:, None, :] * offsets[None, :, None]
+
+    # Every station has a layout here, so the flat coordinate columns are
+    # the (N, M) X and Y planes of the array, raveled
+    layouts = [
+        [(offset, x, y) for offset, (x, y) in zip(offset_list, rows)]
+        for rows in xy.tolist()
+    ]
+    return layouts, xy[:, :, 0].ravel().tolist(), xy[:, :, 1].ravel().tolist()
 
 
-def create_cross_section_curve(station, road_width, num_points,
-                                terrain_geom, terrain_type,
-                                height_offset, tolerance):
+def create_cross_section_curve(station, road_width, num_points, terrain,
+                                height_offset, tolerance, layout=None,
+                                terrain_z=None, base_z=None):
     """
     Generates a single cross-section profile curve at a terrain station.
 
     The cross-section runs from left edge (-width/2) to right edge (+width/2)
-    along the cross-section plane's X axis, with the specified number of
+    along the station's cross-section axis, with the specified number of
     profile points distributed symmetrically.
 
     For each edge/profile point:
@@ -917,76 +1790,77 @@ def create_cross_section_curve(station, road_width, num_points,
     Parameters
     ----------
     station : dict
-        Entry from sample_curve_with_terrain_data() containing
-        'point', 'tangent', 'normal', 't'.
+        Station with 'point' and 'tangent' (see
+        sample_centerline_stations()).
     road_width : float
         Total road width (left edge to right edge).
     num_points : int
         Number of profile points (must be odd and >= 3).
         3 = L, C, R; 5 = L, LS, C, RS, R.
-    terrain_geom : Brep or Mesh
-    terrain_type : str
+    terrain : dict
+        From prepare_terrain().
     height_offset : float
         Constant Z lift above terrain surface.
     tolerance : float
+    layout : list or None
+        From layout_cross_section(), if the caller already has it.
+    terrain_z : list of (float or None) or None
+        Terrain Z under each layout point, if the caller already ray-cast
+        them (see generate_all_cross_sections); otherwise cast here.
+    base_z : float or None
+        Station height, used for profile points that miss the terrain.
+        Read from station['point'] if None. `station` itself may be None
+        when `layout`, `terrain_z` and `base_z` are all given.
 
     Returns
     -------
     Rhino.Geometry.Curve or None
-        A degree-3 interpolated curve through the profile points,
-        or None if insufficient terrain hits to construct the profile.
+        A degree-3 interpolated curve through the profile points (the
+        polyline through them for 3-point profiles), or None if
+        insufficient terrain hits to construct the profile.
     """
-    pt      = station['point']
-    tangent = station['tangent']
-    normal  = station['normal']
+    if base_z is None:
+        base_z = station['point'].Z
 
-    # Build the cross-section reference plane
-    plane = build_cross_section_plane(pt, tangent, normal, tolerance)
-    if plane is None:
-        return None
-
-    # Distribute profile points from -half_width to +half_width
-    half_w   = road_width * 0.5
-    offsets  = []
-    if num_points < 3:
-        num_points = 3
-
-    for i in range(num_points):
-        # Symmetric distribution centred at 0.0
-        t_norm  = float(i) / (num_points - 1)       # 0.0 to 1.0
-        offset  = -half_w + t_norm * road_width      # -w/2 to +w/2
-        offsets.append(offset)
-
-    profile_points = []
-
-    for offset in offsets:
-        # Translate station point along the cross-section X axis
-        world_pt = pt + plane.XAxis * offset
+    if layout is None:
+        layout = layout_cross_section(station, road_width, num_points,
+                                      tolerance)
+        if layout is None:
+            return None
 
-        # Ray-cast to terrain at this XY location to get true Z
-        z_terrain = cast_ray_to_terrain(
-            terrain_geom, terrain_type,
-            world_pt.X, world_pt.Y,
+    # Ray-cast to terrain at each profile point's XY location to get true Z
+    if terrain_z is None:
+        terrain_z = cast_rays_to_terrain(
+            terrain,
+            [x for (_, x, _) in layout],
+            [y for (_, _, y) in layout],
             tolerance
         )
 
+    # Every layout point yields exactly one profile point (misses fall
+    # back to the station height), so the points are written straight into
+    # a .NET Point3d[] of that size. Interpolation and Polyline then take
+    # it as is, instead of marshalling a Python list on every call.
+    profile_points = System.Array.CreateInstance(rg.Point3d, len(layout))
+
+    for i, ((_, x, y), z_terrain) in enumerate(zip(layout, terrain_z)):
         if z_terrain is not None:
-            final_pt = rg.Point3d(world_pt.X, world_pt.Y,
-                                   z_terrain + height_offset)
+            final_pt = rg.Point3d(x, y, z_terrain + height_offset)
         else:
-            # If the edge point misses terrain, project from the station
-            # point Z with a Z offset proportional to terrain normal slope
-            slope_z = (offset / half_w) * (
-                normal.Z if abs(normal.Z) > tolerance else 1.0
-            )
-            final_pt = rg.Point3d(world_pt.X, world_pt.Y,
-                                   pt.Z + height_offset)
+            # If the edge point misses terrain, keep it level with the
+            # station point
+            final_pt = rg.Point3d(x, y, base_z + height_offset)
 
-        profile_points.append(final_pt)
+        profile_points[i] = final_pt
 
     if len(profile_points) < 2:
         return None
 
+    # Left / centre / right profiles are lofted as the polyline through
+    # them: three points carry no curvature information to interpolate
+    if len(profile_points) <= 3:
+        return rg.Polyline(profile_points).ToNurbsCurve()
+
     # Interpolate a smooth curve through the profile points
     degree  = min(3, len(profile_points) - 1)
     section_crv = rg.Curve.CreateInterpolatedCurve(
@@ -1003,8 +1877,45 @@ def create_cross_section_curve(station, road_width, num_points,
     return section_crv
 
 
-def generate_all_cross_sections(stations, road_width, num_points,
-                                  terrain_geom, terrain_type,
+def _build_sections_parallel(build, count):
+    """
+    Runs build(i) for every station index with Parallel.For.
+
+    Each station's curve only depends on its own layout and terrain
+    heights, so the stations are spread over all cores. Results are written
+    into a preallocated slot per station, keeping them in road order.
+
+    Parameters
+    ----------
+    build : callable
+        build(i) -> Rhino.Geometry.Curve or None
+    count : int
+
+    Returns
+    -------
+    list or None
+        One entry per station: the curve (or None where building failed),
+        or the Exception raised while building it. None if the thread pool
+        could not be used (caller builds serially).
+    """
+    results = [None] * count
+
+    def work(i):
+        try:
+            results[i] = build(i)
+        except Exception as ex:
+            results[i] = ex
+
+    try:
+        Parallel.For(0, count, System.Action[int](work))
+    except Exception as ex:
+        print("  Parallel cross-sections unavailable ({}); "
+              "building on one thread.".format(ex))
+        return None
+    return results
+
+
+def generate_all_cross_sections(stations, road_width, num_points, terrain,
                                   height_offset, tolerance):
     """
     Generates cross-section curves for every station on the projected
@@ -1014,45 +1925,90 @@ def generate_all_cross_sections(stations, road_width, num_points,
     to produce a valid section are skipped with a warning; the loft will
     still proceed with the remaining valid sections.
 
+    The curves are built on all cores (CROSS_SECTION_PARALLEL) after one
+    batched ray-cast; only the serial fallback reports progress per 10%.
+
     Parameters
     ----------
-    stations : list of dict
-        Output of sample_curve_with_terrain_data().
+    stations : dict of lists
+        Station columns from sample_centerline_stations().
     road_width : float
     num_points : int
-    terrain_geom : Brep or Mesh
-    terrain_type : str
+    terrain : dict
+        From prepare_terrain().
     height_offset : float
     tolerance : float
 
     Returns
     -------
     list of Rhino.Geometry.Curve
-        Valid cross-section curves; length may be less than len(stations)
-        if some stations failed.
+        Valid cross-section curves; fewer than there are stations if some
+        stations failed.
     """
     sections = []
-    n_total  = len(stations)
+    col_z    = stations['z']
+    n_total  = len(col_z)
     n_failed = 0
 
-    for idx, station in enumerate(stations):
-        section = create_cross_section_curve(
-            station, road_width, num_points,
-            terrain_geom, terrain_type,
-            height_offset, tolerance
+    # Lay out every station's profile first, so the terrain is ray-cast for
+    # all profile points of all stations in one batched call over two flat
+    # coordinate columns; the Z values are handed back per station by slice
+    layouts, all_x, all_y = layout_all_cross_sections(
+        stations, road_width, num_points, tolerance
+    )
+    all_z = cast_rays_to_terrain(terrain, all_x, all_y, tolerance)
+
+    station_z = [None] * n_total
+    cursor    = 0
+    for idx, layout in enumerate(layouts):
+        if layout is not None:
+            station_z[idx] = all_z[cursor:cursor + len(layout)]
+            cursor        += len(layout)
+
+    def build(idx):
+        if layouts[idx] is None:
+            return None
+        return create_cross_section_curve(
+            None, road_width, num_points, terrain,
+            height_offset, tolerance,
+            layout=layouts[idx], terrain_z=station_z[idx], base_z=col_z[idx]
         )
 
-        if section is not None and section.IsValid:
+    results = None
+    if CROSS_SECTION_PARALLEL and n_total > 1:
+        results = _build_sections_parallel(build, n_total)
+
+    if results is not None:
+        # Errors raised on a worker thread surface here, as they would
+        # have on the serial path
+        for section in results:
+            if isinstance(section, Exception):
+                raise section
+        print("  Cross-sections: {0}/{0} (100%)".format(n_total))
+    else:
+        # Print progress at 10% intervals for long roads: the next count to
+        # report is tracked instead of taking a modulo every station
+        progress_interval = max(1, n_total // 10)
+        next_report       = progress_interval
+
+        results = []
+        for idx in range(n_total):
+            results.append(build(idx))
+
+            done = idx + 1
+            if done == next_report or done == n_total:
+                next_report += progress_interval
+                pct = int(100.0 * done / n_total)
+                print("  Cross-sections: {}/{} ({}%)".format(done, n_total, pct))
+
+    # create_cross_section_curve() returns None for stations it could not
+    # build, so the curves are not validated a second time here
+    for section in results:
+        if section is not None:
             sections.append(section)
         else:
             n_failed += 1
 
-        # Print progress at 10% intervals for long roads
-        progress_interval = max(1, n_total // 10)
-        if (idx + 1) % progress_interval == 0 or (idx + 1) == n_total:
-            pct = int(100.0 * (idx + 1) / n_total)
-            print("  Cross-sections: {}/{} ({}%)".format(idx + 1, n_total, pct))
-
     if n_failed > 0:
         print("  Warning: {} station(s) failed cross-section "
               "generation.".format(n_failed))
@@ -1060,6 +2016,49 @@ def generate_all_cross_sections(stations, road_width, num_points,
     return sections
 
 
+def sample_and_section(projected_curve, terrain, spacing, road_width,
+                       num_points, height_offset, tolerance):
+    """
+    Samples the projected centerline into stations and builds the
+    cross-section of each, in one pass from the curve to the curves.
+
+    The section layout depends only on each station's point and tangent
+    (see layout_all_cross_sections), and the profile heights are ray-cast
+    at the profile points themselves. The stations are therefore taken
+    straight from sample_centerline_stations(): no terrain normal is
+    estimated and no ray is cast at the station points.
+
+    Parameters
+    ----------
+    projected_curve : Rhino.Geometry.Curve
+    terrain : dict
+        From prepare_terrain().
+    spacing : float
+    road_width : float
+    num_points : int
+    height_offset : float
+    tolerance : float
+
+    Returns
+    -------
+    tuple (station_count, sections)
+        Number of stations sampled, and the valid cross-section curves as
+        returned by generate_all_cross_sections(). (0, []) if the curve
+        could not be sampled.
+    """
+    stations   = sample_centerline_stations(projected_curve, spacing, tolerance)
+    n_stations = len(stations['t'])
+    if n_stations == 0:
+        return 0, []
+
+    print("  Stations created: {}".format(n_stations))
+
+    sections = generate_all_cross_sections(
+        stations, road_width, num_points, terrain, height_offset, tolerance
+    )
+    return n_stations, sections
+
+
 # =============================================================================
 # LOFTING
 # =============================================================================
@@ -1071,11 +2070,19 @@ def unify_cross_section_directions(sections):
 
     Strategy:
     - The first section is the reference.
-    - For each subsequent section, if its start point is closer to the
-      previous section's end point than start point, reverse it.
+    - Each section's direction is the vector from its start point to its
+      end point. Where it points against the previous section's
+      direction (negative dot product), the orientation flips relative to
+      the reference; a section is reversed when an odd number of such
+      flips precede it.
     - This handles cases where the road turns sharply and the cross-section
       orientation flips.
 
+    With NumPy the dot products and the running flip parity are computed
+    for all sections in one vectorised pass. The sections are reversed in
+    place rather than duplicated: they are the curves
+    generate_all_cross_sections() just built, owned by the caller.
+
     Parameters
     ----------
     sections : list of Rhino.Geometry.Curve
@@ -1083,36 +2090,42 @@ def unify_cross_section_directions(sections):
     Returns
     -------
     list of Rhino.Geometry.Curve
-        Curves with consistent orientation.
+        The same curves, now with consistent orientation.
     """
-    if len(sections) < 2:
+    n_sec = len(sections)
+    if n_sec < 2:
         return sections
 
-    corrected = [sections[0]]
-
-    for i in range(1, len(sections)):
-        prev_crv   = corrected[i - 1]
-        curr_crv   = sections[i]
-
-        prev_end   = prev_crv.PointAtEnd
-        curr_start = curr_crv.PointAtStart
-        curr_end   = curr_crv.PointAtEnd
-
-        dist_start = prev_end.DistanceTo(curr_start)
-        dist_end   = prev_end.DistanceTo(curr_end)
-
-        if dist_end < dist_start:
-            # Reverse this section so it aligns with the previous
-            reversed_crv = curr_crv.DuplicateCurve()
-            reversed_crv.Reverse()
-            corrected.append(reversed_crv)
-        else:
-            corrected.append(curr_crv)
+    # Start-to-end direction of every section, endpoints read once each
+    dirs = []
+    for crv in sections:
+        a = crv.PointAtStart
+        b = crv.PointAtEnd
+        dirs.append((b.X - a.X, b.Y - a.Y, b.Z - a.Z))
+
+    if _NUMPY_AVAILABLE:
+        d     = np.array(dirs)
+        dots  = np.einsum('ij,ij->i', d[1:], d[:-1])
+        flips = (np.cumsum(dots < 0.0) % 2 == 1).tolist()
+    else:
+        flips   = []
+        flipped = False
+        for i in range(1, n_sec):
+            p = dirs[i - 1]
+            c = dirs[i]
+            if p[0] * c[0] + p[1] * c[1] + p[2] * c[2] < 0.0:
+                flipped = not flipped
+            flips.append(flipped)
+
+    for crv, flip in zip(sections[1:], flips):
+        if flip:
+            # Reverse this section so it aligns with the first
+            crv.Reverse()
 
-    return corrected
+    return sections
 
 
-def create_road_surface(sections, tolerance):
+def create_road_surface(sections, tolerance, fast=False):
     """
     Lofts the cross-section curves into a continuous NURBS road surface.
 
@@ -1121,15 +2134,25 @@ def create_road_surface(sections, tolerance):
     positions are within tolerance of each other (loop road).
 
     Loft configuration:
-    - Type: Normal (smooth interpolation, not ruled/straight-line)
+    - Type: Normal (smooth interpolation, not ruled/straight-line), or
+      Straight if `fast` is set. An open loft through only two sections is
+      ruled whatever the type, so it is always made Straight, skipping
+      the general surface fit.
     - Closed: auto-detected from start/end proximity
     - SplitAtTangents: False (avoids unwanted seams on curved roads)
 
+    The sections are not rebuilt to a common point count first: every
+    section of a run is built through the same number of profile points
+    (uniform knots, or a polyline for 3-point profiles), so they already
+    share one knot vector.
+
     Parameters
     ----------
     sections : list of Rhino.Geometry.Curve
         Cross-section curves, must be direction-unified before calling.
     tolerance : float
+    fast : bool
+        Ruled (Straight) loft between neighbouring sections; see FAST_LOFT.
 
     Returns
     -------
@@ -1141,17 +2164,32 @@ def create_road_surface(sections, tolerance):
               "(have {}, need {}).".format(len(sections), MIN_SECTIONS_FOR_LOFT))
         return None
 
-    # Detect if the road is a closed loop
+    # Detect if the road is a closed loop (squared distance, no sqrt)
     first_start = sections[0].PointAtStart
     last_end    = sections[-1].PointAtEnd
-    is_closed   = first_start.DistanceTo(last_end) < tolerance * 10
+    dx = first_start.X - last_end.X
+    dy = first_start.Y - last_end.Y
+    dz = first_start.Z - last_end.Z
+    close_tol = tolerance * 10.0
+    is_closed = dx * dx + dy * dy + dz * dz < close_tol * close_tol
+
+    # Typed .NET list, so the loft receives an IEnumerable<Curve> without
+    # IronPython converting the Python list element by element
+    section_list = System.Collections.Generic.List[rg.Curve](len(sections))
+    for section in sections:
+        section_list.Add(section)
+
+    if fast or (len(sections) == 2 and not is_closed):
+        loft_type = rg.LoftType.Straight
+    else:
+        loft_type = rg.LoftType.Normal
 
     try:
         loft_breps = rg.Brep.CreateFromLoft(
-            sections,
+            section_list,
             rg.Point3d.Unset,   # no start point override
             rg.Point3d.Unset,   # no end point override
-            rg.LoftType.Normal,
+            loft_type,
             is_closed           # closed loft for loop roads
         )
     except Exception as e:
@@ -1185,7 +2223,7 @@ def create_road_surface(sections, tolerance):
 # OUTPUT - ADD GEOMETRY TO RHINO DOCUMENT
 # =============================================================================
 
-def add_curve_to_layer(curve, layer_name, name=None):
+def add_curve_to_layer(curve, layer_name, name=None, attrs=None):
     """
     Adds a RhinoCommon curve to the Rhino document on the specified layer.
 
@@ -1195,6 +2233,9 @@ def add_curve_to_layer(curve, layer_name, name=None):
     layer_name : str
     name : str or None
         Optional object name.
+    attrs : Rhino.DocObjects.ObjectAttributes or None
+        Attributes already placed on the layer (see setup_output_layers),
+        named in place and reused instead of building new ones.
 
     Returns
     -------
@@ -1203,18 +2244,19 @@ def add_curve_to_layer(curve, layer_name, name=None):
     if curve is None or not curve.IsValid:
         return None
 
-    obj_id = sc.doc.Objects.AddCurve(curve)
+    if attrs is None:
+        attrs = layer_attributes(layer_name, name)
+    elif name:
+        attrs.Name = name
+
+    obj_id = sc.doc.Objects.AddCurve(curve, attrs)
     if obj_id == System.Guid.Empty:
         return None
 
-    add_object_to_layer(obj_id, layer_name)
-    if name:
-        rs.ObjectName(obj_id, name)
-
     return obj_id
 
 
-def add_brep_to_layer(brep, layer_name, name=None):
+def add_brep_to_layer(brep, layer_name, name=None, attrs=None):
     """
     Adds a RhinoCommon Brep to the Rhino document on the specified layer.
 
@@ -1223,6 +2265,8 @@ def add_brep_to_layer(brep, layer_name, name=None):
     brep : Rhino.Geometry.Brep
     layer_name : str
     name : str or None
+    attrs : Rhino.DocObjects.ObjectAttributes or None
+        As for add_curve_to_layer().
 
     Returns
     -------
@@ -1231,19 +2275,20 @@ def add_brep_to_layer(brep, layer_name, name=None):
     if brep is None or not brep.IsValid:
         return None
 
-    obj_id = sc.doc.Objects.AddBrep(brep)
+    if attrs is None:
+        attrs = layer_attributes(layer_name, name)
+    elif name:
+        attrs.Name = name
+
+    obj_id = sc.doc.Objects.AddBrep(brep, attrs)
     if obj_id == System.Guid.Empty:
         return None
 
-    add_object_to_layer(obj_id, layer_name)
-    if name:
-        rs.ObjectName(obj_id, name)
-
     return obj_id
 
 
 def publish_results(projected_centerline, road_surface, cross_sections,
-                    add_debug_sections):
+                    add_debug_sections, output_attrs=None):
     """
     Adds all output geometry to the Rhino document on their respective layers.
 
@@ -1254,6 +2299,9 @@ def publish_results(projected_centerline, road_surface, cross_sections,
     cross_sections : list of Rhino.Geometry.Curve
     add_debug_sections : bool
         If True, all cross-section curves are added to Roads_CrossSections.
+    output_attrs : dict or None
+        Object attributes per output layer name, as returned by
+        setup_output_layers(). Layers missing from it are looked up by name.
 
     Returns
     -------
@@ -1265,41 +2313,59 @@ def publish_results(projected_centerline, road_surface, cross_sections,
         'section_ids':   []
     }
 
-    # Published 3D centerline
-    cl_id = add_curve_to_layer(
-        projected_centerline, LAYER_ROAD_CENTERLINE, "Road_3D_Centerline"
-    )
-    ids['centerline_id'] = cl_id
-
-    if cl_id:
-        print("  Roads_Centerline: 3D centerline added.")
-    else:
-        print("  Warning: Could not add centerline to document.")
+    # Viewports are not redrawn while objects are added; the previous
+    # state is restored afterwards (undo recording stays on, so the run
+    # remains undoable)
+    output_attrs = output_attrs or {}
+    views = sc.doc.Views
+    prev_redraw = views.RedrawEnabled
+    views.RedrawEnabled = False
+    try:
+        # Published 3D centerline
+        cl_id = add_curve_to_layer(
+            projected_centerline, LAYER_ROAD_CENTERLINE, "Road_3D_Centerline",
+            output_attrs.get(LAYER_ROAD_CENTERLINE)
+        )
+        ids['centerline_id'] = cl_id
 
-    # Road surface
-    surf_id = add_brep_to_layer(
-        road_surface, LAYER_ROAD_SURFACE, "Road_Surface"
-    )
-    ids['surface_id'] = surf_id
+        if cl_id:
+            print("  Roads_Centerline: 3D centerline added.")
+        else:
+            print("  Warning: Could not add centerline to document.")
 
-    if surf_id:
-        print("  Roads_Projected: Road surface added.")
-    else:
-        print("  Warning: Could not add road surface to document.")
-
-    # Debug cross-sections
-    if add_debug_sections:
-        n_added = 0
-        for i, section in enumerate(cross_sections):
-            sec_id = add_curve_to_layer(
-                section, LAYER_ROAD_SECTIONS,
-                "CrossSection_{:04d}".format(i)
-            )
-            if sec_id:
-                ids['section_ids'].append(sec_id)
-                n_added += 1
+        # Road surface
+        surf_id = add_brep_to_layer(
+            road_surface, LAYER_ROAD_SURFACE, "Road_Surface",
+            output_attrs.get(LAYER_ROAD_SURFACE)
+        )
+        ids['surface_id'] = surf_id
 
-        print("  Roads_CrossSections: {} section(s) added.".format(n_added))
+        if surf_id:
+            print("  Roads_Projected: Road surface added.")
+        else:
+            print("  Warning: Could not add road surface to document.")
+
+        # Debug cross-sections. One attributes object (layer resolved once) is
+        # shared by every section; AddCurve copies it, so only the name is
+        # changed between calls.
+        if add_debug_sections:
+            n_added   = 0
+            attrs     = output_attrs.get(LAYER_ROAD_SECTIONS)
+            if attrs is None:
+                attrs = layer_attributes(LAYER_ROAD_SECTIONS)
+            add_curve = sc.doc.Objects.AddCurve
+            for i, section in enumerate(cross_sections):
+                if section is None or not section.IsValid:
+                    continue
+                attrs.Name = "CrossSection_{:04d}".format(i)
+                sec_id = add_curve(section, attrs)
+                if sec_id != System.Guid.Empty:
+                    ids['section_ids'].append(sec_id)
+                    n_added += 1
+
+            print("  Roads_CrossSections: {} section(s) added.".format(n_added))
+    finally:
+        views.RedrawEnabled = prev_redraw
 
     return ids
 
@@ -1309,7 +2375,7 @@ def publish_results(projected_centerline, road_surface, cross_sections,
 # =============================================================================
 
 def calculate_statistics(projected_curve, cross_sections, road_width,
-                          spacing, doc_units):
+                          spacing, doc_units, check_validity=False):
     """
     Computes road adaptation statistics for the console report.
 
@@ -1320,6 +2386,10 @@ def calculate_statistics(projected_curve, cross_sections, road_width,
     road_width : float
     spacing : float
     doc_units : str
+    check_validity : bool
+        Run IsValid on every section when counting valid ones (debug runs).
+        Otherwise every section is counted: generate_all_cross_sections()
+        only returns curves it built successfully.
 
     Returns
     -------
@@ -1349,10 +2419,12 @@ def calculate_statistics(projected_curve, cross_sections, road_width,
         stats['z_max']   = bbox.Max.Z
         stats['z_range'] = bbox.Max.Z - bbox.Min.Z
 
-    # Count valid sections
-    stats['valid_sections'] = sum(
-        1 for s in cross_sections if s is not None and s.IsValid
-    )
+    # Count valid sections in one plain loop (no generator frame per item)
+    n_valid = 0
+    for section in cross_sections:
+        if section is not None and (not check_validity or section.IsValid):
+            n_valid += 1
+    stats['valid_sections'] = n_valid
 
     # Estimated surface area: length × road width (approximate for flat)
     stats['surface_area_est'] = stats['length'] * road_width
@@ -1379,75 +2451,90 @@ def print_report(stats, terrain_name, road_name, params, output_ids):
     units = stats['doc_units']
     sep   = "=" * 60
 
-    print("\n" + sep)
-    print("Road Adaptation to Topography v1.0.0")
-    print(sep)
-
-    print("\nInput Analysis:")
-    print("  Terrain : {}".format(terrain_name))
-    print("  Road    : {}".format(road_name))
-    print("  Road width      : {:.2f} {}".format(params['road_width'], units))
-    print("  Sample spacing  : {:.2f} {}".format(params['spacing'], units))
-    print("  Height offset   : {:.2f} {}".format(params['height_offset'], units))
-    print("  Profile points  : {}".format(params['num_profile_points']))
-
-    print("\nProjection:")
-    print("  Centerline length  : {:.2f} {}".format(stats['length'], units))
-    print("  Z range            : {:.3f} to {:.3f} {} "
+    # The report is collected and written to the console in one print,
+    # rather than one console write (and repaint) per line
+    lines = []
+    out   = lines.append
+
+    out("\n" + sep)
+    out("Road Adaptation to Topography v1.0.0")
+    out(sep)
+
+    out("\nInput Analysis:")
+    out("  Terrain : {}".format(terrain_name))
+    out("  Road    : {}".format(road_name))
+    out("  Road width      : {:.2f} {}".format(params['road_width'], units))
+    out("  Sample spacing  : {:.2f} {}".format(params['spacing'], units))
+    out("  Height offset   : {:.2f} {}".format(params['height_offset'], units))
+    out("  Profile points  : {}".format(params['num_profile_points']))
+
+    out("\nProjection:")
+    out("  Centerline length  : {:.2f} {}".format(stats['length'], units))
+    out("  Z range            : {:.3f} to {:.3f} {} "
           "(elevation change: {:.3f} {})".format(
               stats['z_min'], stats['z_max'], units,
               stats['z_range'], units
           ))
 
-    print("\nCross-Sections:")
-    print("  Stations sampled   : {}".format(stats['section_count']))
-    print("  Sections generated : {}".format(stats['valid_sections']))
+    out("\nCross-Sections:")
+    out("  Stations sampled   : {}".format(stats['section_count']))
+    out("  Sections generated : {}".format(stats['valid_sections']))
     if stats['section_count'] > 0:
         pct = 100.0 * stats['valid_sections'] / stats['section_count']
-        print("  Success rate       : {:.1f}%".format(pct))
+        out("  Success rate       : {:.1f}%".format(pct))
 
-    print("\nLofting:")
+    out("\nLofting:")
     if output_ids['surface_id']:
-        print("  Road surface created: valid Brep / NURBS surface")
-        print("  Estimated road area : {:.1f} {}2".format(
+        out("  Road surface created: valid Brep / NURBS surface")
+        out("  Estimated road area : {:.1f} {}2".format(
             stats['surface_area_est'], units
         ))
     else:
-        print("  Road surface: FAILED (check cross-sections and terrain coverage)")
+        out("  Road surface: FAILED (check cross-sections and terrain coverage)")
 
-    print("\nLayers:")
+    out("\nLayers:")
     if output_ids['centerline_id']:
-        print("  [OK] {}".format(LAYER_ROAD_CENTERLINE))
+        out("  [OK] {}".format(LAYER_ROAD_CENTERLINE))
     else:
-        print("  [--] {} (not created)".format(LAYER_ROAD_CENTERLINE))
+        out("  [--] {} (not created)".format(LAYER_ROAD_CENTERLINE))
 
     if output_ids['surface_id']:
-        print("  [OK] {}".format(LAYER_ROAD_SURFACE))
+        out("  [OK] {}".format(LAYER_ROAD_SURFACE))
     else:
-        print("  [--] {} (not created)".format(LAYER_ROAD_SURFACE))
+        out("  [--] {} (not created)".format(LAYER_ROAD_SURFACE))
 
     if params['add_debug_sections']:
         n_secs = len(output_ids['section_ids'])
-        print("  [OK] {} ({} sections)".format(LAYER_ROAD_SECTIONS, n_secs))
+        out("  [OK] {} ({} sections)".format(LAYER_ROAD_SECTIONS, n_secs))
     else:
-        print("  [--] {} (disabled - set in options)".format(LAYER_ROAD_SECTIONS))
+        out("  [--] {} (disabled - set in options)".format(LAYER_ROAD_SECTIONS))
 
-    print("\nSummary:")
+    out("\nSummary:")
     if output_ids['surface_id']:
-        print("  Road surface successfully adapted to topography.")
-        print("  Use Ctrl+Z to undo all changes.")
+        out("  Road surface successfully adapted to topography.")
+        out("  Use Ctrl+Z to undo all changes.")
     else:
-        print("  Adaptation incomplete. Review warnings above.")
-        print("  Common causes: road extends beyond terrain boundary,")
-        print("  insufficient cross-section hits, or degenerate geometry.")
+        out("  Adaptation incomplete. Review warnings above.")
+        out("  Common causes: road extends beyond terrain boundary,")
+        out("  insufficient cross-section hits, or degenerate geometry.")
+
+    out(sep + "\n")
 
-    print(sep + "\n")
+    print("\n".join(lines))
 
 
 # =============================================================================
 # USER DIALOG - PARAMETER INPUT
 # =============================================================================
 
+def show_message(message, title):
+    """
+    Shows a modal message box with an OK button. Calls RhinoCommon's
+    dialog directly rather than through rs.MessageBox.
+    """
+    Rhino.UI.Dialogs.ShowMessage(message, title)
+
+
 def ask_layer_names():
     """
     Prompts the user for terrain and road layer names.
@@ -1586,6 +2673,9 @@ def validate_terrain(terrain_id):
 
     Checks geometry type support, bounding box validity, and non-zero
     XY extent. Returns (True, '') on success or (False, msg) on failure.
+    Empty geometry is rejected from its element count, and the bounding
+    box is the fast (unclipped, cached) one; nothing here walks the
+    geometry itself.
 
     Parameters
     ----------
@@ -1606,7 +2696,12 @@ def validate_terrain(terrain_id):
             "Use a surface, polysurface, or mesh.".format(type(geom).__name__)
         )
 
-    bbox = geom.GetBoundingBox(rg.Transform.Identity)
+    if isinstance(geom, rg.Mesh) and geom.Faces.Count == 0:
+        return False, "Terrain mesh has no faces."
+    if isinstance(geom, rg.Brep) and geom.Faces.Count == 0:
+        return False, "Terrain polysurface has no faces."
+
+    bbox = geom.GetBoundingBox(False)
     if not bbox.IsValid:
         return False, "Terrain has an invalid bounding box."
 
@@ -1622,6 +2717,9 @@ def validate_road_object(road_id):
     """
     Validates that the road object can produce a usable centerline.
 
+    A curve whose control-point bounding box is smaller than the tolerance
+    is rejected before the costlier validity and length checks.
+
     Parameters
     ----------
     road_id : System.Guid
@@ -1642,6 +2740,9 @@ def validate_road_object(road_id):
         )
 
     if isinstance(geom, rg.Curve):
+        bbox = geom.GetBoundingBox(False)
+        if not bbox.IsValid or bbox.Diagonal.Length < DEFAULT_TOLERANCE:
+            return False, "Road curve is zero-length."
         if not geom.IsValid:
             return False, "Road curve is invalid."
         if geom.GetLength() < DEFAULT_TOLERANCE:
@@ -1686,9 +2787,10 @@ def main():
     4.  Load road object from road layer (first object used)
     5.  Validate terrain and road geometry
     6.  Ask user for road parameters (width, spacing, profile, debug)
-    7.  Extract road centerline from input geometry
-    8.  Project centerline onto terrain (Brep or Mesh path)
-    9.  Sample projected centerline at regular intervals with terrain normals
+    7.  Extract road centerline and check the spacing against its length
+    8.  Load and prepare terrain geometry, then project the centerline
+        onto it (Brep or Mesh path)
+    9.  Sample projected centerline at regular intervals
     10. Generate cross-section curve at each station
     11. Unify cross-section directions to prevent loft twisting
     12. Loft cross-sections into continuous road surface Brep
@@ -1696,17 +2798,24 @@ def main():
     14. Calculate and print statistics report
     15. Redraw viewports
     """
-    print("\n" + "=" * 60)
-    print("  ROAD TOPOGRAPHY ADAPTER  v1.0.0")
-    print("=" * 60)
-    print("  Projects 2D road geometry onto 3D terrain surface")
-    print("  using Project Centerline -> Cross-Sections -> Loft.")
-    print("  Full undo support: Ctrl+Z to revert all changes.")
-    print("=" * 60)
+    print("\n".join([
+        "\n" + "=" * 60,
+        "  ROAD TOPOGRAPHY ADAPTER  v1.0.0",
+        "=" * 60,
+        "  Projects 2D road geometry onto 3D terrain surface",
+        "  using Project Centerline -> Cross-Sections -> Loft.",
+        "  Full undo support: Ctrl+Z to revert all changes.",
+        "=" * 60,
+    ]))
 
     # --- Document context ---
-    tolerance = sc.doc.ModelAbsoluteTolerance
-    doc_units = rs.UnitSystemName(abbreviate=True)
+    reset_layer_index_cache()
+    reset_terrain_name_cache()
+    # Document, tolerance and units are read once here and passed down as
+    # plain values
+    doc       = sc.doc
+    tolerance = doc.ModelAbsoluteTolerance
+    doc_units = doc.GetUnitSystemName(True, False, False, True)
     print("\nDocument: units={}, tolerance={}".format(doc_units, tolerance))
 
     # =========================================================================
@@ -1724,7 +2833,7 @@ def main():
     terrain_objects = get_objects_from_layer(terrain_layer)
 
     if not terrain_objects:
-        rs.MessageBox(
+        show_message(
             "No objects found on the '{}' layer.\n\n"
             "Place your terrain surface or mesh on that layer "
             "and run again.".format(terrain_layer),
@@ -1749,7 +2858,7 @@ def main():
     road_objects = get_objects_from_layer(road_layer)
 
     if not road_objects:
-        rs.MessageBox(
+        show_message(
             "No objects found on the '{}' layer.\n\n"
             "Place your road centerline curve or surface on that "
             "layer and run again.".format(road_layer),
@@ -1764,10 +2873,11 @@ def main():
             len(road_objects)
         ))
 
-    road_obj  = sc.doc.Objects.Find(road_id)
-    road_name = (rs.ObjectName(road_id) or "<unnamed>") + (
-        " ({})".format(type(road_obj.Geometry).__name__) if road_obj else ""
-    )
+    road_obj  = doc.Objects.Find(road_id)
+    road_name = "<unnamed>"
+    if road_obj is not None:
+        road_name = "{} ({})".format(road_obj.Attributes.Name or "<unnamed>",
+                                     type(road_obj.Geometry).__name__)
     print("  Road: {}".format(road_name))
 
     # =========================================================================
@@ -1777,7 +2887,7 @@ def main():
 
     t_valid, t_err = validate_terrain(terrain_id)
     if not t_valid:
-        rs.MessageBox(
+        show_message(
             "Terrain validation failed:\n\n{}".format(t_err),
             title="Road Adapter - Invalid Terrain"
         )
@@ -1786,7 +2896,7 @@ def main():
 
     r_valid, r_err = validate_road_object(road_id)
     if not r_valid:
-        rs.MessageBox(
+        show_message(
             "Road validation failed:\n\n{}".format(r_err),
             title="Road Adapter - Invalid Road"
         )
@@ -1810,26 +2920,21 @@ def main():
     num_pts         = params['num_profile_points']
     add_debug       = params['add_debug_sections']
 
-    print("\nParameters:")
-    print("  Road width      : {:.2f} {}".format(road_width, doc_units))
-    print("  Sample spacing  : {:.2f} {}".format(spacing, doc_units))
-    print("  Height offset   : {:.2f} {}".format(height_offset, doc_units))
-    print("  Profile points  : {}".format(num_pts))
-    print("  Debug sections  : {}".format("Yes" if add_debug else "No"))
-
-    # =========================================================================
-    # Step 6: Extract terrain geometry
-    # =========================================================================
-    print("\nLoading terrain geometry...")
-    terrain_geom, terrain_type = get_terrain_geometry(terrain_id)
-    if terrain_geom is None:
-        print("Aborted: Could not extract terrain geometry.")
-        return
-    print("  Terrain type: {}".format(terrain_type.upper()))
+    print("\n".join([
+        "\nParameters:",
+        "  Road width      : {:.2f} {}".format(road_width, doc_units),
+        "  Sample spacing  : {:.2f} {}".format(spacing, doc_units),
+        "  Height offset   : {:.2f} {}".format(height_offset, doc_units),
+        "  Profile points  : {}".format(num_pts),
+        "  Debug sections  : {}".format("Yes" if add_debug else "No"),
+    ]))
 
     # =========================================================================
-    # Step 7: Extract road centerline
+    # Step 6: Extract road centerline
     # =========================================================================
+    # Done before the terrain is loaded: it only reads the road, and the
+    # spacing check below must not wait for (or pay for) the terrain copy,
+    # face tree and height grid
     print("\nExtracting road centerline...")
     centerline = extract_centerline(road_id, tolerance)
     if centerline is None:
@@ -1842,7 +2947,7 @@ def main():
     # Warn if spacing produces fewer than 2 sections
     expected_sections = int(cl_length / spacing) + 1
     if expected_sections < MIN_SECTIONS_FOR_LOFT:
-        rs.MessageBox(
+        show_message(
             "The sample spacing ({:.2f}) is too large for the road length "
             "({:.2f}).\n\nExpected sections: {}\nMinimum required: {}\n\n"
             "Reduce the sample spacing or use a longer road.".format(
@@ -1853,33 +2958,50 @@ def main():
         print("Aborted: Spacing too large for road length.")
         return
 
+    # =========================================================================
+    # Step 7: Extract terrain geometry
+    # =========================================================================
+    print("\nLoading terrain geometry...")
+    terrain_geom, terrain_type = get_terrain_geometry(terrain_id)
+    if terrain_geom is None:
+        print("Aborted: Could not extract terrain geometry.")
+        return
+    print("  Terrain type: {}".format(terrain_type.upper()))
+    terrain = prepare_terrain(terrain_geom, terrain_type, tolerance)
+    if terrain['height_grid'] is not None:
+        print("  Height grid: {} x {} nodes (lookup instead of "
+              "ray-casting)".format(terrain['height_grid']['nx'],
+                                    terrain['height_grid']['ny']))
+
     # =========================================================================
     # Step 8: Open undo record and project centerline
     # =========================================================================
-    rs.UnselectAllObjects()
-    rs.EnableRedraw(False)
+    doc.Objects.UnselectAll()
+    doc.Views.RedrawEnabled = False
     undo_serial = begin_undo_record("AdaptRoadToTopography")
 
     try:
         print("\nProjection:")
         print("  Projecting centerline to terrain...")
         projected_cl = project_centerline_to_terrain(
-            centerline, terrain_geom, terrain_type, tolerance
+            centerline, terrain, tolerance, road_width
         )
 
         if projected_cl is None or not projected_cl.IsValid:
-            print("  Error: Projection failed. Possible causes:")
-            print("    - Road extends beyond terrain boundary")
-            print("    - Terrain does not cover the road's XY extent")
-            print("    - Projection direction (Z) does not intersect terrain")
-            rs.MessageBox(
+            print("\n".join([
+                "  Error: Projection failed. Possible causes:",
+                "    - Road extends beyond terrain boundary",
+                "    - Terrain does not cover the road's XY extent",
+                "    - Projection direction (Z) does not intersect terrain",
+            ]))
+            show_message(
                 "Centerline projection to terrain failed.\n\n"
                 "Ensure the terrain covers the full XY extent of the road.\n"
                 "Check that the road is drawn in plan view (XY plane).",
                 title="Road Adapter - Projection Failed"
             )
             end_undo_record(undo_serial)
-            rs.EnableRedraw(True)
+            doc.Views.RedrawEnabled = True
             return
 
         proj_length = projected_cl.GetLength()
@@ -1890,36 +3012,25 @@ def main():
         ))
 
         # =====================================================================
-        # Step 9: Sample projected centerline with terrain data
+        # Steps 9-10: Sample projected centerline and generate cross-sections
         # =====================================================================
-        print("\nSampling:")
-        stations = sample_curve_with_terrain_data(
-            projected_cl, terrain_geom, terrain_type, spacing, tolerance
+        print("\nCross-Sections:")
+        n_stations, sections = sample_and_section(
+            projected_cl, terrain, spacing, road_width, num_pts,
+            height_offset, tolerance
         )
 
-        if not stations:
+        if n_stations == 0:
             print("  Error: Sampling produced no valid stations.")
             end_undo_record(undo_serial)
-            rs.EnableRedraw(True)
+            doc.Views.RedrawEnabled = True
             return
 
-        print("  Stations created: {}".format(len(stations)))
-
-        # =====================================================================
-        # Step 10: Generate cross-sections
-        # =====================================================================
-        print("\nCross-Sections:")
-        sections = generate_all_cross_sections(
-            stations, road_width, num_pts,
-            terrain_geom, terrain_type,
-            height_offset, tolerance
-        )
-
         if len(sections) < MIN_SECTIONS_FOR_LOFT:
             print("  Error: Only {} valid section(s) generated. "
                   "Minimum is {}.".format(len(sections), MIN_SECTIONS_FOR_LOFT))
             end_undo_record(undo_serial)
-            rs.EnableRedraw(True)
+            doc.Views.RedrawEnabled = True
             return
 
         print("  Valid sections: {}".format(len(sections)))
@@ -1933,8 +3044,10 @@ def main():
         # Step 12: Loft road surface
         # =====================================================================
         print("\nLofting:")
-        print("  Creating road surface from {} sections...".format(len(sections)))
-        road_surface = create_road_surface(sections, tolerance)
+        print("  Creating road surface from {} sections{}...".format(
+            len(sections), " (fast, straight loft)" if FAST_LOFT else ""
+        ))
+        road_surface = create_road_surface(sections, tolerance, FAST_LOFT)
 
         if road_surface is None:
             print("  Error: Loft failed to produce a road surface.")
@@ -1947,17 +3060,18 @@ def main():
         # Step 13: Set up output layers and publish geometry
         # =====================================================================
         print("\nLayers:")
-        setup_output_layers()
+        output_attrs = setup_output_layers()
 
         output_ids = publish_results(
-            projected_cl, road_surface, sections, add_debug
+            projected_cl, road_surface, sections, add_debug, output_attrs
         )
 
         # =====================================================================
         # Step 14: Calculate and print statistics
         # =====================================================================
         stats = calculate_statistics(
-            projected_cl, sections, road_width, spacing, doc_units
+            projected_cl, sections, road_width, spacing, doc_units,
+            check_validity=add_debug
         )
 
         print_report(stats, terrain_name, road_name, params, output_ids)
@@ -1969,8 +3083,8 @@ def main():
 
     finally:
         end_undo_record(undo_serial)
-        rs.EnableRedraw(True)
-        sc.doc.Views.Redraw()
+        doc.Views.RedrawEnabled = True
+        doc.Views.Redraw()
 
 
 # =============================================================================